@@ -0,0 +1,103 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.api.v1.schemas.admin import (
+    CacheStats,
+    PlaybackBufferStats,
+    PoolTelemetry,
+    SingleFlightStats,
+    SlowQueryLogFetch,
+)
+from app.db.heartbeats import heartbeat_buffer
+from app.db.session.session import pool_telemetry
+from app.db.slow_queries import slow_query_log
+from app.services.auth.permissions_mixins import IsAdmin
+from app.services.cache.memory import caches
+from app.services.cache.single_flight import registry
+
+
+admin_router = APIRouter(
+    prefix="/admin", tags=["Admin"], dependencies=[Depends(IsAdmin())]
+)
+
+
+@admin_router.get("/db/pool/", response_model=PoolTelemetry)
+def get_pool_telemetry():
+    try:
+        return pool_telemetry()
+    except Exception as error:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error_type": error.__class__.__name__,
+                "error_message": str(error),
+            },
+        )
+
+
+@admin_router.get("/db/slow-queries/", response_model=SlowQueryLogFetch)
+def get_slow_queries(limit: int | None = None):
+    try:
+        return SlowQueryLogFetch(
+            threshold_ms=slow_query_log.threshold_ms,
+            explain_sample_rate=slow_query_log.explain_rate,
+            capacity=slow_query_log.entries.maxlen,
+            total_recorded=slow_query_log.total_recorded,
+            entries=slow_query_log.snapshot(limit),
+        )
+    except Exception as error:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error_type": error.__class__.__name__,
+                "error_message": str(error),
+            },
+        )
+
+
+@admin_router.delete("/db/slow-queries/", status_code=204)
+def clear_slow_queries():
+    slow_query_log.clear()
+
+
+@admin_router.get("/cache/", response_model=list[CacheStats])
+def get_cache_stats():
+    try:
+        return [cache.stats() for cache in caches]
+    except Exception as error:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error_type": error.__class__.__name__,
+                "error_message": str(error),
+            },
+        )
+
+
+@admin_router.get("/cache/single-flight/", response_model=list[SingleFlightStats])
+def get_single_flight_stats():
+    try:
+        return sorted(
+            (flight.stats() for flight in registry), key=lambda stats: stats["name"]
+        )
+    except Exception as error:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error_type": error.__class__.__name__,
+                "error_message": str(error),
+            },
+        )
+
+
+@admin_router.get("/playback/", response_model=PlaybackBufferStats)
+def get_playback_buffer_stats():
+    try:
+        return heartbeat_buffer.stats()
+    except Exception as error:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error_type": error.__class__.__name__,
+                "error_message": str(error),
+            },
+        )
@@ -27,14 +27,14 @@ from app.db.crud.assessments import (
     question_update,
     update_assessment,
 )
-from app.db.session.session import get_db
+from app.db.session.session import get_db, get_read_db
 
 
 assessments_router = APIRouter(prefix="/assessments", tags=["Assessments"])
 
 
 @assessments_router.get("/type/all/")
-def list_all_assessment_types(db: Annotated[Session, Depends(get_db)]):
+def list_all_assessment_types(db: Annotated[Session, Depends(get_read_db)]):
     try:
         return fetch_all_assessment_types(db)
     except ValidationError as error:
@@ -53,7 +53,7 @@ def list_all_assessment_types(db: Annotated[Session, Depends(get_db)]):
 
 
 @assessments_router.get("/type/get/{type_id}/")
-def get_assessment_by_id(type_id: int, db: Annotated[Session, Depends(get_db)]):
+def get_assessment_by_id(type_id: int, db: Annotated[Session, Depends(get_read_db)]):
     try:
         return fetch_assessment_type_by_id(type_id, db)
     except ValidationError as error:
@@ -93,7 +93,7 @@ def create_new_assessment(
 
 
 @assessments_router.get("/all/")
-def list_assessments(db: Annotated[Session, Depends(get_db)]):
+def list_assessments(db: Annotated[Session, Depends(get_read_db)]):
     try:
         return fetch_all_assessments(db)
     except ValidationError as error:
@@ -133,7 +133,9 @@ def create_new_assessment(
 
 
 @assessments_router.get("/{assessment_id}/get/")
-def fetch_assessment_by_id(assessment_id: int, db: Annotated[Session, Depends(get_db)]):
+def fetch_assessment_by_id(
+    assessment_id: int, db: Annotated[Session, Depends(get_read_db)]
+):
     try:
         return assessment_by_id(assessment_id, db)
     except ValidationError as error:
@@ -175,7 +177,9 @@ def assessment_update(
 
 
 @assessments_router.get("/{subject_id}/by_subject/")
-def get_assessment_by_subject(subject_id: int, db: Annotated[Session, Depends(get_db)]):
+def get_assessment_by_subject(
+    subject_id: int, db: Annotated[Session, Depends(get_read_db)]
+):
     try:
         return fetch_assessment_by_subject_id(subject_id, db)
     except ValidationError as error:
@@ -194,7 +198,7 @@ def get_assessment_by_subject(subject_id: int, db: Annotated[Session, Depends(ge
 
 
 @assessments_router.get("/question/all/")
-def get_all_questions(db: Annotated[Session, Depends(get_db)]):
+def get_all_questions(db: Annotated[Session, Depends(get_read_db)]):
     try:
         return fetch_question_list(db)
     except ValidationError as error:
@@ -257,7 +261,7 @@ def update_question(
 
 
 @assessments_router.get("/question/{question_id}/get/")
-def get_question_by_id(question_id: int, db: Annotated[Session, Depends(get_db)]):
+def get_question_by_id(question_id: int, db: Annotated[Session, Depends(get_read_db)]):
     try:
         return fetch_question_by_id(question_id, db)
     except ValidationError as error:
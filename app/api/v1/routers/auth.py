@@ -5,10 +5,9 @@ from fastapi.security import OAuth2PasswordRequestForm
 from jwt import ExpiredSignatureError, InvalidTokenError
 from sqlmodel import Session
 
-from app.api.v1.schemas.auth import Token, TokenRefreshData
+from app.api.v1.schemas.auth import Principal, Token, TokenRefreshData
 from app.api.v1.schemas.users import UserFetchSchema
 from app.db.crud.users import get_user_by_id, update_user_login
-from app.db.models.users import User
 from app.db.session.session import get_db
 from app.services.auth.authform import UserLoginForm
 from app.services.auth.core import (
@@ -100,7 +99,7 @@ def refresh(token_data: TokenRefreshData, db: Annotated[Session, Depends(get_db)
     "/me/", response_model=UserFetchSchema, dependencies=[Depends(get_current_user)]
 )
 def get_authenticate_user(
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_db)],
 ):
     try:
@@ -117,7 +116,7 @@ def get_authenticate_user(
     dependencies=[Depends(IsAdmin())],
 )
 def get_admin_authenticated_user(
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_db)],
 ):
     try:
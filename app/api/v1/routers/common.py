@@ -6,12 +6,15 @@ from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 from sqlmodel import Session
 
+from app.api.v1.schemas.auth import Principal
 from app.api.v1.schemas.common import (
     BaseCommonFetch,
     BaseCommonUpdate,
     UserContentCreate,
     UserContentFetch,
     UserContentStatusUpdate,
+    UserContentSync,
+    UserContentSyncResult,
     UserCourseCreate,
     UserCourseFetch,
     UserCourseStats,
@@ -20,6 +23,7 @@ from app.api.v1.schemas.common import (
     UserUnitCreate,
     UserUnitFetch,
     UserUnitStatusUpdate,
+    VideoHeartbeat,
 )
 from app.db.crud.common import (
     fetch_subject_status_by_course_id,
@@ -28,6 +32,7 @@ from app.db.crud.common import (
     user_content_create,
     user_content_fetch,
     user_content_status_update,
+    user_content_sync,
     user_course_create,
     user_course_fetch,
     user_course_fetch_by_id,
@@ -42,8 +47,8 @@ from app.db.crud.common import (
     user_unit_status_update,
     user_unit_update,
 )
-from app.db.models.users import User
-from app.db.session.session import get_db
+from app.db.heartbeats import heartbeat_buffer
+from app.db.session.session import get_db, get_read_db
 from app.services.auth.core import get_current_user
 
 
@@ -71,7 +76,7 @@ def create_user_course(
 @common_router.get(
     "/user-course/fetch/{user_id}/", response_model=list[UserCourseFetch]
 )
-def fetch_user_courses(user_id: int, db: Annotated[Session, Depends(get_db)]):
+def fetch_user_courses(user_id: int, db: Annotated[Session, Depends(get_read_db)]):
     try:
         user_course_data = user_course_fetch(user_id, db)
         return user_course_data
@@ -83,8 +88,8 @@ def fetch_user_courses(user_id: int, db: Annotated[Session, Depends(get_db)]):
 
 @common_router.get("/user-course/upcoming-subjects/")
 def fetch_upcoming_subjects(
-    user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    user: Annotated[Principal, Depends(get_current_user)],
+    db: Annotated[Session, Depends(get_read_db)],
 ):
     try:
         return fetch_user_upcoming_subjects(db, user.id)
@@ -102,7 +107,7 @@ def fetch_upcoming_subjects(
 def fetch_user_course_by_course_id(
     course_id: int,
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         return user_course_fetch_by_id(course_id, user, db)
@@ -119,7 +124,7 @@ def fetch_user_course_by_course_id(
 @common_router.get(
     "/user-course/fetch-user-stats/{user_id}/", response_model=UserCourseStats
 )
-def fetch_user_course_stats(user_id: int, db: Annotated[Session, Depends(get_db)]):
+def fetch_user_course_stats(user_id: int, db: Annotated[Session, Depends(get_read_db)]):
     try:
         return user_course_stats(user_id, db)
     except Exception as error:
@@ -149,7 +154,7 @@ def update_user_course(
 def course_user_subject_status(
     course_id: int,
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         return fetch_subject_status_by_course_id(course_id, user.id, db)
@@ -167,7 +172,7 @@ def course_user_subject_status(
 def create_user_subject(
     user_subject: UserSubjectCreate,
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         user_subject.user_id = user.id
@@ -180,7 +185,7 @@ def create_user_subject(
 @common_router.get(
     "/user-subject/fetch/{user_id}/", response_model=list[UserSubjectFetch]
 )
-def fetch_user_subject(user_id: int, db: Annotated[Session, Depends(get_db)]):
+def fetch_user_subject(user_id: int, db: Annotated[Session, Depends(get_read_db)]):
     try:
         user_subject_data = user_subject_fetch(user_id, db)
         return user_subject_data
@@ -192,7 +197,7 @@ def fetch_user_subject(user_id: int, db: Annotated[Session, Depends(get_db)]):
 def fetch_user_subject_status(
     subject_id: int,
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         return user_subject_fetch_by_subject(subject_id, user.id, db)
@@ -223,7 +228,7 @@ def update_user_subject(
 def create_user_unit(
     user_unit: UserUnitCreate,
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         user_unit.user_id = user.id
@@ -234,7 +239,7 @@ def create_user_unit(
 
 
 @common_router.get("/user-unit/fetch/{user_id}/", response_model=list[UserUnitFetch])
-def fetch_user_unit(user_id: int, db: Annotated[Session, Depends(get_db)]):
+def fetch_user_unit(user_id: int, db: Annotated[Session, Depends(get_read_db)]):
     try:
         user_unit_data = user_unit_fetch(user_id, db)
         return user_unit_data
@@ -245,7 +250,7 @@ def fetch_user_unit(user_id: int, db: Annotated[Session, Depends(get_db)]):
 @common_router.patch("/user-unit/status-update/")
 def update_user_unit_status(
     user_unit: UserUnitStatusUpdate,
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_db)],
 ):
     try:
@@ -281,7 +286,7 @@ def update_user_unit(
 def fetch_user_units_status(
     subject_id: int,
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         return fetch_user_units_by_subject(subject_id, user.id, db)
@@ -299,7 +304,7 @@ def fetch_user_units_status(
 def create_user_content(
     user_content: UserContentCreate,
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         user_content.user_id = user.id
@@ -315,7 +320,7 @@ def create_user_content(
 def update_user_content_status(
     user_content: UserContentStatusUpdate,
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         user_content.user_id = user.id
@@ -331,10 +336,47 @@ def update_user_content_status(
         )
 
 
+@common_router.post("/user-content/sync/", response_model=UserContentSyncResult)
+def sync_user_content(
+    user_content: UserContentSync,
+    db: Annotated[Session, Depends(get_db)],
+    user: Annotated[Principal, Depends(get_current_user)],
+):
+    try:
+        return user_content_sync(user.id, user_content.events, db)
+    except Exception as error:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error_type": error.__class__.__name__,
+                "error_message": str(error),
+            },
+        )
+
+
+@common_router.post("/user-content/heartbeat/", status_code=202)
+def record_video_heartbeat(
+    heartbeat: VideoHeartbeat,
+    user: Annotated[Principal, Depends(get_current_user)],
+):
+    # Buffered in this worker and written in bulk; see HeartbeatBuffer.
+    try:
+        heartbeat_buffer.add(user.id, heartbeat)
+        return {"status": "accepted"}
+    except Exception as error:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error_type": error.__class__.__name__,
+                "error_message": str(error),
+            },
+        )
+
+
 @common_router.get(
     "/user-content/fetch/{user_id}/", response_model=list[UserContentFetch]
 )
-def fetch_user_content(user_id: int, db: Annotated[Session, Depends(get_db)]):
+def fetch_user_content(user_id: int, db: Annotated[Session, Depends(get_read_db)]):
     try:
         return user_content_fetch(user_id, db)
     except Exception as error:
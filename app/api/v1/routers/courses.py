@@ -2,15 +2,26 @@ import json
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+)
 from fastapi.encoders import jsonable_encoder
 from fastapi.params import Query
 from pydantic import ValidationError
 from sqlalchemy.exc import NoResultFound
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette import status
 from starlette.responses import JSONResponse
 
+from app.api.v1.schemas.auth import Principal
 from app.api.v1.schemas.courses import (
     Base,
     BaseCourse,
@@ -31,12 +42,14 @@ from app.api.v1.schemas.courses import (
     UnitFetch,
     UnitUpdate,
 )
-from app.api.v1.schemas.extras import FilterParams
+from app.api.v1.schemas.extras import FilterParams, PaginatedResponse
 from app.db.crud.courses import (
     content_create,
+    content_detail_validator,
     content_update,
     course_category_create,
     course_create,
+    course_detail_validator,
     course_fetch_by_id,
     course_update,
     fetch_all_units,
@@ -52,14 +65,16 @@ from app.db.crud.courses import (
     list_all_courses,
     list_minimal_courses,
     subject_create,
+    subject_detail_validator,
     subject_fetch_by_id,
     subject_update,
     unit_create,
+    unit_detail_validator,
     unit_update,
 )
-from app.db.models.users import User
-from app.db.session.session import get_db
+from app.db.session.session import get_async_db, get_db, get_read_db
 from app.services.auth.core import get_current_user
+from app.services.utils.conditional import not_modified
 
 
 course_router = APIRouter(prefix="/courses", tags=["Courses"])
@@ -75,7 +90,8 @@ def create_category(data: Base, db: Annotated[Session, Depends(get_db)]):
 
 @course_router.get("/category/get/")
 def get_categories(
-    db: Annotated[Session, Depends(get_db)], params: Annotated[FilterParams, Query()]
+    db: Annotated[Session, Depends(get_read_db)],
+    params: Annotated[FilterParams, Query()],
 ):
     try:
         return get_all_categories(db, params=params)
@@ -85,8 +101,8 @@ def get_categories(
 
 @course_router.get("/get/latest-courses/", response_model=list[LatestCourseFetch])
 def get_latest_courses(
-    db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[Session, Depends(get_read_db)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         return fetch_latest_courses(db, user.id)
@@ -106,8 +122,9 @@ def get_latest_courses(
 
 
 @course_router.get("/get/all/")
-async def get_all_courses(
-    db: Annotated[Session, Depends(get_db)], params: Annotated[FilterParams, Query()]
+def get_all_courses(
+    db: Annotated[Session, Depends(get_read_db)],
+    params: Annotated[FilterParams, Query()],
 ):
     try:
         return list_all_courses(db, params=params)
@@ -127,7 +144,7 @@ async def get_all_courses(
 
 
 @course_router.get("/get/minimal/", response_model=list[BaseCourse])
-def get_minimal_courses(db: Annotated[Session, Depends(get_db)]):
+def get_minimal_courses(db: Annotated[Session, Depends(get_read_db)]):
     try:
         return list_minimal_courses(db)
     except Exception as e:
@@ -142,7 +159,7 @@ def get_minimal_courses(db: Annotated[Session, Depends(get_db)]):
 
 @course_router.post("/create/", response_model=CourseFetch)
 async def create_course(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     course: str = Form(...),
     file: UploadFile = File(None),
 ):
@@ -162,7 +179,7 @@ async def create_course(
 @course_router.patch("/{course_id}/update/", response_model=BaseCourse)
 async def update_course(
     course_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     course: str = Form(...),
     file: UploadFile = File(None),
 ):
@@ -185,8 +202,18 @@ async def update_course(
 
 
 @course_router.get("/get/{course_id}/")
-def get_course_by_id(course_id: int, db: Annotated[Session, Depends(get_db)]):
+def get_course_by_id(
+    course_id: int,
+    request: Request,
+    response: Response,
+    db: Annotated[Session, Depends(get_read_db)],
+):
     try:
+        unchanged = not_modified(
+            request, response, course_detail_validator(course_id, db)
+        )
+        if unchanged:
+            return unchanged
         return course_fetch_by_id(course_id, db)
     except NoResultFound:
         raise HTTPException(status_code=404, detail="Course not found")
@@ -231,9 +258,12 @@ def update_subject(
         )
 
 
-@course_router.get("/subject/get/all/", response_model=list[SubjectFetch])
+@course_router.get(
+    "/subject/get/all/",
+    response_model=list[SubjectFetch] | PaginatedResponse[SubjectFetch],
+)
 def list_all_subjects(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[Session, Depends(get_read_db)],
     params: Annotated[FilterParams, Query()] = None,
 ):
     try:
@@ -254,7 +284,9 @@ def list_all_subjects(
 
 
 @course_router.get("/subject/by_course/{course_id}/", response_model=list[SubjectFetch])
-def list_subjects_by_course(course_id: int, db: Annotated[Session, Depends(get_db)]):
+def list_subjects_by_course(
+    course_id: int, db: Annotated[Session, Depends(get_read_db)]
+):
     try:
         return fetch_subjects_by_courses(db, course_id)
     except Exception as error:
@@ -262,8 +294,18 @@ def list_subjects_by_course(course_id: int, db: Annotated[Session, Depends(get_d
 
 
 @course_router.get("/subject/get_by_id/{subject_id}/")
-def fetch_subject_by_id(subject_id: int, db: Annotated[Session, Depends(get_db)]):
+def fetch_subject_by_id(
+    subject_id: int,
+    request: Request,
+    response: Response,
+    db: Annotated[Session, Depends(get_read_db)],
+):
     try:
+        unchanged = not_modified(
+            request, response, subject_detail_validator(subject_id, db)
+        )
+        if unchanged:
+            return unchanged
         return subject_fetch_by_id(subject_id, db)
     except ValidationError as ve:
         return JSONResponse(
@@ -283,7 +325,7 @@ def fetch_subject_by_id(subject_id: int, db: Annotated[Session, Depends(get_db)]
 @course_router.get(
     "/subject/minimal/{course_id}", response_model=list[BaseSubjectFetch]
 )
-def list_subjects_minimal(course_id: int, db: Annotated[Session, Depends(get_db)]):
+def list_subjects_minimal(course_id: int, db: Annotated[Session, Depends(get_read_db)]):
     try:
         return fetch_subjects_minimal(db, course_id)
     except ValidationError as ve:
@@ -303,7 +345,8 @@ def list_subjects_minimal(course_id: int, db: Annotated[Session, Depends(get_db)
 
 @course_router.get("/unit/get/all/")
 def list_all_units(
-    db: Annotated[Session, Depends(get_db)], params: Annotated[FilterParams, Query()]
+    db: Annotated[Session, Depends(get_read_db)],
+    params: Annotated[FilterParams, Query()],
 ):
     try:
         return fetch_all_units(db, params=params)
@@ -357,7 +400,7 @@ def update_unit(
 
 
 @course_router.get("/unit/get_by_subject/{subject_id}/", response_model=list[UnitFetch])
-def get_units_by_subject(subject_id: int, db: Annotated[Session, Depends(get_db)]):
+def get_units_by_subject(subject_id: int, db: Annotated[Session, Depends(get_read_db)]):
     try:
         return fetch_units_by_subject(subject_id, db)
     except Exception as error:
@@ -365,7 +408,7 @@ def get_units_by_subject(subject_id: int, db: Annotated[Session, Depends(get_db)
 
 
 @course_router.get("/unit/minimal/", response_model=list[BaseUnit])
-def minimal_units(db: Annotated[Session, Depends(get_db)]):
+def minimal_units(db: Annotated[Session, Depends(get_read_db)]):
     try:
         return fetch_minimal_units(db)
     except ValidationError as ve:
@@ -384,8 +427,16 @@ def minimal_units(db: Annotated[Session, Depends(get_db)]):
 
 
 @course_router.get("/unit/{unit_id}/")
-def get_unit_by_id(unit_id: int, db: Annotated[Session, Depends(get_db)]):
+def get_unit_by_id(
+    unit_id: int,
+    request: Request,
+    response: Response,
+    db: Annotated[Session, Depends(get_read_db)],
+):
     try:
+        unchanged = not_modified(request, response, unit_detail_validator(unit_id, db))
+        if unchanged:
+            return unchanged
         return fetch_unit_by_id(unit_id, db)
     except ValidationError as ve:
         return JSONResponse(
@@ -405,7 +456,9 @@ def get_unit_by_id(unit_id: int, db: Annotated[Session, Depends(get_db)]):
 @course_router.get(
     "/unit/minimal/by_subject/{subject_id}/", response_model=list[BaseUnit]
 )
-def minimal_units_by_subject(subject_id: int, db: Annotated[Session, Depends(get_db)]):
+def minimal_units_by_subject(
+    subject_id: int, db: Annotated[Session, Depends(get_read_db)]
+):
     try:
         return fetch_minimal_units(db, subject_id)
     except ValidationError as ve:
@@ -425,7 +478,7 @@ def minimal_units_by_subject(subject_id: int, db: Annotated[Session, Depends(get
 
 @course_router.post("/content/create/")
 async def create_content(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     content: str = Form(...),
     file: UploadFile = File(None),
 ):
@@ -462,7 +515,7 @@ async def create_content(
 @course_router.patch("/content/{content_id}/update/", response_model=ContentFetch)
 async def update_content(
     content_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     content: str = Form(...),
     file: UploadFile = File(None),
 ):
@@ -488,7 +541,8 @@ async def update_content(
 
 @course_router.get("/content/fetch/all/")
 def fetch_all_contents(
-    db: Annotated[Session, Depends(get_db)], params: Annotated[FilterParams, Query()]
+    db: Annotated[Session, Depends(get_read_db)],
+    params: Annotated[FilterParams, Query()],
 ):
     try:
         return fetch_contents(db, params=params)
@@ -509,8 +563,18 @@ def fetch_all_contents(
 
 
 @course_router.get("/content/get/{content_id}/")
-def get_content_by_id(content_id: int, db: Annotated[Session, Depends(get_db)]):
+def get_content_by_id(
+    content_id: int,
+    request: Request,
+    response: Response,
+    db: Annotated[Session, Depends(get_read_db)],
+):
     try:
+        unchanged = not_modified(
+            request, response, content_detail_validator(content_id, db)
+        )
+        if unchanged:
+            return unchanged
         return fetch_content_by_id(content_id, db)
     except ValidationError as ve:
         return JSONResponse(
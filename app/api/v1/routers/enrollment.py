@@ -9,6 +9,7 @@ from sqlalchemy.exc import NoResultFound
 from sqlmodel import Session, select
 from starlette.responses import JSONResponse
 
+from app.api.v1.schemas.auth import Principal
 from app.api.v1.schemas.enrollment import (
     CourseEnrollmentCreate,
     CourseEnrollmentUpdate,
@@ -22,7 +23,6 @@ from app.db.crud.enrollment import (
 )
 from app.db.models.courses import Course
 from app.db.models.enrollment import CourseEnrollment
-from app.db.models.users import User
 from app.db.session.session import get_db
 from app.services.auth.core import get_current_user
 from app.services.enum.courses import PaymentStatus
@@ -175,7 +175,7 @@ async def stripe_payment_webhook(
 def user_enrollment_by_course_id(
     course_id: int,
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         return fetch_user_enrollments_by_course(user.id, course_id, db)
@@ -200,7 +200,7 @@ def user_enrollment_by_course_id(
 
 @enrollment_router.get("/user-enrolled-courses/")
 def fetch_enrolled_courses(
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
     db: Annotated[Session, Depends(get_db)],
 ):
     try:
@@ -6,6 +6,7 @@ from pydantic import ValidationError
 from sqlmodel import Session
 from starlette.responses import JSONResponse
 
+from app.api.v1.schemas.auth import Principal
 from app.api.v1.schemas.gamification import (
     AchievementCreate,
     AchievementUpdate,
@@ -26,8 +27,7 @@ from app.db.crud.gamification import (
     update_achievement_type,
     update_streak_type,
 )
-from app.db.models.users import User
-from app.db.session.session import get_db
+from app.db.session.session import get_db, get_read_db
 from app.services.auth.core import get_current_user
 from app.services.enum.extras import AchievementRuleSet
 
@@ -36,7 +36,7 @@ gamification_router = APIRouter(prefix="/gamification", tags=["Gamification"])
 
 
 @gamification_router.get("/streak-type/all/")
-def get_streak_type(db: Annotated[Session, Depends(get_db)]):
+def get_streak_type(db: Annotated[Session, Depends(get_read_db)]):
     try:
         return fetch_all_streak_types(db)
     except ValidationError as error:
@@ -120,7 +120,9 @@ def streak_type_delete(streak_type_id: int, db: Session = Depends(get_db)):
 
 
 @gamification_router.get("/streak-type/get/{streak_type_id}/")
-def streak_type_by_id(streak_type_id: int, db: Annotated[Session, Depends(get_db)]):
+def streak_type_by_id(
+    streak_type_id: int, db: Annotated[Session, Depends(get_read_db)]
+):
     try:
         return fetch_streak_type_by_id(streak_type_id, db)
     except ValidationError as error:
@@ -141,7 +143,7 @@ def streak_type_by_id(streak_type_id: int, db: Annotated[Session, Depends(get_db
 @gamification_router.post("/user-streak/create-update/")
 def user_streak_create_update(
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         return create_or_update_user_streak(user.id, db)
@@ -162,7 +164,7 @@ def user_streak_create_update(
 
 
 @gamification_router.get("/achievements/all")
-def list_all_achievements(db: Annotated[Session, Depends(get_db)]):
+def list_all_achievements(db: Annotated[Session, Depends(get_read_db)]):
     try:
         return fetch_all_achievements(db)
     except ValidationError as error:
@@ -182,7 +184,9 @@ def list_all_achievements(db: Annotated[Session, Depends(get_db)]):
 
 
 @gamification_router.get("/achievements/get/{achievement_id}")
-def achievement_by_id(achievement_id: int, db: Annotated[Session, Depends(get_db)]):
+def achievement_by_id(
+    achievement_id: int, db: Annotated[Session, Depends(get_read_db)]
+):
     try:
         return fetch_achievement_by_id(achievement_id, db)
     except ValidationError as error:
@@ -250,7 +254,7 @@ def update_achievement(
 @gamification_router.get("/all-user-achievements/")
 def fetch_user_achievements(
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         return fetch_all_user_achievements(user.id, db)
@@ -274,7 +278,7 @@ def fetch_user_achievements(
 def user_achievements_create_or_update(
     rule_type: AchievementRuleSet,
     db: Annotated[Session, Depends(get_db)],
-    user: Annotated[User, Depends(get_current_user)],
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     try:
         return check_and_create_user_achievements(rule_type, user.id, db)
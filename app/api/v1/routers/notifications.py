@@ -5,7 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
-from app.db.models.users import User
+from app.api.v1.schemas.auth import Principal
 from app.services.auth.core import get_current_user
 from app.services.utils.websocket_manager import WebSocketManager
 
@@ -16,7 +16,9 @@ socket_manager = WebSocketManager()
 
 @notification_router.websocket("/ws/{room_id}/")
 async def notification_websocket(
-    websocket: WebSocket, room_id: str, user: Annotated[User, Depends(get_current_user)]
+    websocket: WebSocket,
+    room_id: str,
+    user: Annotated[Principal, Depends(get_current_user)],
 ):
     message = {
         "user_id": user.id,
@@ -2,13 +2,24 @@ import json
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
 from fastapi.encoders import jsonable_encoder
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.responses import JSONResponse
 
+from app.api.v1.schemas.extras import FilterParams, PaginatedResponse
 from app.api.v1.schemas.users import (
     MinimalUserFetch,
     StudentFetchSchema,
@@ -25,7 +36,7 @@ from app.db.crud.users import (
     get_user_stats,
     update_user,
 )
-from app.db.session.session import get_db
+from app.db.session.session import get_async_db, get_db, get_read_db
 from app.services.auth.permissions_mixins import IsAdmin, IsAuthenticated
 from app.services.enum.users import UserRole
 
@@ -37,7 +48,7 @@ user_router = APIRouter(
 
 @user_router.post("/create/", response_model=UserFetchSchema)
 async def user_create(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     user: str = Form(...),
     file: UploadFile = File(None),
 ):
@@ -58,7 +69,7 @@ async def user_create(
 @user_router.patch("/{user_id}/update/")
 async def user_update(
     user_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     user: str = Form(...),
     file: UploadFile = File(None),
 ):
@@ -83,7 +94,7 @@ async def user_update(
 
 
 @user_router.get("/{user_id}/")
-async def get_user_by_id(user_id: int, db: Annotated[Session, Depends(get_db)]):
+def get_user_by_id(user_id: int, db: Annotated[Session, Depends(get_db)]):
     try:
         return fetch_user_by_id(user_id, db)
     except ValidationError as ve:
@@ -103,11 +114,14 @@ async def get_user_by_id(user_id: int, db: Annotated[Session, Depends(get_db)]):
 
 @user_router.get(
     "/get/students/",
-    response_model=list[StudentFetchSchema],
+    response_model=list[StudentFetchSchema] | PaginatedResponse[StudentFetchSchema],
 )
-def fetch_students(db: Annotated[Session, Depends(get_db)]):
+def fetch_students(
+    db: Annotated[Session, Depends(get_read_db)],
+    params: Annotated[FilterParams, Query()],
+):
     try:
-        return get_students_list(db)
+        return get_students_list(db, params=params)
     except Exception as error:
         raise HTTPException(status_code=500, detail=str(error))
     # return get_students_list(db)
@@ -118,7 +132,7 @@ def fetch_students(db: Annotated[Session, Depends(get_db)]):
     response_model=list[UserFetchSchema],
     dependencies=[Depends(IsAuthenticated), Depends(IsAdmin)],
 )
-def fetch_teachers(db: Annotated[Session, Depends(get_db)]):
+def fetch_teachers(db: Annotated[Session, Depends(get_read_db)]):
     try:
         return get_user_list_by_role(UserRole.TUTOR, db)
     except Exception as error:
@@ -129,7 +143,7 @@ def fetch_teachers(db: Annotated[Session, Depends(get_db)]):
     "/tutors/get/minimal/",
     response_model=list[MinimalUserFetch],
 )
-def fetch_minimal_tutors_list(db: Annotated[Session, Depends(get_db)]):
+def fetch_minimal_tutors_list(db: Annotated[Session, Depends(get_read_db)]):
     try:
         return get_minimal_user_list(db)
     except Exception as error:
@@ -137,7 +151,7 @@ def fetch_minimal_tutors_list(db: Annotated[Session, Depends(get_db)]):
 
 
 @user_router.get("/students/get/user-stats/")
-def user_stats(db: Annotated[Session, Depends(get_db)]):
+def user_stats(db: Annotated[Session, Depends(get_read_db)]):
     try:
         return get_user_stats(UserRole.STUDENT, db)
     except Exception as error:
@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class PoolStatus(BaseModel):
+    name: str
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+    checked_out: int
+    idle: int
+    overflow: int
+    capacity: int
+    connects: int
+    checkouts: int
+    checkins: int
+    invalidations: int
+    timeouts: int
+    wait_time_avg_ms: float
+    wait_time_max_ms: float
+
+
+class ReplicaStatus(BaseModel):
+    url: str
+    lag_seconds: float | None
+    max_lag_seconds: float
+
+
+class PoolTelemetry(BaseModel):
+    pid: int
+    workers: int
+    max_connections_per_worker: int
+    max_connections_per_host: int
+    pools: list[PoolStatus]
+    replicas: list[ReplicaStatus] = []
+
+
+class SlowQuery(BaseModel):
+    recorded_at: datetime
+    duration_ms: float
+    route: str | None
+    database: str | None
+    statement: str
+    parameters: str
+    plan: Any = None
+
+
+class SlowQueryLogFetch(BaseModel):
+    threshold_ms: float
+    explain_sample_rate: float
+    capacity: int
+    total_recorded: int
+    entries: list[SlowQuery]
+
+
+class CacheStats(BaseModel):
+    name: str
+    backend: str
+    ttl: float
+    hits: int
+    misses: int
+    waits: int
+    coalesced: int
+    entries: int | None = None
+    max_entries: int | None = None
+    evictions: int | None = None
+    expirations: int | None = None
+    errors: int | None = None
+    bytes: int | None = None
+
+
+class SingleFlightStats(BaseModel):
+    name: str
+    executions: int
+    coalesced: int
+    in_flight: int
+
+
+class PlaybackBufferStats(BaseModel):
+    pending: int
+    received: int
+    flushed: int
+    completed: int
+    dropped: int
+    errors: int
+    flush_interval: float
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from app.services.enum.users import UserRole
 
 
 class Token(BaseModel):
@@ -16,6 +18,17 @@ class TokenData(BaseModel):
     scopes: list[str] = []
 
 
+class Principal(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    username: str
+    is_active: bool
+    is_superuser: bool
+    is_admin: bool | None = None
+    role: UserRole | None = None
+
+
 class Login(BaseModel):
     username: str
     password: str
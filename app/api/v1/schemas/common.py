@@ -12,7 +12,11 @@ from app.api.v1.schemas.courses import (
 )
 from app.db.models.courses import Contents, Course, Subject, Unit
 from app.db.models.users import User
-from app.services.enum.courses import CompletionStatusEnum
+from app.services.enum.courses import (
+    CompletionStatusEnum,
+    ProgressEventAction,
+    ProgressEventResult,
+)
 from app.services.utils.crud_utils import get_model_instance_by_id
 
 
@@ -176,3 +180,49 @@ class UserContentStatus(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class UserContentEvent(BaseModel):
+    content_id: int
+    action: ProgressEventAction
+    occurred_at: datetime
+
+    @field_validator("occurred_at", mode="after")
+    @classmethod
+    def validate_occurred_at(cls, value):
+        # Stored like datetime.now(): naive local time, and a client clock
+        # running ahead must not date progress in the future.
+        if value.tzinfo is not None:
+            value = value.astimezone().replace(tzinfo=None)
+        return min(value, datetime.now())
+
+
+class UserContentSync(BaseModel):
+    events: list[UserContentEvent] = Field(min_length=1, max_length=500)
+
+
+class UserContentEventResult(BaseModel):
+    content_id: int
+    action: ProgressEventAction
+    result: ProgressEventResult
+
+
+class UserContentSyncResult(BaseModel):
+    results: list[UserContentEventResult]
+    completed_courses: list[int] = []
+
+
+class VideoHeartbeat(BaseModel):
+    content_id: int
+    position_seconds: float = Field(ge=0)
+    duration_seconds: float = Field(gt=0)
+    elapsed_seconds: float = Field(ge=0)
+
+
+class PlaybackProgress(BaseModel):
+    user_id: int
+    content_id: int
+    position_seconds: float
+    watched_seconds: float
+    duration_seconds: float
+    started_at: datetime
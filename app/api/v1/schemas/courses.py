@@ -64,7 +64,7 @@ class LatestCourseFetch(BaseModel):
     instructor_name: str
     image_url: str | None
     student_count: int | None
-    course_rating: int | None
+    course_rating: float | None
 
 
 class CourseDetailFetch(CourseFetch):
@@ -207,6 +207,7 @@ class VideoTimeStamp(BaseModel):
 
 class ContentCreate(Base):
     completion_time: int = Field(ge=0)
+    duration_seconds: int | None = Field(default=None, gt=0)
     order: int
     description: str | None
     content_type: ContentTypeEnum
@@ -217,6 +218,7 @@ class ContentCreate(Base):
 
 class ContentFetch(BaseContent):
     completion_time: int
+    duration_seconds: int | None = None
     order: int | None
     description: str | None = None
     content_type: ContentTypeEnum
@@ -240,6 +242,7 @@ class VideoTimeStamps(BaseModel):
 
 class ContentUpdate(BaseModel):
     completion_time: int | None = None
+    duration_seconds: int | None = Field(default=None, gt=0)
     unit_id: int | None = None
     title: str | None = None
     order: int | None = None
@@ -1,7 +1,35 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from app.services.enum.extras import CountStrategy
+from app.services.utils.cursors import decode_cursor
 
 
 class FilterParams(BaseModel):
     limit: int | None = Field(ge=0, le=100, default=None)
     offset: int | None = Field(default=None, ge=0)
     page: int | None = Field(default=None, ge=0)
+    cursor: str | None = None
+    count: CountStrategy = CountStrategy.EXACT
+
+    @field_validator("cursor", mode="after")
+    @classmethod
+    def validate_cursor(cls, value):
+        # Rejected here, a malformed cursor is a 422 like any other bad query.
+        if value:
+            decode_cursor(value)
+        return value
+
+    @property
+    def is_paginated(self) -> bool:
+        # An empty cursor asks for the first page in keyset mode.
+        if self.cursor is not None:
+            return bool(self.limit)
+        return bool(self.limit) and self.offset is not None
+
+
+class PaginatedResponse[T](BaseModel):
+    data: list[T]
+    total_pages: int | None = None
+    current_page: int | None = None
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
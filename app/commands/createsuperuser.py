@@ -1,7 +1,7 @@
 from datetime import date
 
 from app.db.models.users import Profile, User
-from app.db.session.session import get_db
+from app.db.session.session import session_scope
 from app.services.auth.hash import get_password_hash
 from app.services.enum.users import UserGender
 from app.services.utils.validator import validate_email
@@ -28,14 +28,14 @@ def create_superuser():
         email=email,
         is_superuser=True,
     )
-    session = next(get_db())
-    session.add(user)
-    session.flush()
-    user_profile = Profile(
-        user_id=user.id, name=name, dob=date(1999, 1, 1), gender=UserGender.MALE
-    )
-    session.add(user_profile)
-    session.commit()
+    with session_scope() as session:
+        session.add(user)
+        session.flush()
+        user_profile = Profile(
+            user_id=user.id, name=name, dob=date(1999, 1, 1), gender=UserGender.MALE
+        )
+        session.add(user_profile)
+        session.commit()
 
     print(f"Superuser created with username: {user.username}")
 
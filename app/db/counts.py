@@ -0,0 +1,127 @@
+import hashlib
+import json
+import logging
+
+from sqlalchemy import Table, event, inspect, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.util import find_tables
+from sqlmodel import func, select
+
+from app.db.session.routing import primary_reads
+from app.services.cache.memory import count_cache
+from app.services.enum.extras import CountStrategy
+
+
+WRITTEN_TABLES = "written_tables"
+
+logger = logging.getLogger(__name__)
+
+
+def _table_names(statement) -> list[str]:
+    tables = find_tables(statement, check_columns=True, include_joins=True)
+    return sorted({table.name for table in tables if isinstance(table, Table)})
+
+
+def exact_count(statement, db: Session) -> int:
+    """COUNT(*) of the statement, cached until a write to one of its tables.
+
+    The key carries the version of every table the statement reads, and
+    commits bump the versions of the tables they wrote, so a cached total
+    never outlives the rows it counted in this process.
+    """
+    count_statement = select(func.count()).select_from(statement.subquery())
+    if not count_cache.ttl:
+        return db.exec(count_statement).one()
+    compiled = count_statement.compile()
+    digest = hashlib.sha256(
+        f"{compiled.string}{sorted(compiled.params.items(), key=str)}".encode()
+    ).hexdigest()
+    versions = ".".join(
+        str(count_cache.version(name)) for name in _table_names(statement)
+    )
+
+    def fill():
+        with primary_reads(db):
+            return db.exec(count_statement).one()
+
+    return count_cache.get_or_set(f"count:{digest}:{versions}", fill)
+
+
+def estimated_count(statement, db: Session) -> int | None:
+    """Planner row estimate on PostgreSQL, or None where there is none."""
+    connection = db.connection()
+    if connection.dialect.name != "postgresql":
+        return None
+    froms = statement.get_final_froms()
+    if (
+        statement.whereclause is None
+        and not statement._group_by_clauses
+        and len(froms) == 1
+        and isinstance(froms[0], Table)
+    ):
+        reltuples = connection.execute(
+            text(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:name AS regclass)"
+            ),
+            {"name": froms[0].name},
+        ).scalar()
+        # -1 until the table has been vacuumed or analyzed.
+        if reltuples is not None and reltuples >= 0:
+            return reltuples
+    try:
+        sql = statement.compile(
+            dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+        ).string
+        with connection.begin_nested():
+            plan = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + sql).scalar()
+    except Exception as error:
+        logger.warning(f"Row estimate failed: {error}")
+        return None
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_rows(statement, strategy: CountStrategy, db: Session) -> int | None:
+    if strategy == CountStrategy.NONE:
+        return None
+    if strategy == CountStrategy.ESTIMATED:
+        estimate = estimated_count(statement, db)
+        if estimate is not None:
+            return estimate
+    return exact_count(statement, db)
+
+
+def after_flush(session, flush_context):
+    tables = session.info.setdefault(WRITTEN_TABLES, set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        tables.update(table.name for table in inspect(instance).mapper.tables)
+
+
+def do_orm_execute(orm_execute_state):
+    # Bulk INSERT/UPDATE/DELETE statements bypass the flush.
+    state = orm_execute_state
+    if state.is_insert or state.is_update or state.is_delete:
+        tables = state.session.info.setdefault(WRITTEN_TABLES, set())
+        tables.add(state.statement.table.name)
+
+
+def after_commit(session):
+    tables = session.info.pop(WRITTEN_TABLES, None)
+    if tables:
+        count_cache.bump(*tables)
+
+
+def after_rollback(session):
+    session.info.pop(WRITTEN_TABLES, None)
+
+
+def setup_count_cache():
+    """Bump table versions in the count cache whenever a session commits writes."""
+    for name, listener in (
+        ("after_flush", after_flush),
+        ("do_orm_execute", do_orm_execute),
+        ("after_commit", after_commit),
+        ("after_rollback", after_rollback),
+    ):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
@@ -18,6 +18,7 @@ from app.api.v1.schemas.assessments import (
 from app.api.v1.schemas.courses import BaseCourse, BaseSubjectFetch
 from app.db.models.assessments import Assessment, AssessmentType, Options, Question
 from app.db.models.courses import Course, Subject
+from app.services.cache.memory import cached, reference_cache
 from app.services.utils.crud_utils import update_model_instance
 
 
@@ -28,6 +29,7 @@ def create_assessment_type(assessment_type: AssessmentTypeCreate, db: Session):
         db.add(assessment_instance)
         db.commit()
         db.refresh(assessment_instance)
+        reference_cache.invalidate("assessment_types")
         return assessment_instance
     except Exception as e:
         db.rollback()
@@ -51,12 +53,14 @@ def update_assessment_type(
         db.add(updated_assessment_instance)
         db.commit()
         db.refresh(updated_assessment_instance)
+        reference_cache.invalidate("assessment_types")
         return updated_assessment_instance
     except Exception as e:
         db.rollback()
         raise e
 
 
+@cached("assessment_types")
 def fetch_all_assessment_types(db: Session):
     try:
         statement = select(AssessmentType)
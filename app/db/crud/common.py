@@ -1,25 +1,27 @@
+from collections.abc import Iterable
 from datetime import datetime
 
 from fastapi import HTTPException
+from sqlalchemy import bindparam, case, tuple_, update
 from sqlalchemy.exc import IntegrityError, NoResultFound
-from sqlalchemy.orm import (
-    contains_eager,
-    joinedload,
-    selectinload,
-    with_loader_criteria,
-)
+from sqlalchemy.orm import aliased, contains_eager, joinedload, selectinload
 from sqlalchemy.types import Integer
-from sqlmodel import Session, and_, asc, case, func, select
+from sqlmodel import Session, and_, asc, func, or_, select
 from sqlmodel.sql import expression
 
+from app.api.v1.schemas.auth import Principal
 from app.api.v1.schemas.common import (
     BaseCommonFetch,
     BaseCommonUpdate,
+    PlaybackProgress,
     UpcomingCourseSubjects,
     UserContentCreate,
+    UserContentEvent,
+    UserContentEventResult,
     UserContentFetch,
     UserContentStatus,
     UserContentStatusUpdate,
+    UserContentSyncResult,
     UserCourseCreate,
     UserCourseFetch,
     UserCourseStats,
@@ -33,12 +35,36 @@ from app.api.v1.schemas.common import (
     UserUnitStatusUpdate,
 )
 from app.api.v1.schemas.courses import BaseSubjectFetch, SubjectFetch, UserUnitDetail
-from app.db.models.common import UserContent, UserCourse, UserSubject, UserUnit
+from app.db.crud.progress import (
+    record_subjects_completed,
+    record_units_completed,
+    subject_progress,
+)
+from app.db.crud.snapshots import get_course_snapshot, published
+from app.db.models.common import (
+    UserContent,
+    UserCourse,
+    UserCourseProgress,
+    UserSubject,
+    UserSubjectProgress,
+    UserUnit,
+)
 from app.db.models.courses import Contents, Course, Subject, Unit
 from app.db.models.enrollment import CourseEnrollment
 from app.db.models.users import User
-from app.services.enum.courses import CompletionStatusEnum, StatusEnum
-from app.services.utils.crud_utils import create_model_instance, update_model_instance
+from app.services.enum.courses import (
+    CompletionStatusEnum,
+    ContentTypeEnum,
+    PaymentStatus,
+    ProgressEventAction,
+    ProgressEventResult,
+    StatusEnum,
+)
+from app.services.utils.crud_utils import (
+    create_model_instance,
+    dialect_insert,
+    update_model_instance,
+)
 
 
 def user_course_create(user_course: UserCourseCreate, db: Session) -> UserCourseFetch:
@@ -115,45 +141,6 @@ def user_course_fetch(user_id: int, db: Session) -> list[UserCourseFetch]:
     ]
 
 
-def get_subject_detail_with_unit_counts(course_id: int, user_id: int, db: Session):
-    total_unit_counts = func.count(Unit.id).label("total_units")
-    completed_unit_counts = func.count(
-        case((UserUnit.status == CompletionStatusEnum.COMPLETED, 1), else_=None)
-    ).label("completed_units")
-    statement = (
-        select(
-            Subject.id,
-            Subject.title,
-            total_unit_counts,
-            completed_unit_counts,
-        )
-        .join(Unit, Unit.subject_id == Subject.id, isouter=True)
-        .join(
-            UserUnit,
-            (UserUnit.user_id == user_id) & (UserUnit.unit_id == Unit.id),
-            isouter=True,
-        )
-        .where(Subject.course_id == course_id)
-        .group_by(Subject.id, Subject.title)
-    )
-    return db.exec(statement).all()
-
-
-def get_unit_details(subject_id: int, user_id: int, db: Session):
-    unit_completed_statement = case(
-        (UserUnit.status == CompletionStatusEnum.COMPLETED, True), else_=False
-    ).label("is_completed")
-    statement = (
-        select(Unit.id, unit_completed_statement)
-        .outerjoin(
-            UserUnit, and_(UserUnit.unit_id == Unit.id, UserUnit.user_id == user_id)
-        )
-        .where(Unit.subject_id == subject_id)
-        .group_by(Unit.id, UserUnit.status)
-    )
-    return db.exec(statement).all()
-
-
 def fetch_subject_status_by_course_id(course_id: int, user_id: int, db: Session):
     course = db.get(Course, course_id)
     if not course:
@@ -175,22 +162,12 @@ def fetch_subject_status_by_course_id(course_id: int, user_id: int, db: Session)
 
 
 def user_course_fetch_by_id(
-    course_id: int, user: User, db: Session
+    course_id: int, user: Principal, db: Session
 ) -> UserCourseFetch | None:
-    user_course = db.get(Course, course_id)
-    if not user_course:
+    snapshot = get_course_snapshot(course_id, db)
+    if not snapshot:
         raise NoResultFound(f"Course with id {course_id} not found")
     user_id = user.id
-    subject_details = {
-        subject.id: subject
-        for subject in get_subject_detail_with_unit_counts(course_id, user_id, db)
-    }
-
-    units_details = {
-        unit.id: unit
-        for subject in subject_details.keys()
-        for unit in get_unit_details(subject, user_id, db)
-    }
     subject_subquery = (
         (
             select(Subject.title).join(
@@ -212,31 +189,46 @@ def user_course_fetch_by_id(
         .scalar_subquery()
     )
     main_statement = (
-        select(
-            UserCourse,
-            func.count(Subject.id).label("total_subjects"),
-            func.count(Subject.id)
-            .filter(UserSubject.status == CompletionStatusEnum.COMPLETED)
-            .label("completed_counts"),
-            subject_subquery.label("next_subject"),
+        select(UserCourse, UserCourseProgress, subject_subquery.label("next_subject"))
+        .join(
+            UserCourseProgress,
+            and_(
+                UserCourseProgress.user_id == UserCourse.user_id,
+                UserCourseProgress.course_id == UserCourse.course_id,
+            ),
+            isouter=True,
         )
-        .join(Course, Course.id == UserCourse.course_id)
-        .join(Subject, Subject.course_id == Course.id)
-        .outerjoin(UserSubject, Subject.id == UserSubject.subject_id)
         .options(
             selectinload(UserCourse.user).selectinload(User.profile),
-            selectinload(UserCourse.course)
-            .selectinload(Course.subjects)
-            .selectinload(Subject.units),
-            with_loader_criteria(Subject, Subject.status == StatusEnum.PUBLISHED),
+            selectinload(UserCourse.course),
         )
         .where(UserCourse.user_id == user_id, UserCourse.course_id == course_id)
-        .group_by(UserCourse.user_id, UserCourse.course_id)
     )
     user_course_exc = db.exec(main_statement).first()
     if not user_course_exc:
         return None
-    user_course, total_subjects, completed_counts, next_subject = user_course_exc
+    user_course, progress, next_subject = user_course_exc
+    subjects = published(snapshot["subjects"])
+    completed_units = set(
+        db.exec(
+            select(UserUnit.unit_id).where(
+                UserUnit.user_id == user_id,
+                UserUnit.status == CompletionStatusEnum.COMPLETED,
+                UserUnit.unit_id.in_(
+                    [unit["id"] for subject in subjects for unit in subject["units"]]
+                ),
+            )
+        ).all()
+    )
+    if progress is None:
+        progress = UserCourseProgress(
+            user_id=user_id, course_id=course_id, total_subjects=len(subjects)
+        )
+    subjects_progress = subject_progress(
+        user_id,
+        {subject["id"]: len(published(subject["units"])) for subject in subjects},
+        db,
+    )
     return UserCourseFetch(
         user_name=(user_course.user.profile.name if user_course.user.profile else None),
         course=user_course.course,
@@ -245,51 +237,45 @@ def user_course_fetch_by_id(
         started_at=user_course.started_at,
         completed_at=user_course.completed_at,
         completion_percent=(
-            round((completed_counts / total_subjects) * 100, 2) if total_subjects else 0
+            round((progress.completed_subjects / progress.total_subjects) * 100, 2)
+            if progress.total_subjects
+            else 0
         ),
         next_subject=next_subject,
-        total_subjects=total_subjects,
-        completed_subjects=completed_counts,
+        total_subjects=progress.total_subjects,
+        completed_subjects=progress.completed_subjects,
         subjects=[
-            SubjectFetch(
-                id=subject.id,
-                title=subject.title,
-                completion_time=subject.completion_time,
-                order=subject.order,
-                units=[
-                    UserUnitDetail(
-                        id=unit.id,
-                        title=unit.title,
-                        is_completed=units_details.get(unit.id).is_completed,
-                    )
-                    for unit in subject.units
-                ],
-                total_units=(
-                    subject_details.get(subject.id).total_units
-                    if subject_details.get(subject.id)
-                    else 0
-                ),
-                completed_units=(
-                    subject_details.get(subject.id).completed_units
-                    if subject_details.get(subject.id)
-                    else 0
-                ),
-                completion_percent=(
-                    (
-                        subject_details.get(subject.id).completed_units
-                        / subject_details.get(subject.id).total_units
-                    )
-                    * 100
-                    if (
-                        subject_details.get(subject.id)
-                        and subject_details.get(subject.id).total_units
-                        and subject_details.get(subject.id).completed_units
-                    )
-                    else 0
-                ),
+            _user_subject_progress(
+                subject, completed_units, subjects_progress[subject["id"]]
+            )
+            for subject in subjects
+        ],
+    )
+
+
+def _user_subject_progress(
+    subject: dict, completed_units: set[int], progress: UserSubjectProgress
+) -> SubjectFetch:
+    return SubjectFetch(
+        id=subject["id"],
+        title=subject["title"],
+        completion_time=subject["completion_time"],
+        order=subject["order"],
+        units=[
+            UserUnitDetail(
+                id=unit["id"],
+                title=unit["title"],
+                is_completed=unit["id"] in completed_units,
             )
-            for subject in user_course.course.subjects
+            for unit in subject["units"]
         ],
+        total_units=progress.total_units,
+        completed_units=progress.completed_units,
+        completion_percent=(
+            progress.completed_units / progress.total_units * 100
+            if progress.total_units
+            else 0
+        ),
     )
 
 
@@ -310,7 +296,7 @@ def user_course_update(user_course_id: int, user_course: BaseCommonUpdate, db: S
 def user_subject_create(user_subject: UserSubjectCreate, db: Session):
     try:
         data = user_subject.model_dump()
-        user_subject_instance = create_model_instance(UserSubject, data)
+        user_subject_instance = create_model_instance(UserSubject, data, db)
         return BaseCommonFetch(
             expected_completion_time=user_subject_instance.expected_completion_time,
             started_at=user_subject_instance.started_at,
@@ -323,57 +309,97 @@ def user_subject_create(user_subject: UserSubjectCreate, db: Session):
         )
 
 
-def fetch_user_upcoming_subjects(db: Session, user_id: int | None = None):
-    user_enrolled_courses = db.exec(
-        select(CourseEnrollment).where(CourseEnrollment.user_id == user_id)
+def _upcoming_subjects(user_ids: list[int], db: Session):
+    """(user, course, subject id, subject title) rows, one per paid enrollment.
+
+    The subject is the first published one after the last published subject
+    the user completed in the course, or the first published one if there is
+    none. A single query ranks the candidates of every enrollment at once.
+    """
+    done = aliased(Subject)
+    last_completed = (
+        select(func.max(done.order))
+        .join(UserSubject, UserSubject.subject_id == done.id)
+        .where(
+            UserSubject.user_id == CourseEnrollment.user_id,
+            UserSubject.status == CompletionStatusEnum.COMPLETED,
+            done.course_id == CourseEnrollment.course_id,
+            done.status == StatusEnum.PUBLISHED,
+        )
+        .correlate(CourseEnrollment)
+        .scalar_subquery()
+    )
+    enrollments = (
+        select(
+            CourseEnrollment.user_id,
+            CourseEnrollment.course_id,
+            last_completed.label("last_completed"),
+        )
+        .where(
+            CourseEnrollment.user_id.in_(user_ids),
+            CourseEnrollment.status == PaymentStatus.PAID,
+        )
+        .subquery()
+    )
+    candidates = (
+        select(
+            enrollments.c.user_id,
+            enrollments.c.course_id,
+            Subject.id,
+            Subject.title,
+            func.row_number()
+            .over(
+                partition_by=(enrollments.c.user_id, enrollments.c.course_id),
+                order_by=(Subject.order.asc().nulls_last(), Subject.id),
+            )
+            .label("rank"),
+        )
+        .join(Subject, Subject.course_id == enrollments.c.course_id)
+        .where(
+            Subject.status == StatusEnum.PUBLISHED,
+            or_(
+                enrollments.c.last_completed.is_(None),
+                Subject.order > enrollments.c.last_completed,
+            ),
+        )
+        .subquery()
+    )
+    return db.exec(
+        select(
+            candidates.c.user_id,
+            candidates.c.course_id,
+            candidates.c.id,
+            candidates.c.title,
+        )
+        .where(candidates.c.rank == 1)
+        .order_by(candidates.c.user_id, candidates.c.course_id)
     ).all()
 
-    next_subjects_by_course = {}
 
-    for enrollment in user_enrolled_courses:
-        course_id = enrollment.course_id
-        last_completed_subject = db.exec(
-            select(Subject)
-            .join(UserSubject, UserSubject.subject_id == Subject.id, isouter=True)
-            .where(
-                UserSubject.user_id == user_id,
-                Subject.course_id == course_id,
-                UserSubject.status == CompletionStatusEnum.COMPLETED,
-                Subject.status == StatusEnum.PUBLISHED,
-            )
-            .order_by(Subject.order.desc())
-            .limit(1)
-        ).first()
-        if last_completed_subject:
-            next_subject = db.exec(
-                select(Subject)
-                .where(
-                    Subject.order > last_completed_subject.order,
-                    Subject.course_id == course_id,
-                    Subject.status == StatusEnum.PUBLISHED,
-                )
-                .order_by(asc(Subject.order))
-                .limit(1)
-            ).first()
-        else:
-            next_subject = db.exec(
-                select(Subject)
-                .where(
-                    Subject.course_id == course_id,
-                    Subject.status == StatusEnum.PUBLISHED,
+def fetch_upcoming_subjects_by_user(
+    user_ids: Iterable[int], db: Session, batch_size: int = 500
+) -> dict[int, list[UpcomingCourseSubjects]]:
+    """Upcoming subjects of many users, one query per batch; for reminder jobs.
+
+    Users with nothing upcoming are left out.
+    """
+    user_ids = sorted(set(user_ids))
+    upcoming = {}
+    for start in range(0, len(user_ids), batch_size):
+        for user_id, course_id, subject_id, title in _upcoming_subjects(
+            user_ids[start : start + batch_size], db
+        ):
+            upcoming.setdefault(user_id, []).append(
+                UpcomingCourseSubjects(
+                    course_id=course_id,
+                    subject=BaseSubjectFetch(id=subject_id, title=title),
                 )
-                .order_by(asc(Subject.order))
-                .limit(1)
-            ).first()
-        next_subjects_by_course[course_id] = next_subject
-    return [
-        UpcomingCourseSubjects(
-            course_id=course_id,
-            subject=BaseSubjectFetch(id=value.id, title=value.title),
-        )
-        for course_id, value in next_subjects_by_course.items()
-        if value
-    ]
+            )
+    return upcoming
+
+
+def fetch_user_upcoming_subjects(db: Session, user_id: int | None = None):
+    return fetch_upcoming_subjects_by_user([user_id], db).get(user_id, [])
 
 
 def user_course_stats(user_id: int, db: Session) -> UserCourseStats:
@@ -454,22 +480,15 @@ def user_subject_fetch_by_subject(
     subject = db.get(Subject, subject_id)
     if not subject:
         raise NoResultFound(f"Subject with id {subject_id} not found")
-    total_units = func.count(Unit.id).label("total_units")
-    completed_units = func.count(Unit.id).filter(
-        UserUnit.status == CompletionStatusEnum.COMPLETED
-    )
-    statement = (
-        select(total_units, completed_units)
-        .select_from(Unit)
-        .join(
-            UserUnit,
-            and_(Unit.id == UserUnit.unit_id, UserUnit.user_id == user_id),
-            isouter=True,
+    progress = db.get(UserSubjectProgress, (user_id, subject_id))
+    if progress:
+        total_units, completed_units = progress.total_units, progress.completed_units
+    else:
+        snapshot = get_course_snapshot(subject.course_id, db)
+        units = next(
+            node["units"] for node in snapshot["subjects"] if node["id"] == subject_id
         )
-        .where(Unit.subject_id == subject_id)
-        # .group_by(UserUnit.unit_id)
-    )
-    total_units, completed_units = db.exec(statement).first()
+        total_units, completed_units = len(published(units)), 0
     return UserSubjectUnitStatus(
         total_units=total_units,
         completed_units=completed_units,
@@ -497,7 +516,7 @@ def user_subject_update(
 def user_unit_create(user_unit: UserUnitCreate, db: Session):
     try:
         data = user_unit.model_dump()
-        user_unit_instance = create_model_instance(UserUnit, data)
+        user_unit_instance = create_model_instance(UserUnit, data, db)
         return user_unit_instance
 
     except IntegrityError:
@@ -635,7 +654,7 @@ def user_content_create(user_content: UserContentCreate, db: Session):
             user_unit = UserUnitCreate(**data)
             user_unit_create(user_unit, db)
             data["content_id"] = content_id
-        user_content_instance = create_model_instance(UserContent, data)
+        user_content_instance = create_model_instance(UserContent, data, db)
         return user_content_instance
     except IntegrityError:
         raise HTTPException(
@@ -643,102 +662,519 @@ def user_content_create(user_content: UserContentCreate, db: Session):
         )
 
 
+def _incomplete_children(child, parent_column, link, link_column, model, key_column):
+    """Whether a published ``child`` of the updated ``model`` row is not completed.
+
+    Correlated with the row being updated, so one UPDATE can check any number
+    of (user, parent) rows.
+    """
+    return (
+        select(child.id)
+        .where(
+            parent_column == key_column,
+            child.status == StatusEnum.PUBLISHED,
+            ~select(link_column)
+            .where(
+                link.user_id == model.user_id,
+                link_column == child.id,
+                link.status == CompletionStatusEnum.COMPLETED,
+            )
+            .correlate_except(link)
+            .exists(),
+        )
+        .correlate_except(child)
+        .exists()
+    )
+
+
+def _complete(
+    model, key_column, keys: set[tuple[int, int]], incomplete, db: Session
+) -> set[tuple[int, int]]:
+    """Complete the (user, key) ``model`` rows unless ``incomplete``; return those moved."""
+    if not keys:
+        return set()
+    return {
+        tuple(row)
+        for row in db.exec(
+            update(model)
+            .where(
+                tuple_(model.user_id, key_column).in_(keys),
+                model.status != CompletionStatusEnum.COMPLETED,
+                ~incomplete,
+            )
+            .values(status=CompletionStatusEnum.COMPLETED, completed_at=datetime.now())
+            .returning(model.user_id, key_column)
+            .execution_options(synchronize_session=False)
+        ).all()
+    }
+
+
+def _lock_user_units(courses: Iterable[tuple[int, int]], db: Session) -> None:
+    """Lock the unit rows of the given (user, course) pairs, always in one order.
+
+    Progress writes take this lock first, so concurrent writes by one user in
+    one course run one after the other and cannot deadlock each other.
+    """
+    db.exec(
+        select(UserUnit.unit_id)
+        .join(Unit, Unit.id == UserUnit.unit_id)
+        .join(Subject, Subject.id == Unit.subject_id)
+        .where(tuple_(UserUnit.user_id, Subject.course_id).in_(set(courses)))
+        .order_by(UserUnit.user_id, UserUnit.unit_id)
+        .with_for_update(of=UserUnit)
+    ).all()
+
+
+def _complete_units(
+    units: Iterable[tuple[int, int, int, int, StatusEnum, StatusEnum]], db: Session
+) -> set[tuple[int, int]]:
+    """Complete the units and every level above them that they finish.
+
+    ``units`` holds (user, unit, subject, course, subject status, unit status)
+    rows; each level is one UPDATE whatever their number. Returns the
+    (user, course) pairs completed.
+    """
+    parents = {
+        (user_id, unit_id): (subject_id, course_id, subject_status, unit_status)
+        for user_id, unit_id, subject_id, course_id, subject_status, unit_status in units
+    }
+    completed_units = _complete(
+        UserUnit,
+        UserUnit.unit_id,
+        set(parents),
+        _incomplete_children(
+            Contents,
+            Contents.unit_id,
+            UserContent,
+            UserContent.content_id,
+            UserUnit,
+            UserUnit.unit_id,
+        ),
+        db,
+    )
+    # Only published units count towards their subject.
+    subjects = [
+        (user_id, parents[user_id, unit_id][0])
+        for user_id, unit_id in completed_units
+        if parents[user_id, unit_id][3] == StatusEnum.PUBLISHED
+    ]
+    record_units_completed(subjects, db)
+    courses = {
+        (user_id, subject_id): course_id
+        for user_id, unit_id in completed_units
+        for subject_id, course_id, subject_status, _ in [parents[user_id, unit_id]]
+        if subject_status == StatusEnum.PUBLISHED
+    }
+    completed_subjects = _complete(
+        UserSubject,
+        UserSubject.subject_id,
+        set(subjects),
+        _incomplete_children(
+            Unit,
+            Unit.subject_id,
+            UserUnit,
+            UserUnit.unit_id,
+            UserSubject,
+            UserSubject.subject_id,
+        ),
+        db,
+    )
+    # Only published subjects count towards their course.
+    completed_courses = [
+        (user_id, courses[user_id, subject_id])
+        for user_id, subject_id in completed_subjects
+        if (user_id, subject_id) in courses
+    ]
+    record_subjects_completed(completed_courses, db)
+    return _complete(
+        UserCourse,
+        UserCourse.course_id,
+        set(completed_courses),
+        _incomplete_children(
+            Subject,
+            Subject.course_id,
+            UserSubject,
+            UserSubject.subject_id,
+            UserCourse,
+            UserCourse.course_id,
+        ),
+        db,
+    )
+
+
 def user_content_status_update(user_content_data: UserContentStatusUpdate, db: Session):
+    """Update a content's status and complete every level above it that it finishes.
+
+    Each level is a single conditional UPDATE ... RETURNING that matches only
+    once every published child is completed, so it reports exactly the rows it
+    moved. The user's unit rows in the course are locked first: concurrent
+    completions by one user in one course run one after the other, and the
+    last one always sees the others' writes. Levels the user has no row for
+    are left alone.
+    """
+    user_id = user_content_data.user_id
+    content_id = user_content_data.content_id
     try:
-        content = db.get(Contents, user_content_data.content_id)
-        if not content:
-            raise NoResultFound(
-                f"Content with id {user_content_data.content_id} not found"
+        parents = db.exec(
+            select(
+                Contents.unit_id,
+                Unit.subject_id,
+                Subject.course_id,
+                Subject.status,
+                Unit.status,
             )
-        user_content_instance = db.exec(
-            select(UserContent).where(
-                UserContent.user_id == user_content_data.user_id,
-                UserContent.content_id == user_content_data.content_id,
+            .join(Unit, Unit.id == Contents.unit_id)
+            .join(Subject, Subject.id == Unit.subject_id)
+            .where(Contents.id == content_id)
+        ).first()
+        if not parents:
+            raise NoResultFound(f"Content with id {content_id} not found")
+        unit_id, subject_id, course_id, subject_status, unit_status = parents
+        _lock_user_units([(user_id, course_id)], db)
+
+        data = {"status": user_content_data.status}
+        if user_content_data.status == CompletionStatusEnum.COMPLETED:
+            data["completed_at"] = datetime.now()
+        updated = db.exec(
+            update(UserContent)
+            .where(
+                UserContent.user_id == user_id,
+                UserContent.content_id == content_id,
+                UserContent.status != CompletionStatusEnum.COMPLETED,
             )
+            .values(data)
+            .returning(UserContent.content_id)
+            .execution_options(synchronize_session=False)
         ).first()
-        unit_instance = db.exec(select(Unit).where(Unit.id == content.unit_id)).first()
-        if not user_content_instance:
-            raise NoResultFound("User has not started this content")
-        if user_content_instance.status == CompletionStatusEnum.COMPLETED:
+        if updated is None:
+            if (
+                db.exec(
+                    select(UserContent.status).where(
+                        UserContent.user_id == user_id,
+                        UserContent.content_id == content_id,
+                    )
+                ).first()
+                is None
+            ):
+                raise NoResultFound("User has not started this content")
             raise HTTPException(
                 status_code=400, detail="User has already completed this content!"
             )
-        data = user_content_data.model_dump()
-        updated_user_content_instance = update_model_instance(
-            user_content_instance, data
-        )
-        updated_user_content_instance.completed_at = datetime.now()
-        db.add(updated_user_content_instance)
-        user_unit_instance = db.exec(
-            select(UserUnit).where(
-                UserUnit.user_id == user_content_data.user_id,
-                UserUnit.unit_id == content.unit_id,
+
+        course_completed = (
+            user_content_data.status == CompletionStatusEnum.COMPLETED
+            and bool(
+                _complete_units(
+                    [
+                        (
+                            user_id,
+                            unit_id,
+                            subject_id,
+                            course_id,
+                            subject_status,
+                            unit_status,
+                        )
+                    ],
+                    db,
+                )
             )
-        ).first()
-        unit_contents = db.exec(
-            select(UserContent.status).where(
-                UserContent.user_id == user_content_data.user_id,
-                UserContent.content_id == user_content_data.content_id,
+        )
+        db.commit()
+        return True, course_completed
+    except Exception as e:
+        db.rollback()
+        raise e
+
+
+def _start_contents(
+    rows: list[tuple[int, int, int, datetime]], db: Session
+) -> set[tuple[int, int]]:
+    """Insert (user, content, unit, started at) rows that are not there yet.
+
+    The unit rows they need are inserted as well. Returns the (user, content)
+    pairs that were actually inserted.
+    """
+    unit_started_at = {}
+    for user_id, _, unit_id, started_at in rows:
+        unit_started_at.setdefault((user_id, unit_id), started_at)
+    db.exec(
+        dialect_insert(UserUnit, db)
+        .values(
+            [
+                {
+                    "user_id": user_id,
+                    "unit_id": unit_id,
+                    "expected_completion_time": 0,
+                    "status": CompletionStatusEnum.IN_PROGRESS,
+                    "started_at": started_at,
+                }
+                for (user_id, unit_id), started_at in unit_started_at.items()
+            ]
+        )
+        .on_conflict_do_nothing()
+    )
+    return {
+        tuple(row)
+        for row in db.exec(
+            dialect_insert(UserContent, db)
+            .values(
+                [
+                    {
+                        "user_id": user_id,
+                        "content_id": content_id,
+                        "expected_completion_time": 0,
+                        "status": CompletionStatusEnum.IN_PROGRESS,
+                        "started_at": started_at,
+                        "position_seconds": 0,
+                        "watched_seconds": 0,
+                    }
+                    for user_id, content_id, _, started_at in rows
+                ]
             )
+            .on_conflict_do_nothing()
+            .returning(UserContent.user_id, UserContent.content_id)
         ).all()
-        course_completed = False
-        is_all_contents_completed = all(
-            item == CompletionStatusEnum.COMPLETED for item in unit_contents
-        )
-        if is_all_contents_completed:
-            user_unit_instance.status = CompletionStatusEnum.COMPLETED
-            user_unit_instance.completed_at = datetime.now()
-            db.add(user_unit_instance)
-            db.flush()
-            user_units = db.exec(
-                select(UserUnit.status).where(
-                    UserUnit.unit_id == unit_instance.id,
-                    UserUnit.user_id == user_content_data.user_id,
+    }
+
+
+def user_content_sync(
+    user_id: int, events: list[UserContentEvent], db: Session
+) -> UserContentSyncResult:
+    """Apply a client's ordered content start and complete events at once.
+
+    Meant for offline and mobile clients replaying what they recorded. A
+    repeated (content, action) pair only counts at its first occurrence, and
+    completing a content starts it too. Rows are written with INSERT ... ON
+    CONFLICT DO NOTHING and one UPDATE, the cascade runs once per unit with a
+    new completion, and everything commits in a single transaction.
+    """
+    first = {}
+    for event in events:
+        first.setdefault((event.content_id, event.action), event)
+    try:
+        parents = {
+            content_id: parent
+            for content_id, *parent in db.exec(
+                select(
+                    Contents.id,
+                    Contents.unit_id,
+                    Unit.subject_id,
+                    Subject.course_id,
+                    Subject.status,
+                    Unit.status,
                 )
+                .join(Unit, Unit.id == Contents.unit_id)
+                .join(Subject, Subject.id == Unit.subject_id)
+                .where(Contents.id.in_({content_id for content_id, _ in first}))
             ).all()
-            is_all_units_completed = all(
-                user_unit == CompletionStatusEnum.COMPLETED for user_unit in user_units
+        }
+        started_at, completed_at = {}, {}
+        for (content_id, action), event in first.items():
+            if content_id not in parents:
+                continue
+            started_at.setdefault(content_id, event.occurred_at)
+            if action == ProgressEventAction.COMPLETE:
+                completed_at[content_id] = event.occurred_at
+
+        started, completed, completed_courses = set(), set(), []
+        if started_at:
+            _lock_user_units(
+                {(user_id, parents[content_id][2]) for content_id in started_at}, db
             )
-            if is_all_units_completed:
-                subject_instance = db.exec(
-                    select(Subject).where(
-                        Subject.id == unit_instance.subject_id,
-                        Subject.status == StatusEnum.PUBLISHED,
+            started = {
+                content_id
+                for _, content_id in _start_contents(
+                    [
+                        (user_id, content_id, parents[content_id][0], occurred_at)
+                        for content_id, occurred_at in started_at.items()
+                    ],
+                    db,
+                )
+            }
+        if completed_at:
+            completed = set(
+                db.exec(
+                    update(UserContent)
+                    .where(
+                        UserContent.user_id == user_id,
+                        UserContent.content_id.in_(completed_at),
+                        UserContent.status != CompletionStatusEnum.COMPLETED,
                     )
-                ).first()
-                user_subject_instance = db.exec(
-                    select(UserSubject).where(
-                        UserSubject.subject_id == subject_instance.id,
-                        UserSubject.user_id == user_content_data.user_id,
+                    .values(
+                        status=CompletionStatusEnum.COMPLETED,
+                        completed_at=case(completed_at, value=UserContent.content_id),
                     )
-                ).first()
-                user_subject_instance.status = CompletionStatusEnum.COMPLETED
-                user_subject_instance.completed_at = datetime.now()
-                db.add(user_subject_instance)
-                db.flush()
-                user_subjects = db.exec(
-                    select(UserSubject.status).where(
-                        UserSubject.subject_id == subject_instance.id
+                    .returning(UserContent.content_id)
+                    .execution_options(synchronize_session=False)
+                )
+                .scalars()
+                .all()
+            )
+            completed_courses = sorted(
+                course_id
+                for _, course_id in _complete_units(
+                    {(user_id, *parents[content_id]) for content_id in completed}, db
+                )
+            )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        raise e
+
+    results = []
+    for event in events:
+        if first[event.content_id, event.action] is not event:
+            result = ProgressEventResult.DUPLICATE
+        elif event.content_id not in parents:
+            result = ProgressEventResult.NOT_FOUND
+        elif event.action == ProgressEventAction.START:
+            result = (
+                ProgressEventResult.STARTED
+                if event.content_id in started
+                else ProgressEventResult.ALREADY_STARTED
+            )
+        else:
+            result = (
+                ProgressEventResult.COMPLETED
+                if event.content_id in completed
+                else ProgressEventResult.ALREADY_COMPLETED
+            )
+        results.append(
+            UserContentEventResult(
+                content_id=event.content_id, action=event.action, result=result
+            )
+        )
+    return UserContentSyncResult(results=results, completed_courses=completed_courses)
+
+
+def user_content_playback_flush(
+    progress: list[PlaybackProgress], completion_threshold: float, db: Session
+) -> list[tuple[int, int]]:
+    """Write buffered video playback in bulk and complete what was watched enough.
+
+    Entries for contents that are not videos are skipped. Playing a content
+    starts it if needed; positions are overwritten and watched time added by
+    one executemany UPDATE. Contents whose watched time reaches
+    ``completion_threshold`` of their duration are completed and cascade like
+    a status update. Commits once and returns the completed (user, content)
+    pairs.
+
+    The duration is the content's stored ``duration_seconds``. Videos without
+    one fall back to the first duration the player reported for the pair, so
+    their completion trusts the client; later reports never change it.
+    """
+    parents = {
+        content_id: parent
+        for content_id, *parent in db.exec(
+            select(
+                Contents.id,
+                Contents.unit_id,
+                Unit.subject_id,
+                Subject.course_id,
+                Subject.status,
+                Unit.status,
+            )
+            .join(Unit, Unit.id == Contents.unit_id)
+            .join(Subject, Subject.id == Unit.subject_id)
+            .where(
+                Contents.id.in_({item.content_id for item in progress}),
+                Contents.content_type == ContentTypeEnum.VIDEO,
+            )
+        ).all()
+    }
+    progress = [item for item in progress if item.content_id in parents]
+    if not progress:
+        return []
+    keys = [(item.user_id, item.content_id) for item in progress]
+    try:
+        _start_contents(
+            [
+                (
+                    item.user_id,
+                    item.content_id,
+                    parents[item.content_id][0],
+                    item.started_at,
+                )
+                for item in progress
+            ],
+            db,
+        )
+        # Through the session, not its connection, so the write reaches the
+        # count cache; core_only keeps it a single executemany.
+        db.execute(
+            update(UserContent)
+            .where(
+                UserContent.user_id == bindparam("playback_user_id"),
+                UserContent.content_id == bindparam("playback_content_id"),
+            )
+            .values(
+                position_seconds=bindparam("playback_position"),
+                watched_seconds=UserContent.watched_seconds
+                + bindparam("playback_watched"),
+                duration_seconds=func.coalesce(
+                    UserContent.duration_seconds, bindparam("playback_duration")
+                ),
+            ),
+            [
+                {
+                    "playback_user_id": item.user_id,
+                    "playback_content_id": item.content_id,
+                    "playback_position": round(item.position_seconds),
+                    "playback_watched": round(item.watched_seconds),
+                    "playback_duration": max(round(item.duration_seconds), 1),
+                }
+                for item in progress
+            ],
+            execution_options={"dml_strategy": "core_only"},
+        )
+
+        due = [
+            (user_id, content_id)
+            for user_id, content_id, watched_seconds, duration_seconds in db.exec(
+                select(
+                    UserContent.user_id,
+                    UserContent.content_id,
+                    UserContent.watched_seconds,
+                    func.coalesce(
+                        Contents.duration_seconds, UserContent.duration_seconds
+                    ),
+                )
+                .join(Contents, Contents.id == UserContent.content_id)
+                .where(
+                    tuple_(UserContent.user_id, UserContent.content_id).in_(keys),
+                    UserContent.status != CompletionStatusEnum.COMPLETED,
+                )
+            ).all()
+            if watched_seconds >= completion_threshold * duration_seconds
+        ]
+        completed = []
+        if due:
+            _lock_user_units(
+                {(user_id, parents[content_id][2]) for user_id, content_id in due},
+                db,
+            )
+            completed = [
+                tuple(row)
+                for row in db.exec(
+                    update(UserContent)
+                    .where(
+                        tuple_(UserContent.user_id, UserContent.content_id).in_(due),
+                        UserContent.status != CompletionStatusEnum.COMPLETED,
                     )
+                    .values(
+                        status=CompletionStatusEnum.COMPLETED,
+                        completed_at=datetime.now(),
+                    )
+                    .returning(UserContent.user_id, UserContent.content_id)
+                    .execution_options(synchronize_session=False)
                 ).all()
-                is_all_subjects_completed = all(
-                    user_subject == CompletionStatusEnum.COMPLETED
-                    for user_subject in user_subjects
-                )
-                if is_all_subjects_completed:
-                    user_course = db.exec(
-                        select(UserCourse).where(
-                            UserCourse.course_id == subject_instance.course_id
-                        )
-                    ).first()
-                    user_course.status = CompletionStatusEnum.COMPLETED
-                    user_course.completed_at = datetime.now()
-                    course_completed = True
-                    db.add(user_course)
-                    db.flush()
+            ]
+            _complete_units(
+                {(user_id, *parents[content_id]) for user_id, content_id in completed},
+                db,
+            )
         db.commit()
-        db.refresh(updated_user_content_instance)
-        return True, course_completed
+        return completed
     except Exception as e:
         db.rollback()
         raise e
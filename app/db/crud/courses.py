@@ -1,8 +1,9 @@
 from fastapi import UploadFile
 from sqlalchemy import exists
 from sqlalchemy.exc import InvalidRequestError, NoResultFound
-from sqlalchemy.orm import joinedload, selectinload, with_loader_criteria
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import Session, case, delete, desc, distinct, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.v1.schemas.courses import (
     BaseCourse,
@@ -24,11 +25,16 @@ from app.api.v1.schemas.courses import (
     UnitCreate,
     UnitFetch,
     UnitUpdate,
-    UnitWithContents,
     VideoTimeStamps,
 )
 from app.api.v1.schemas.extras import FilterParams
 from app.api.v1.schemas.users import ProfileSchema
+from app.db.crud.snapshots import (
+    get_course_snapshot,
+    published,
+    refresh_course_snapshots,
+    unit_course_ids,
+)
 from app.db.models.common import UserSubject
 from app.db.models.courses import (
     Category,
@@ -42,11 +48,16 @@ from app.db.models.courses import (
 )
 from app.db.models.enrollment import CourseEnrollment
 from app.db.models.users import Profile, User
+from app.db.session.routing import primary_reads
+from app.services.cache.memory import cached, course_detail_cache, reference_cache
+from app.services.cache.single_flight import coalesced
 from app.services.enum.courses import PaymentStatus, StatusEnum
 from app.services.mixins.pagination import PaginationMixin
-from app.services.utils.crud_utils import update_model_instance
+from app.services.utils.conditional import Validator
+from app.services.utils.crud_utils import change_state_statement, update_model_instance
 from app.services.utils.date_utils import format_to_mm_ss, format_to_seconds
 from app.services.utils.files import format_file_path, image_save
+from config import settings
 
 
 def course_category_create(title: str, db: Session) -> CategoryFetch:
@@ -54,13 +65,15 @@ def course_category_create(title: str, db: Session) -> CategoryFetch:
     db.add(category_instance)
     db.commit()
     db.refresh(category_instance)
+    reference_cache.invalidate("categories")
     return CategoryFetch.model_validate(category_instance)
 
 
+@cached("categories")
 def get_all_categories(db: Session, params: FilterParams | None = None):
     paginator = PaginationMixin()
-    is_paginated = bool(params.offset and params.limit and params.page)
-    statement = select(Category)
+    is_paginated = bool(params and params.is_paginated)
+    statement = select(Category).order_by(Category.id)
     if is_paginated:
         categories = paginator.paginate_query(statement, params, db)
     else:
@@ -75,6 +88,7 @@ def get_all_categories(db: Session, params: FilterParams | None = None):
     )
 
 
+@cached("minimal_courses")
 def list_minimal_courses(db: Session) -> list[BaseCourse]:
     courses = db.exec(
         select(Course.id, Course.title).where(Course.status == StatusEnum.PUBLISHED)
@@ -88,22 +102,31 @@ def list_minimal_courses(db: Session) -> list[BaseCourse]:
     ]
 
 
-def fetch_latest_courses(
-    db: Session, user_id: int | None = None
-) -> list[LatestCourseFetch]:
-    student_count_expr = func.count(CourseEnrollment.user_id).label("student_count")
-    rating_calculate_expr = func.avg(CourseRating.rating)
+LATEST_COURSES_LIMIT = 5
+
+
+def latest_courses_statement(limit: int, user_id: int | None = None):
+    student_count = (
+        select(func.count(CourseEnrollment.user_id))
+        .where(
+            CourseEnrollment.course_id == Course.id,
+            CourseEnrollment.status == PaymentStatus.PAID,
+        )
+        .correlate(Course)
+        .scalar_subquery()
+    )
+    course_rating = (
+        select(func.avg(CourseRating.rating))
+        .where(CourseRating.course_id == Course.id)
+        .correlate(Course)
+        .scalar_subquery()
+    )
     statement = (
-        select(Course, student_count_expr, rating_calculate_expr)
-        .select_from(Course)
-        .join(CourseEnrollment, CourseEnrollment.course_id == Course.id, isouter=True)
-        .join(CourseRating, CourseRating.course_id == Course.id, isouter=True)
-        .join(User, Course.instructor_id == User.id, isouter=True)
-        .join(Profile, User.id == Profile.user_id)
-        .options(selectinload(Course.instructor).selectinload(User.profile))
+        select(Course, student_count, course_rating, Profile.name)
+        .join(Profile, Profile.user_id == Course.instructor_id)
         .where(Course.status == StatusEnum.PUBLISHED)
-        .order_by(desc(Course.created_at))
-        .group_by(Course.id, *Course.__table__.c)
+        .order_by(desc(Course.created_at), desc(Course.id))
+        .limit(limit)
     )
     if user_id:
         statement = statement.where(
@@ -114,7 +137,12 @@ def fetch_latest_courses(
             )
             .correlate(Course)
         )
-    latest_courses = db.exec(statement).all()
+    return statement
+
+
+def build_latest_courses(
+    db: Session, limit: int, user_id: int | None = None
+) -> list[LatestCourseFetch]:
     return [
         LatestCourseFetch(
             id=course.id,
@@ -124,15 +152,47 @@ def fetch_latest_courses(
             student_count=student_count,
             course_rating=course_rating,
             image_url=format_file_path(course.image_url),
-            instructor_name=course.instructor.profile.name,
+            instructor_name=instructor_name,
         )
-        for course, student_count, course_rating in latest_courses[:5]
+        for course, student_count, course_rating, instructor_name in db.exec(
+            latest_courses_statement(limit, user_id)
+        ).all()
     ]
 
 
+@cached("latest_courses")
+def latest_course_candidates(db: Session) -> list[LatestCourseFetch]:
+    """The newest published courses, shared by every user's feed."""
+    return build_latest_courses(db, settings.LATEST_COURSES_CANDIDATES)
+
+
+def fetch_latest_courses(
+    db: Session, user_id: int | None = None
+) -> list[LatestCourseFetch]:
+    candidates = latest_course_candidates(db)
+    if not user_id:
+        return candidates[:LATEST_COURSES_LIMIT]
+    enrolled = set(
+        db.exec(
+            select(CourseEnrollment.course_id).where(
+                CourseEnrollment.user_id == user_id
+            )
+        ).all()
+    )
+    latest = [course for course in candidates if course.id not in enrolled]
+    if (
+        len(latest) < LATEST_COURSES_LIMIT
+        and len(candidates) == settings.LATEST_COURSES_CANDIDATES
+    ):
+        # Enrolled in most of the candidates: older courses may still qualify.
+        return build_latest_courses(db, LATEST_COURSES_LIMIT, user_id)
+    return latest[:LATEST_COURSES_LIMIT]
+
+
+@coalesced("list_all_courses")
 def list_all_courses(db: Session, params: FilterParams | None = None):
     paginator = PaginationMixin()
-    is_paginated = bool(params.offset and params.limit and params.page)
+    is_paginated = bool(params and params.is_paginated)
     student_count_expr = func.count(distinct(User.id)).label("student_count")
     rating_calculate_expr = func.avg(CourseRating.rating)
     total_revenue = (
@@ -199,7 +259,7 @@ def list_all_courses(db: Session, params: FilterParams | None = None):
 
 
 async def course_create(
-    course: CourseCreate, db: Session, file: UploadFile
+    course: CourseCreate, db: AsyncSession, file: UploadFile
 ) -> CourseFetch:
     data = course.model_dump()
     if file:
@@ -207,18 +267,21 @@ async def course_create(
         data["image_url"] = str(image_path)
     categories_id = data.pop("categories_id")
     statement = select(Category.id).where(Category.id.in_(categories_id))
-    categories = db.exec(statement).all()
+    categories = (await db.exec(statement)).all()
     course_instance = Course(**data)
     db.add(course_instance)
-    db.flush()
+    await db.flush()
     if categories:
         course_categories_link = [
             CategoryCourseLink(course_id=course_instance.id, category_id=category)
             for category in categories
         ]
         db.add_all(course_categories_link)
-    db.commit()
-    db.refresh(course_instance)
+    course_id = course_instance.id
+    await db.run_sync(lambda session: refresh_course_snapshots([course_id], session))
+    await db.commit()
+    await db.refresh(course_instance)
+    reference_cache.invalidate("minimal_courses", "latest_courses")
     return CourseFetch(
         id=course_instance.id,
         title=course_instance.title,
@@ -232,11 +295,11 @@ async def course_create(
 async def course_update(
     course_id: int,
     course_data: CourseUpdate,
-    db: Session,
+    db: AsyncSession,
     file: UploadFile | None = None,
 ) -> BaseCourse:
     try:
-        course_instance = db.get(Course, course_id)
+        course_instance = await db.get(Course, course_id)
         if not course_instance:
             raise NoResultFound("Course not found")
         payload_data = course_data.model_dump()
@@ -248,7 +311,7 @@ async def course_update(
         db.add(updated_course_instance)
 
         if categories_id:
-            db.exec(
+            await db.exec(
                 delete(CategoryCourseLink).where(
                     CategoryCourseLink.course_id == course_id
                 )
@@ -259,18 +322,96 @@ async def course_update(
             ]
             db.add_all(new_categories_links)
 
-        db.commit()
-        db.refresh(updated_course_instance)
+        await db.run_sync(
+            lambda session: refresh_course_snapshots([course_id], session)
+        )
+        await db.commit()
+        await db.refresh(updated_course_instance)
+        reference_cache.invalidate("minimal_courses", "latest_courses")
+        bump_course_version(course_id)
         return BaseCourse(
             id=updated_course_instance.id,
             title=updated_course_instance.title,
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
 
 
-def course_fetch_by_id(course_id: int, db: Session):
+def bump_course_version(*course_ids: int | None):
+    course_detail_cache.bump(*(str(course_id) for course_id in course_ids if course_id))
+
+
+def _validator(kind: str, db: Session, *sources) -> Validator | None:
+    state = db.exec(change_state_statement(*sources)).one()
+    # A missing root row is left to the full fetch to report.
+    if not state[0]:
+        return None
+    return Validator(kind, state)
+
+
+def _cached_by_course_version(prefix: str, course_id: int, build, db: Session):
+    if not course_detail_cache.ttl:
+        return course_detail_cache.flights.do(f"{prefix}:{course_id}", build)
+
+    def fill():
+        with primary_reads(db):
+            return build()
+
+    version = course_detail_cache.version(str(course_id))
+    return course_detail_cache.get_or_set(f"{prefix}:{course_id}:{version}", fill)
+
+
+def course_detail_validator(course_id: int, db: Session) -> Validator | None:
+    return _cached_by_course_version(
+        "course_validator",
+        course_id,
+        lambda: build_course_detail_validator(course_id, db),
+        db,
+    )
+
+
+def build_course_detail_validator(course_id: int, db: Session) -> Validator | None:
+    published_subjects = select(Subject.id).where(
+        Subject.course_id == course_id, Subject.status == StatusEnum.PUBLISHED
+    )
+    return _validator(
+        "course",
+        db,
+        (Course, Course.id == course_id, Course.status == StatusEnum.PUBLISHED),
+        (
+            Category,
+            Category.id.in_(
+                select(CategoryCourseLink.category_id).where(
+                    CategoryCourseLink.course_id == course_id
+                )
+            ),
+        ),
+        (
+            Profile,
+            Profile.user_id
+            == select(Course.instructor_id)
+            .where(Course.id == course_id)
+            .scalar_subquery(),
+        ),
+        (Subject, Subject.id.in_(published_subjects)),
+        (Unit, Unit.subject_id.in_(published_subjects)),
+        (
+            CourseEnrollment,
+            CourseEnrollment.course_id == course_id,
+            CourseEnrollment.status == PaymentStatus.PAID,
+        ),
+        (CourseRating, CourseRating.course_id == course_id),
+    )
+
+
+def course_fetch_by_id(course_id: int, db: Session) -> CourseDetailFetch:
+    return _cached_by_course_version(
+        "course_detail", course_id, lambda: build_course_detail(course_id, db), db
+    )
+
+
+def build_course_detail(course_id: int, db: Session) -> CourseDetailFetch:
     course_instance = db.get(Course, course_id)
     if not course_instance:
         raise NoResultFound(f"Course with pk {course_id} not found")
@@ -284,18 +425,15 @@ def course_fetch_by_id(course_id: int, db: Session):
         )
         .join(CourseEnrollment, CourseEnrollment.course_id == Course.id, isouter=True)
         .join(CourseRating, CourseRating.course_id == Course.id, isouter=True)
-        .join(Subject, Subject.course_id == Course.id, isouter=True)
         .options(
             selectinload(Course.categories),
             selectinload(Course.instructor).joinedload(User.profile),
-            selectinload(Course.subjects).selectinload(Subject.units),
-            with_loader_criteria(Subject, Subject.status == StatusEnum.PUBLISHED),
         )
         .where(Course.id == course_id, Course.status == StatusEnum.PUBLISHED)
-        # .where(Subject.status == StatusEnum.PUBLISHED)
-        .group_by(Course.id, Subject.id)
+        .group_by(Course.id)
     )
     course, student_count, course_rating = db.exec(statement).first()
+    snapshot = get_course_snapshot(course_id, db)
     return CourseDetailFetch(
         id=course.id,
         title=course.title,
@@ -323,14 +461,14 @@ def course_fetch_by_id(course_id: int, db: Session):
         status=course.status,
         subjects=[
             SubjectFetch(
-                id=subject.id,
-                title=subject.title,
-                completion_time=subject.completion_time,
-                order=subject.order,
-                units=[unit.title for unit in subject.units],
-                status=subject.status,
+                id=subject["id"],
+                title=subject["title"],
+                completion_time=subject["completion_time"],
+                order=subject["order"],
+                units=[unit["title"] for unit in subject["units"]],
+                status=subject["status"],
             )
-            for subject in course.subjects
+            for subject in published(snapshot["subjects"])
         ],
     )
 
@@ -351,8 +489,11 @@ def subject_create(subject: SubjectCreate, db: Session) -> SubjectFetch:
         raise NoResultFound(f"No course with id {course_id}")
     subject_instance = Subject(**data)
     db.add(subject_instance)
+    refresh_course_snapshots([course_id], db)
     db.commit()
     db.refresh(subject_instance)
+    reference_cache.invalidate("minimal_subjects")
+    bump_course_version(subject_instance.course_id)
     return SubjectFetch.model_validate(subject_instance)
 
 
@@ -377,10 +518,14 @@ def subject_update(subject_id: int, subject: SubjectUpdate, db: Session):
         raise InvalidRequestError(
             f"{existing_instance.title} was assigned the order number {order}"
         )
+    previous_course_id = subject.course_id
     updated_subject_instance = update_model_instance(subject, data)
     db.add(updated_subject_instance)
+    refresh_course_snapshots([previous_course_id, course_id], db)
     db.commit()
     db.refresh(updated_subject_instance)
+    reference_cache.invalidate("minimal_subjects")
+    bump_course_version(previous_course_id, updated_subject_instance.course_id)
     return updated_subject_instance
 
 
@@ -388,7 +533,7 @@ def fetch_subjects_by_courses(
     db: Session, course_id: int | None = None, params: FilterParams | None = None
 ):
     paginator = PaginationMixin()
-    is_paginated = bool(params.offset and params.limit and params.page)
+    is_paginated = bool(params and params.is_paginated)
     statement = (
         select(Subject)
         .join(UserSubject, isouter=True)
@@ -420,6 +565,7 @@ def fetch_subjects_by_courses(
     return paginator.paginate_response(subjects_data) if is_paginated else subjects_data
 
 
+@cached("minimal_subjects")
 def fetch_subjects_minimal(
     db: Session, course_id: int | None = None
 ) -> list[BaseSubjectFetch]:
@@ -435,62 +581,58 @@ def fetch_subjects_minimal(
     return subjects_data
 
 
+def subject_detail_validator(subject_id: int, db: Session) -> Validator | None:
+    units = select(Unit.id).where(Unit.subject_id == subject_id)
+    return _validator(
+        "subject",
+        db,
+        (Subject, Subject.id == subject_id, Subject.status == StatusEnum.PUBLISHED),
+        (
+            Course,
+            Course.id
+            == select(Subject.course_id)
+            .where(Subject.id == subject_id)
+            .scalar_subquery(),
+        ),
+        (Unit, Unit.id.in_(units)),
+        (Contents, Contents.unit_id.in_(units)),
+        (
+            ContentVideoTimeStamp,
+            ContentVideoTimeStamp.content_id.in_(
+                select(Contents.id).where(Contents.unit_id.in_(units))
+            ),
+        ),
+    )
+
+
 def subject_fetch_by_id(subject_id: int, db: Session):
-    subject = db.get(Subject, subject_id)
-    if not subject:
+    course_id = db.exec(
+        select(Subject.course_id).where(Subject.id == subject_id)
+    ).first()
+    if course_id is None:
         raise NoResultFound(f"Subject with pk {subject_id} not found")
-
-    statement = (
-        select(Subject)
-        .options(
-            selectinload(Subject.course),
-            selectinload(Subject.units)
-            .selectinload(Unit.contents)
-            .selectinload(Contents.video_time_stamps),
-        )
-        .where(Subject.id == subject.id, Subject.status == StatusEnum.PUBLISHED)
+    snapshot = get_course_snapshot(course_id, db)
+    subject = next(
+        (node for node in published(snapshot["subjects"]) if node["id"] == subject_id),
+        None,
     )
-    subject_instance = db.exec(statement).first()
-    return SubjectDetailedFetch(
-        id=subject_instance.id,
-        title=subject_instance.title,
-        course=BaseCourse(
-            id=subject_instance.course.id, title=subject_instance.course.title
-        ),
-        order=subject_instance.order,
-        description=subject_instance.description,
-        status=subject_instance.status,
-        objectives=subject_instance.objectives,
-        units=[
-            UnitWithContents(
-                id=unit.id,
-                title=unit.title,
-                completion_time=unit.completion_time,
-                contents=[
-                    ContentFetch(
-                        id=content.id,
-                        description=content.description,
-                        title=content.title,
-                        completion_time=content.completion_time,
-                        order=content.order,
-                        content_type=content.content_type,
-                        status=content.status,
-                        file_url=format_file_path(content.file_url),
-                        video_time_stamps=[
-                            VideoTimeStamps(
-                                id=stamp.id,
-                                title=stamp.title,
-                                time_stamp=stamp.time_stamp,
-                            )
-                            for stamp in content.video_time_stamps
-                        ],
-                    )
-                    for content in unit.contents
-                ],
-            )
-            for unit in subject_instance.units
-        ],
-        completion_time=subject_instance.completion_time,
+    if subject is None:
+        raise NoResultFound(f"Subject with pk {subject_id} is not published")
+    return SubjectDetailedFetch.model_validate(
+        {
+            **subject,
+            "course": {"id": snapshot["id"], "title": snapshot["title"]},
+            "units": [
+                {
+                    **unit,
+                    "contents": [
+                        {**content, "file_url": format_file_path(content["file_url"])}
+                        for content in unit["contents"]
+                    ],
+                }
+                for unit in subject["units"]
+            ],
+        }
     )
 
 
@@ -502,8 +644,11 @@ def unit_create(unit: UnitCreate, db: Session) -> UnitFetch:
         raise NoResultFound(f"No subject with id {subject_id}")
     unit_instance = Unit(**data)
     db.add(unit_instance)
+    refresh_course_snapshots([subject.course_id], db)
     db.commit()
     db.refresh(unit_instance)
+    reference_cache.invalidate("minimal_units")
+    bump_course_version(subject.course_id)
     return UnitFetch(
         id=unit_instance.id,
         title=unit_instance.title,
@@ -536,10 +681,17 @@ def unit_update(unit_id: int, unit: UnitUpdate, db: Session) -> UnitFetch:
             raise InvalidRequestError(
                 f"Unit with order {order} already assigned to unit: {existing_unit_with_given_order.id}"
             )
+    subject_ids = {unit_instance.subject_id, subject_id}
+    course_ids = db.exec(
+        select(Subject.course_id).where(Subject.id.in_(subject_ids))
+    ).all()
     updated_unit_instance = update_model_instance(unit_instance, data)
     db.add(updated_unit_instance)
+    refresh_course_snapshots(course_ids, db)
     db.commit()
     db.refresh(updated_unit_instance)
+    reference_cache.invalidate("minimal_units")
+    bump_course_version(*course_ids)
     return updated_unit_instance
 
 
@@ -569,6 +721,23 @@ def fetch_all_units(db: Session, params: FilterParams | None = None):
     return paginator.paginate_response(unit_data)
 
 
+def unit_detail_validator(unit_id: int, db: Session) -> Validator | None:
+    subject_id = select(Unit.subject_id).where(Unit.id == unit_id).scalar_subquery()
+    return _validator(
+        "unit",
+        db,
+        (Unit, Unit.id == unit_id),
+        (Subject, Subject.id == subject_id),
+        (
+            Course,
+            Course.id
+            == select(Subject.course_id)
+            .where(Subject.id == subject_id)
+            .scalar_subquery(),
+        ),
+    )
+
+
 def fetch_unit_by_id(unit_id: int, db: Session):
     statement = (
         select(Unit)
@@ -600,6 +769,7 @@ def fetch_units_by_subject(subject_id: int, db: Session) -> list[UnitFetch]:
     return [UnitFetch.from_orm(unit) for unit in units]
 
 
+@cached("minimal_units")
 def fetch_minimal_units(db: Session, subject_id: int | None = None) -> list[BaseUnit]:
     statement = select(Unit.id, Unit.title)
     if subject_id:
@@ -609,7 +779,7 @@ def fetch_minimal_units(db: Session, subject_id: int | None = None) -> list[Base
 
 
 async def content_create(
-    content: ContentCreate, db: Session, file: UploadFile | None = None
+    content: ContentCreate, db: AsyncSession, file: UploadFile | None = None
 ) -> ContentFetch:
     data = content.model_dump()
     if file:
@@ -617,12 +787,12 @@ async def content_create(
         data["file_url"] = file_path
     video_time_stamps = data.pop("video_time_stamps")
     unit_id = data.get("unit_id")
-    unit_instance = db.get(Unit, unit_id)
+    unit_instance = await db.get(Unit, unit_id)
     if not unit_instance:
         raise NoResultFound(f"No unit with id {unit_id}")
     content_instance = Contents(**data)
     db.add(content_instance)
-    db.flush()
+    await db.flush()
     time_stamp_instances = [
         ContentVideoTimeStamp(
             content_id=content_instance.id,
@@ -632,7 +802,12 @@ async def content_create(
         for item in video_time_stamps
     ]
     db.add_all(time_stamp_instances)
-    db.commit()
+    await db.run_sync(
+        lambda session: refresh_course_snapshots(
+            unit_course_ids([unit_id], session), session
+        )
+    )
+    await db.commit()
     return ContentFetch(
         id=content_instance.id,
         title=content_instance.title,
@@ -640,32 +815,38 @@ async def content_create(
         content_type=content_instance.content_type,
         file_url=content_instance.file_url,
         completion_time=content_instance.completion_time,
+        duration_seconds=content_instance.duration_seconds,
         order=content_instance.order,
         status=content_instance.status,
     )
 
 
 async def content_update(
-    content_id: int, content: ContentUpdate, db: Session, file: UploadFile | None = None
+    content_id: int,
+    content: ContentUpdate,
+    db: AsyncSession,
+    file: UploadFile | None = None,
 ) -> ContentFetch:
     try:
         data = content.model_dump(exclude_none=True)
         unit_id = data.get("unit_id")
         order = data.get("order")
-        content_instance = db.get(Contents, content_id)
+        content_instance = await db.get(Contents, content_id)
         video_time_stamps = (
             data.pop("video_time_stamps") if "video_time_stamps" in data else None
         )
         if unit_id:
-            unit_instance = db.get(Unit, unit_id)
+            unit_instance = await db.get(Unit, unit_id)
             if not unit_instance:
                 raise NoResultFound(f"No unit with id {unit_id}")
         if order:
-            existing_content_by_order = db.exec(
-                select(Contents).where(
-                    Contents.id != content_id,
-                    Contents.unit_id == unit_id,
-                    Contents.order == order,
+            existing_content_by_order = (
+                await db.exec(
+                    select(Contents).where(
+                        Contents.id != content_id,
+                        Contents.unit_id == unit_id,
+                        Contents.order == order,
+                    )
                 )
             ).all()
             if existing_content_by_order:
@@ -676,10 +857,11 @@ async def content_update(
             image_path = await image_save(file)
             data["file_url"] = str(image_path)
 
+        unit_ids = [content_instance.unit_id, unit_id]
         updated_instance = update_model_instance(content_instance, data)
         db.add(updated_instance)
         if video_time_stamps:
-            db.exec(
+            await db.exec(
                 delete(ContentVideoTimeStamp).where(
                     ContentVideoTimeStamp.content_id == content_id
                 )
@@ -694,8 +876,13 @@ async def content_update(
             ]
             db.add_all(new_video_time_stamps)
 
-        db.commit()
-        db.refresh(updated_instance)
+        await db.run_sync(
+            lambda session: refresh_course_snapshots(
+                unit_course_ids(unit_ids, session), session
+            )
+        )
+        await db.commit()
+        await db.refresh(updated_instance)
         return ContentFetch(
             id=content_instance.id,
             title=content_instance.title,
@@ -703,11 +890,12 @@ async def content_update(
             content_type=content_instance.content_type,
             file_url=content_instance.file_url,
             completion_time=content_instance.completion_time,
+            duration_seconds=content_instance.duration_seconds,
             order=content_instance.order,
             status=content_instance.status,
         )
     except Exception as ex:
-        db.rollback()
+        await db.rollback()
         raise ex
 
 
@@ -749,6 +937,7 @@ def fetch_contents(
             id=content.id,
             title=content.title,
             completion_time=content.completion_time,
+            duration_seconds=content.duration_seconds,
             order=content.order,
             course=content.unit.subject.course,
             subject=content.unit.subject,
@@ -767,6 +956,28 @@ def fetch_contents(
     return paginator.paginate_response(content_data)
 
 
+def content_detail_validator(content_id: int, db: Session) -> Validator | None:
+    unit_id = (
+        select(Contents.unit_id).where(Contents.id == content_id).scalar_subquery()
+    )
+    subject_id = select(Unit.subject_id).where(Unit.id == unit_id).scalar_subquery()
+    return _validator(
+        "content",
+        db,
+        (Contents, Contents.id == content_id),
+        (Unit, Unit.id == unit_id),
+        (Subject, Subject.id == subject_id),
+        (
+            Course,
+            Course.id
+            == select(Subject.course_id)
+            .where(Subject.id == subject_id)
+            .scalar_subquery(),
+        ),
+        (ContentVideoTimeStamp, ContentVideoTimeStamp.content_id == content_id),
+    )
+
+
 def fetch_content_by_id(content_id: int, db: Session) -> ContentFetch:
     statement = (
         select(Contents)
@@ -795,6 +1006,7 @@ def fetch_content_by_id(content_id: int, db: Session) -> ContentFetch:
         unit=BaseUnit(id=content_instance.unit.id, title=content_instance.unit.title),
         status=content_instance.status,
         completion_time=content_instance.completion_time,
+        duration_seconds=content_instance.duration_seconds,
         order=content_instance.order,
         file_url=format_file_path(content_instance.file_url),
         video_time_stamps=[
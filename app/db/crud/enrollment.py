@@ -1,5 +1,4 @@
 from fastapi import HTTPException
-from sqlalchemy import func
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import selectinload, with_loader_criteria
 from sqlmodel import Session, and_, asc, case, select
@@ -10,11 +9,13 @@ from app.api.v1.schemas.enrollment import (
     CourseEnrollmentUpdate,
     UserCourseEnrollment,
 )
-from app.db.crud.common import get_subject_detail_with_unit_counts
-from app.db.models.common import UserCourse, UserSubject
+from app.db.crud.courses import bump_course_version
+from app.db.crud.progress import course_progress, subject_progress
+from app.db.models.common import UserCourse, UserCourseProgress, UserSubject
 from app.db.models.courses import Course, Subject
 from app.db.models.enrollment import CourseEnrollment
 from app.db.models.users import User
+from app.services.cache.memory import reference_cache
 from app.services.enum.courses import CompletionStatusEnum, PaymentStatus, StatusEnum
 from app.services.utils.crud_utils import update_model_instance
 from app.services.utils.files import format_file_path
@@ -33,6 +34,8 @@ def course_enrollment_create(
     db.add(course_enrollment)
     db.commit()
     db.refresh(course_enrollment)
+    bump_course_version(course_enrollment.course_id)
+    reference_cache.invalidate("latest_courses")
     return course_enrollment
 
 
@@ -51,6 +54,8 @@ def course_enrollment_payment_update(
     db.add(updated_instance)
     db.commit()
     db.refresh(updated_instance)
+    bump_course_version(updated_instance.course_id)
+    reference_cache.invalidate("latest_courses")
     print(data.get("status"))
     return updated_instance
 
@@ -78,11 +83,7 @@ def fetch_user_enrollments(user_id: int, db: Session):
     statement = (
         select(
             CourseEnrollment,
-            # subject_statement.c.id, subject_statement.c.title,
-            func.count(Subject.id).label("subject_counts"),
-            func.count(UserSubject.subject_id)
-            .filter(UserSubject.status == CompletionStatusEnum.COMPLETED)
-            .label("completed_counts"),
+            UserCourseProgress,
             case(
                 (UserCourse.status == CompletionStatusEnum.COMPLETED, True), else_=False
             ).label("is_completed"),
@@ -92,39 +93,65 @@ def fetch_user_enrollments(user_id: int, db: Session):
             ).label("is_started"),
         )
         .select_from(CourseEnrollment)
-        .join(Course, CourseEnrollment.course_id == Course.id)
-        .join(UserCourse, UserCourse.course_id == Course.id, isouter=True)
-        .join(Subject, Subject.course_id == Course.id)
-        .outerjoin(UserSubject)
+        .join(
+            UserCourse,
+            and_(
+                UserCourse.course_id == CourseEnrollment.course_id,
+                UserCourse.user_id == user.id,
+            ),
+            isouter=True,
+        )
+        .join(
+            UserCourseProgress,
+            and_(
+                UserCourseProgress.course_id == CourseEnrollment.course_id,
+                UserCourseProgress.user_id == user.id,
+            ),
+            isouter=True,
+        )
         .where(
             CourseEnrollment.user_id == user.id,
             CourseEnrollment.status == PaymentStatus.PAID,
         )
-        .where(Subject.status == StatusEnum.PUBLISHED)
-        .group_by(CourseEnrollment.id, UserCourse.status)
     )
     user_enrollments = db.exec(statement).all()
-    return [
-        UserCourseEnrollment(
-            course=CourseFetch(
-                id=course_enrollment.course.id,
-                title=course_enrollment.course.title,
-                completion_time=course_enrollment.course.completion_time,
-                image_url=format_file_path(course_enrollment.course.image_url),
-            ),
-            instructor=course_enrollment.course.instructor.profile.name,
-            total_subjects=total_subjects,
-            completed_subjects=completed_subjects,
-            completion_percent=(
-                round(completed_subjects / total_subjects * 100, 2)
-                if (completed_subjects and total_subjects)
-                else 0
-            ),
-            is_completed=is_completed,
-            is_started=is_started,
+    progress = course_progress(
+        user.id,
+        [
+            course_enrollment.course_id
+            for course_enrollment, stored, _, _ in user_enrollments
+            if stored is None
+        ],
+        db,
+    )
+    results = []
+    for course_enrollment, stored, is_completed, is_started in user_enrollments:
+        course_progress_row = stored or progress.get(course_enrollment.course_id)
+        if not course_progress_row or not course_progress_row.total_subjects:
+            continue
+        total_subjects = course_progress_row.total_subjects
+        completed_subjects = course_progress_row.completed_subjects
+        results.append(
+            UserCourseEnrollment(
+                course=CourseFetch(
+                    id=course_enrollment.course.id,
+                    title=course_enrollment.course.title,
+                    completion_time=course_enrollment.course.completion_time,
+                    image_url=format_file_path(course_enrollment.course.image_url),
+                ),
+                instructor=course_enrollment.course.instructor.profile.name,
+                total_subjects=total_subjects,
+                completed_subjects=completed_subjects,
+                completion_percent=(
+                    round(completed_subjects / total_subjects * 100, 2)
+                    if (completed_subjects and total_subjects)
+                    else 0
+                ),
+                is_completed=is_completed,
+                is_started=is_started,
+            )
         )
-        for course_enrollment, total_subjects, completed_subjects, is_completed, is_started in user_enrollments
-    ]
+    return results
 
 
 def fetch_user_enrollments_by_course(user_id: int, course_id: int, db: Session):
@@ -136,10 +163,6 @@ def fetch_user_enrollments_by_course(user_id: int, course_id: int, db: Session):
             UserCourse.course_id == course.id, UserCourse.user_id == user_id
         )
     ).first()
-    subject_details = {
-        subject.id: subject
-        for subject in get_subject_detail_with_unit_counts(course_id, user_id, db)
-    }
     subject_subquery = (
         select(Subject.title)
         .join(
@@ -153,21 +176,13 @@ def fetch_user_enrollments_by_course(user_id: int, course_id: int, db: Session):
         .scalar_subquery()
     )
     statement = (
-        select(
-            CourseEnrollment,
-            func.count(Subject.id).label("total_subjects"),
-            func.count(Subject.id)
-            .filter(UserSubject.status == CompletionStatusEnum.COMPLETED)
-            .label("completed_counts"),
-            subject_subquery.label("next_subject"),
-        )
+        select(CourseEnrollment, subject_subquery.label("next_subject"))
         .join(Course, Course.id == CourseEnrollment.course_id)
         .join(Subject, Subject.course_id == course_id)
-        .outerjoin(UserSubject, Subject.id == UserSubject.subject_id)
         .options(
             selectinload(CourseEnrollment.user).selectinload(User.profile),
             selectinload(CourseEnrollment.course)
-            .contains_eager(Course.subjects)
+            .selectinload(Course.subjects)
             .selectinload(Subject.units),
             with_loader_criteria(Subject, Subject.status == StatusEnum.PUBLISHED),
         )
@@ -182,12 +197,24 @@ def fetch_user_enrollments_by_course(user_id: int, course_id: int, db: Session):
     enrollment = db.exec(statement).first()
     if not enrollment:
         return None
-    course_enrollment, total_subjects, completed_subjects, next_subject = enrollment
+    course_enrollment, next_subject = enrollment
+    subjects = course_enrollment.course.subjects
+    progress = course_progress(user_id, [course_id], db)[course_id]
+    subjects_progress = subject_progress(
+        user_id,
+        {
+            subject.id: sum(
+                unit.status == StatusEnum.PUBLISHED for unit in subject.units
+            )
+            for subject in subjects
+        },
+        db,
+    )
     return UserCourseEnrollment(
         course=course_enrollment.course,
         next_subject=next_subject,
-        total_subjects=total_subjects,
-        completed_subjects=completed_subjects,
+        total_subjects=progress.total_subjects,
+        completed_subjects=progress.completed_subjects,
         is_started=bool(user_course),
         is_completed=(
             True
@@ -208,30 +235,16 @@ def fetch_user_enrollments_by_course(user_id: int, course_id: int, db: Session):
                     )
                     for unit in subject.units
                 ],
-                total_units=(
-                    subject_details.get(subject.id).total_units
-                    if subject_details.get(subject.id)
-                    else 0
-                ),
-                completed_units=(
-                    subject_details.get(subject.id).completed_units
-                    if subject_details.get(subject.id)
-                    else 0
-                ),
+                total_units=subjects_progress[subject.id].total_units,
+                completed_units=subjects_progress[subject.id].completed_units,
                 completion_percent=(
-                    (
-                        subject_details.get(subject.id).completed_units
-                        / subject_details.get(subject.id).total_units
-                    )
+                    subjects_progress[subject.id].completed_units
+                    / subjects_progress[subject.id].total_units
                     * 100
-                    if (
-                        subject_details.get(subject.id)
-                        and subject_details.get(subject.id).completed_units
-                        and subject_details.get(subject.id).total_units
-                    )
+                    if subjects_progress[subject.id].total_units
                     else 0
                 ),
             )
-            for subject in course_enrollment.course.subjects
+            for subject in subjects
         ],
     )
@@ -20,6 +20,7 @@ from app.db.models.gamification import (
     UserStreak,
 )
 from app.db.models.users import User
+from app.services.cache.memory import cached, reference_cache
 from app.services.enum.extras import AchievementRuleSet
 from app.services.utils.crud_utils import (
     map_model_with_type,
@@ -28,6 +29,7 @@ from app.services.utils.crud_utils import (
 )
 
 
+@cached("streak_types")
 def fetch_all_streak_types(db: Session):
     statement = (
         select(StreakType).where(StreakType.is_active).order_by(StreakType.id.desc())
@@ -51,6 +53,7 @@ def create_streak_type(streak_type_data: StreakTypeCreate, db: Session):
         db.add(streak_type_instance)
         db.commit()
         db.refresh(streak_type_instance)
+        reference_cache.invalidate("streak_types")
         return streak_type_instance
     except Exception as e:
         db.rollback()
@@ -61,7 +64,9 @@ def update_streak_type(
     streak_type_id: int, streak_type_data: StreakTypeUpdate, db: Session
 ):
     try:
-        streak_type_instance = validate_instances_existence(streak_type_id, StreakType)
+        streak_type_instance = validate_instances_existence(
+            streak_type_id, StreakType, db
+        )
         if not streak_type_instance:
             raise NoResultFound(f"Streak type with pk {streak_type_id} not found")
         data = streak_type_data.model_dump()
@@ -69,6 +74,7 @@ def update_streak_type(
         db.add(update_instance)
         db.commit()
         db.refresh(update_instance)
+        reference_cache.invalidate("streak_types")
         return update_instance
     except Exception as e:
         db.rollback()
@@ -77,11 +83,14 @@ def update_streak_type(
 
 def remove_streak_type(streak_type_id: int, db: Session):
     try:
-        streak_type_instance = validate_instances_existence(streak_type_id, StreakType)
+        streak_type_instance = validate_instances_existence(
+            streak_type_id, StreakType, db
+        )
         if not streak_type_instance:
             raise NoResultFound(f"Streak type with pk {streak_type_id} not found")
         db.delete(streak_type_instance)
         db.commit()
+        reference_cache.invalidate("streak_types", "achievements")
         return
     except Exception as e:
         db.rollback()
@@ -159,6 +168,7 @@ def create_achievement_type(achievement: AchievementCreate, db: Session):
         db.add(achievement_instance)
         db.commit()
         db.refresh(achievement_instance)
+        reference_cache.invalidate("achievements")
         return achievement_instance
     except Exception as e:
         db.rollback()
@@ -185,12 +195,14 @@ def update_achievement_type(
         db.add(updated_achievement_instance)
         db.commit()
         db.refresh(updated_achievement_instance)
+        reference_cache.invalidate("achievements")
         return updated_achievement_instance
     except Exception as e:
         db.rollback()
         raise e
 
 
+@cached("achievements")
 def fetch_all_achievements(db: Session):
     statement = select(Achievements).where(Achievements.is_active)
     achievements = db.exec(statement).all()
@@ -256,7 +268,7 @@ def check_and_create_user_achievements(
                 Achievements.rule_type == rule_type
             )
         ).all()
-        common_model_data, data_count = map_model_with_type(rule_type, user_id)
+        common_model_data, data_count = map_model_with_type(rule_type, user_id, db)
         eligible_achievements_ids = [
             key for key, value in achievements if value <= data_count
         ]
@@ -0,0 +1,235 @@
+from collections import Counter
+from collections.abc import Iterable
+
+from sqlalchemy import and_, case, tuple_, update
+from sqlmodel import Session, delete, func, select
+
+from app.db.crud.snapshots import get_course_snapshots, published
+from app.db.models.common import (
+    UserCourseProgress,
+    UserSubject,
+    UserSubjectProgress,
+    UserUnit,
+)
+from app.db.models.courses import Subject, Unit
+from app.services.enum.courses import CompletionStatusEnum, StatusEnum
+
+
+def compute_subject_progress(
+    user_ids: Iterable[int], db: Session, subject_ids: Iterable[int] | None = None
+) -> list[UserSubjectProgress]:
+    """Subject rollups recounted from UserUnit, for subjects the users started."""
+    statement = (
+        select(
+            UserUnit.user_id,
+            Unit.subject_id,
+            func.count(UserUnit.unit_id).filter(
+                UserUnit.status == CompletionStatusEnum.COMPLETED
+            ),
+        )
+        .join(Unit, Unit.id == UserUnit.unit_id)
+        .where(UserUnit.user_id.in_(user_ids), Unit.status == StatusEnum.PUBLISHED)
+        .group_by(UserUnit.user_id, Unit.subject_id)
+    )
+    if subject_ids is not None:
+        statement = statement.where(Unit.subject_id.in_(subject_ids))
+    completed = db.exec(statement).all()
+    totals = dict(
+        db.exec(
+            select(Unit.subject_id, func.count(Unit.id))
+            .where(
+                Unit.subject_id.in_({subject_id for _, subject_id, _ in completed}),
+                Unit.status == StatusEnum.PUBLISHED,
+            )
+            .group_by(Unit.subject_id)
+        ).all()
+    )
+    return [
+        UserSubjectProgress(
+            user_id=user_id,
+            subject_id=subject_id,
+            completed_units=completed_units,
+            total_units=totals.get(subject_id, 0),
+        )
+        for user_id, subject_id, completed_units in completed
+    ]
+
+
+def compute_course_progress(
+    user_ids: Iterable[int], db: Session, course_ids: Iterable[int] | None = None
+) -> list[UserCourseProgress]:
+    """Course rollups recounted from UserSubject, for courses the users started."""
+    statement = (
+        select(
+            UserSubject.user_id,
+            Subject.course_id,
+            func.count(UserSubject.subject_id).filter(
+                UserSubject.status == CompletionStatusEnum.COMPLETED
+            ),
+        )
+        .join(Subject, Subject.id == UserSubject.subject_id)
+        .where(
+            UserSubject.user_id.in_(user_ids), Subject.status == StatusEnum.PUBLISHED
+        )
+        .group_by(UserSubject.user_id, Subject.course_id)
+    )
+    if course_ids is not None:
+        statement = statement.where(Subject.course_id.in_(course_ids))
+    completed = db.exec(statement).all()
+    totals = dict(
+        db.exec(
+            select(Subject.course_id, func.count(Subject.id))
+            .where(
+                Subject.course_id.in_({course_id for _, course_id, _ in completed}),
+                Subject.status == StatusEnum.PUBLISHED,
+            )
+            .group_by(Subject.course_id)
+        ).all()
+    )
+    return [
+        UserCourseProgress(
+            user_id=user_id,
+            course_id=course_id,
+            completed_subjects=completed_subjects,
+            total_subjects=totals.get(course_id, 0),
+        )
+        for user_id, course_id, completed_subjects in completed
+    ]
+
+
+def rebuild_progress(
+    db: Session, user_ids: Iterable[int] | None = None, batch_size: int = 500
+) -> int:
+    """Recount the rollups of the given users (all by default) from raw rows."""
+    if user_ids is None:
+        user_ids = set()
+        for model in (UserUnit, UserSubject, UserSubjectProgress, UserCourseProgress):
+            user_ids.update(db.exec(select(model.user_id).distinct()).all())
+    user_ids = sorted(user_ids)
+    for start in range(0, len(user_ids), batch_size):
+        batch = user_ids[start : start + batch_size]
+        db.exec(
+            delete(UserSubjectProgress).where(UserSubjectProgress.user_id.in_(batch))
+        )
+        db.exec(delete(UserCourseProgress).where(UserCourseProgress.user_id.in_(batch)))
+        db.add_all(compute_subject_progress(batch, db))
+        db.add_all(compute_course_progress(batch, db))
+        db.commit()
+    return len(user_ids)
+
+
+def _increment(
+    model, key: str, column: str, counts: Counter, db: Session
+) -> set[tuple[int, int]]:
+    """Add ``counts`` of (user, key) to ``column``; return the rows that exist."""
+    key_column = getattr(model, key)
+    return {
+        tuple(row)
+        for row in db.exec(
+            update(model)
+            .where(tuple_(model.user_id, key_column).in_(counts))
+            .values(
+                {
+                    column: getattr(model, column)
+                    + case(
+                        *(
+                            (and_(model.user_id == user_id, key_column == value), count)
+                            for (user_id, value), count in counts.items()
+                        )
+                    )
+                }
+            )
+            .returning(model.user_id, key_column)
+            .execution_options(synchronize_session=False)
+        ).all()
+    }
+
+
+def _recount(compute, key: str, missing: set[tuple[int, int]], db: Session):
+    rows = compute(
+        {user_id for user_id, _ in missing}, db, {value for _, value in missing}
+    )
+    db.add_all(row for row in rows if (row.user_id, getattr(row, key)) in missing)
+
+
+def record_units_completed(subjects: Iterable[tuple[int, int]], db: Session) -> None:
+    """Count units just completed, one (user, subject) pair each, without committing.
+
+    The caller must have flushed the UserUnit changes: a missing rollup row is
+    recounted from raw rows rather than incremented.
+    """
+    counts = Counter(subjects)
+    if counts:
+        missing = counts.keys() - _increment(
+            UserSubjectProgress, "subject_id", "completed_units", counts, db
+        )
+        if missing:
+            _recount(compute_subject_progress, "subject_id", missing, db)
+
+
+def record_subjects_completed(courses: Iterable[tuple[int, int]], db: Session) -> None:
+    """Count subjects just completed, one (user, course) pair each, without committing."""
+    counts = Counter(courses)
+    if counts:
+        missing = counts.keys() - _increment(
+            UserCourseProgress, "course_id", "completed_subjects", counts, db
+        )
+        if missing:
+            _recount(compute_course_progress, "course_id", missing, db)
+
+
+def record_unit_completed(user_id: int, subject_id: int, db: Session) -> None:
+    record_units_completed([(user_id, subject_id)], db)
+
+
+def record_subject_completed(user_id: int, course_id: int, db: Session) -> None:
+    record_subjects_completed([(user_id, course_id)], db)
+
+
+def subject_progress(
+    user_id: int, unit_counts: dict[int, int], db: Session
+) -> dict[int, UserSubjectProgress]:
+    """Rollups by subject id, zero where not started.
+
+    ``unit_counts`` maps the subjects wanted to their number of published
+    units, the total reported for subjects without a rollup row.
+    """
+    rows = db.exec(
+        select(UserSubjectProgress).where(
+            UserSubjectProgress.user_id == user_id,
+            UserSubjectProgress.subject_id.in_(unit_counts),
+        )
+    ).all()
+    progress = {row.subject_id: row for row in rows}
+    return {
+        subject_id: progress.get(subject_id)
+        or UserSubjectProgress(
+            user_id=user_id, subject_id=subject_id, total_units=total_units
+        )
+        for subject_id, total_units in unit_counts.items()
+    }
+
+
+def course_progress(
+    user_id: int, course_ids: Iterable[int], db: Session
+) -> dict[int, UserCourseProgress]:
+    """Rollups by course id, zero where not started; unknown courses are left out."""
+    course_ids = set(course_ids)
+    if not course_ids:
+        return {}
+    rows = db.exec(
+        select(UserCourseProgress).where(
+            UserCourseProgress.user_id == user_id,
+            UserCourseProgress.course_id.in_(course_ids),
+        )
+    ).all()
+    progress = {row.course_id: row for row in rows}
+    for course_id, document in get_course_snapshots(
+        course_ids - progress.keys(), db
+    ).items():
+        progress[course_id] = UserCourseProgress(
+            user_id=user_id,
+            course_id=course_id,
+            total_subjects=len(published(document["subjects"])),
+        )
+    return progress
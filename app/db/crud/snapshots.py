@@ -0,0 +1,251 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import case, update
+from sqlmodel import Session, select
+
+from app.db.models.common import UserCourseProgress, UserSubjectProgress
+from app.db.models.courses import (
+    Contents,
+    ContentVideoTimeStamp,
+    Course,
+    CourseSnapshot,
+    Subject,
+    Unit,
+)
+from app.services.enum.courses import StatusEnum
+from app.services.utils.crud_utils import dialect_insert
+
+
+def _ordered(model):
+    return model.order.asc().nulls_last(), model.id
+
+
+def build_course_snapshots(course_ids: Iterable[int], db: Session) -> dict[int, dict]:
+    """Course → Subject → Unit → Contents → timestamp trees, keyed by course id.
+
+    One query per level regardless of how many courses are built. Nodes are
+    kept whatever their status so each reader can apply its own filter.
+    """
+    course_ids = list(course_ids)
+    if not course_ids:
+        return {}
+    courses = db.exec(select(Course).where(Course.id.in_(course_ids))).all()
+    subjects = db.exec(
+        select(Subject)
+        .where(Subject.course_id.in_(course_ids))
+        .order_by(*_ordered(Subject))
+    ).all()
+    units = db.exec(
+        select(Unit)
+        .join(Subject, Subject.id == Unit.subject_id)
+        .where(Subject.course_id.in_(course_ids))
+        .order_by(*_ordered(Unit))
+    ).all()
+    contents = db.exec(
+        select(Contents)
+        .join(Unit, Unit.id == Contents.unit_id)
+        .join(Subject, Subject.id == Unit.subject_id)
+        .where(Subject.course_id.in_(course_ids))
+        .order_by(*_ordered(Contents))
+    ).all()
+    time_stamps = db.exec(
+        select(ContentVideoTimeStamp)
+        .join(Contents, Contents.id == ContentVideoTimeStamp.content_id)
+        .join(Unit, Unit.id == Contents.unit_id)
+        .join(Subject, Subject.id == Unit.subject_id)
+        .where(Subject.course_id.in_(course_ids))
+        .order_by(ContentVideoTimeStamp.time_stamp, ContentVideoTimeStamp.id)
+    ).all()
+
+    stamps_by_content = {}
+    for stamp in time_stamps:
+        stamps_by_content.setdefault(stamp.content_id, []).append(
+            {"id": stamp.id, "title": stamp.title, "time_stamp": stamp.time_stamp}
+        )
+    contents_by_unit = {}
+    for content in contents:
+        contents_by_unit.setdefault(content.unit_id, []).append(
+            {
+                "id": content.id,
+                "title": content.title,
+                "description": content.description,
+                "order": content.order,
+                "status": content.status.value if content.status else None,
+                "content_type": content.content_type.value,
+                "completion_time": content.completion_time,
+                "file_url": content.file_url,
+                "video_time_stamps": stamps_by_content.get(content.id, []),
+            }
+        )
+    units_by_subject = {}
+    for unit in units:
+        units_by_subject.setdefault(unit.subject_id, []).append(
+            {
+                "id": unit.id,
+                "title": unit.title,
+                "order": unit.order,
+                "status": unit.status.value if unit.status else None,
+                "completion_time": unit.completion_time,
+                "contents": contents_by_unit.get(unit.id, []),
+            }
+        )
+    subjects_by_course = {}
+    for subject in subjects:
+        subjects_by_course.setdefault(subject.course_id, []).append(
+            {
+                "id": subject.id,
+                "title": subject.title,
+                "order": subject.order,
+                "status": subject.status.value if subject.status else None,
+                "completion_time": subject.completion_time,
+                "description": subject.description,
+                "objectives": subject.objectives,
+                "units": units_by_subject.get(subject.id, []),
+            }
+        )
+    return {
+        course.id: {
+            "id": course.id,
+            "title": course.title,
+            "status": course.status.value if course.status else None,
+            "completion_time": course.completion_time,
+            "subjects": subjects_by_course.get(course.id, []),
+        }
+        for course in courses
+    }
+
+
+def refresh_course_snapshots(course_ids: Iterable[int | None], db: Session) -> None:
+    """Rebuild the stored snapshots of the given courses without committing.
+
+    Writers call this before their own commit, so a snapshot is replaced in
+    the same transaction as the change that invalidated it. The course rows
+    are locked first: a concurrent writer on the same course waits for this
+    transaction and then rebuilds from its committed state, not its own.
+    """
+    course_ids = sorted({course_id for course_id in course_ids if course_id})
+    if not course_ids:
+        return
+    db.exec(
+        select(Course.id)
+        .where(Course.id.in_(course_ids))
+        .order_by(Course.id)
+        .with_for_update()
+    ).all()
+    documents = build_course_snapshots(course_ids, db)
+    if not documents:
+        return
+    previous = dict(
+        db.exec(
+            select(CourseSnapshot.course_id, CourseSnapshot.document).where(
+                CourseSnapshot.course_id.in_(documents)
+            )
+        ).all()
+    )
+    now = datetime.now()
+    statement = dialect_insert(CourseSnapshot, db).values(
+        [
+            {
+                "course_id": course_id,
+                "document": document,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for course_id, document in documents.items()
+        ]
+    )
+    db.exec(
+        statement.on_conflict_do_update(
+            index_elements=[CourseSnapshot.course_id],
+            set_={"document": statement.excluded.document, "updated_at": now},
+        )
+    )
+    _refresh_progress_totals(documents, previous, db)
+
+
+def _progress_totals(document: dict) -> tuple[int, dict[int, int]]:
+    return len(published(document["subjects"])), {
+        subject["id"]: len(published(subject["units"]))
+        for subject in document["subjects"]
+    }
+
+
+def _refresh_progress_totals(
+    documents: dict[int, dict], previous: dict[int, dict], db: Session
+) -> None:
+    """Carry changed subject and unit counts over to the progress rollups.
+
+    Counts are compared with the previous snapshot, so most catalog writes
+    (renames, reordering) issue no update at all.
+    """
+    course_totals, subject_totals = {}, {}
+    for course_id, document in documents.items():
+        subjects, units = _progress_totals(document)
+        if course_id in previous:
+            old_subjects, old_units = _progress_totals(previous[course_id])
+        else:
+            old_subjects, old_units = None, {}
+        if subjects != old_subjects:
+            course_totals[course_id] = subjects
+        subject_totals.update(
+            (subject_id, count)
+            for subject_id, count in units.items()
+            # A subject new to the snapshot has no progress rows yet.
+            if old_units.get(subject_id, count) != count or course_id not in previous
+        )
+    for model, key, column, totals in (
+        (UserCourseProgress, "course_id", "total_subjects", course_totals),
+        (UserSubjectProgress, "subject_id", "total_units", subject_totals),
+    ):
+        if totals:
+            db.exec(
+                update(model)
+                .where(getattr(model, key).in_(totals))
+                .values({column: case(totals, value=getattr(model, key))})
+                .execution_options(synchronize_session=False)
+            )
+
+
+def rebuild_all_course_snapshots(db: Session, batch_size: int = 100) -> int:
+    course_ids = db.exec(select(Course.id).order_by(Course.id)).all()
+    for start in range(0, len(course_ids), batch_size):
+        refresh_course_snapshots(course_ids[start : start + batch_size], db)
+        db.commit()
+    return len(course_ids)
+
+
+def unit_course_ids(unit_ids: Iterable[int | None], db: Session) -> list[int]:
+    return db.exec(
+        select(Subject.course_id)
+        .join(Unit, Unit.subject_id == Subject.id)
+        .where(Unit.id.in_([unit_id for unit_id in unit_ids if unit_id]))
+        .distinct()
+    ).all()
+
+
+def get_course_snapshot(course_id: int, db: Session) -> dict | None:
+    return get_course_snapshots([course_id], db).get(course_id)
+
+
+def get_course_snapshots(course_ids: Iterable[int], db: Session) -> dict[int, dict]:
+    """Stored snapshots by course id, built on the spot where none was stored yet.
+
+    A missing snapshot is not written back here: readers may be on a replica.
+    """
+    course_ids = set(course_ids)
+    if not course_ids:
+        return {}
+    documents = dict(
+        db.exec(
+            select(CourseSnapshot.course_id, CourseSnapshot.document).where(
+                CourseSnapshot.course_id.in_(course_ids)
+            )
+        ).all()
+    )
+    documents.update(build_course_snapshots(course_ids - documents.keys(), db))
+    return documents
+
+
+def published(nodes: list[dict]) -> list[dict]:
+    return [node for node in nodes if node["status"] == StatusEnum.PUBLISHED.value]
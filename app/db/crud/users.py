@@ -1,13 +1,19 @@
+import hashlib
+
 from datetime import datetime
+from urllib.parse import quote
 
 import humanize
 
 from fastapi import UploadFile
-from sqlalchemy import extract
+from sqlalchemy import and_, extract
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import joinedload
 from sqlmodel import Session, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.schemas.auth import Principal
+from app.api.v1.schemas.extras import FilterParams
 from app.api.v1.schemas.users import (
     MinimalUserFetch,
     ProfileSchema,
@@ -17,13 +23,20 @@ from app.api.v1.schemas.users import (
     UserStats,
     UserUpdateSchema,
 )
+from app.db.crud.courses import bump_course_version
 from app.db.models.common import UserCourse
+from app.db.models.courses import Course
 from app.db.models.enrollment import CourseEnrollment
 from app.db.models.users import Profile, User
 from app.services.auth.hash import get_password_hash
+from app.services.cache.memory import principal_cache, reference_cache
 from app.services.enum.courses import CompletionStatusEnum
 from app.services.enum.users import UserRole
-from app.services.utils.crud_utils import update_model_instance, validate_unique_field
+from app.services.mixins.pagination import PaginationMixin
+from app.services.utils.crud_utils import (
+    async_validate_unique_field,
+    update_model_instance,
+)
 from app.services.utils.files import format_file_path, image_save
 
 
@@ -50,6 +63,43 @@ def get_user_by_username(username: str, db: Session) -> User | None:
     return user
 
 
+def get_principal_by_username(username: str, db: Session) -> Principal | None:
+    row = db.exec(
+        select(
+            User.id,
+            User.username,
+            User.is_active,
+            User.is_superuser,
+            User.is_admin,
+            Profile.role,
+        )
+        .outerjoin(Profile, Profile.user_id == User.id)
+        .where(User.username == username)
+    ).first()
+    return Principal(**row._mapping) if row else None
+
+
+def _principal_key(username: str, token: str) -> str:
+    # Quoting keeps the username free of the ":" that separates the prefix.
+    digest = hashlib.sha256(token.encode()).hexdigest()
+    return f"{quote(username, safe='')}:{digest}"
+
+
+def get_cached_principal(username: str, token: str, db: Session) -> Principal | None:
+    key = _principal_key(username, token)
+    principal = principal_cache.get(key)
+    if principal is None:
+        generation = principal_cache.generation(quote(username, safe=""))
+        principal = get_principal_by_username(username, db)
+        if principal is not None and principal_cache.ttl:
+            principal_cache.set(key, principal, generation=generation)
+    return principal
+
+
+def invalidate_principal(*usernames: str):
+    principal_cache.invalidate(*(quote(username, safe="") for username in usernames))
+
+
 def update_user_login(user: User, db: Session):
     user.last_login = datetime.now()
     db.add(user)
@@ -59,7 +109,7 @@ def update_user_login(user: User, db: Session):
 
 
 async def create_user(
-    user_data: UserCreateSchema, db: Session, image: UploadFile or None = None
+    user_data: UserCreateSchema, db: AsyncSession, image: UploadFile or None = None
 ) -> UserFetchSchema:
     if image:
         image = str(await image_save(image))
@@ -69,7 +119,7 @@ async def create_user(
         password=get_password_hash(user_data.password),
     )
     db.add(user_instance)
-    db.flush()
+    await db.flush()
     profile_instance = Profile(
         user_id=user_instance.id,
         name=user_data.name,
@@ -78,8 +128,8 @@ async def create_user(
         avatar=image,
     )
     db.add(profile_instance)
-    db.commit()
-    db.refresh(profile_instance)
+    await db.commit()
+    await db.refresh(user_instance, attribute_names=["profile"])
     return UserFetchSchema.from_orm(user_instance)
 
 
@@ -96,27 +146,28 @@ def get_user_list_by_role(
 async def update_user(
     user_id: int,
     user_data: UserUpdateSchema,
-    db: Session,
+    db: AsyncSession,
     image: UploadFile | None = None,
 ):
     try:
-        user_instance = db.get(User, user_id)
+        user_instance = await db.get(User, user_id)
         if not user_instance:
             raise NoResultFound(f"User with pk {user_id} not found")
-        profile_instance = db.exec(
-            select(Profile).where(Profile.user_id == user_id)
+        previous_username = user_instance.username
+        profile_instance = (
+            await db.exec(select(Profile).where(Profile.user_id == user_id))
         ).first()
         username = user_data.username
         email = user_data.email
-        validate_unique_field(User, "username", username, db, user_instance)
-        validate_unique_field(User, "email", email, db, user_instance)
+        await async_validate_unique_field(User, "username", username, db, user_instance)
+        await async_validate_unique_field(User, "email", email, db, user_instance)
         user_fields = ["username", "email", "password", "is_active"]
         profile_fields = ["name", "gender", "dob", "avatar"]
         update_data = user_data.model_dump(exclude_none=True)
         user_data_update = {
             key: value for key, value in update_data.items() if key in user_fields
         }
-        password = user_data_update.pop("password")
+        password = user_data_update.pop("password", None)
         if password:
             user_data_update["password"] = get_password_hash(password)
         profile_data = {
@@ -129,11 +180,19 @@ async def update_user(
         updated_user_instance = update_model_instance(user_instance, user_data_update)
         updated_profile_instance = update_model_instance(profile_instance, profile_data)
         db.add(updated_user_instance)
-        db.commit()
-        db.refresh(updated_user_instance)
+        await db.commit()
+        await db.refresh(updated_user_instance)
+        invalidate_principal(previous_username, updated_user_instance.username)
+        # Course details and their validators embed the instructor's profile.
+        taught = (
+            await db.exec(select(Course.id).where(Course.instructor_id == user_id))
+        ).all()
+        if taught:
+            bump_course_version(*taught)
+            reference_cache.invalidate("latest_courses")
         return updated_user_instance
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise e
 
 
@@ -160,22 +219,25 @@ def fetch_user_by_id(user_id: int, db: Session) -> UserFetchSchema | None:
     )
 
 
-def get_students_list(db: Session) -> list[StudentFetchSchema]:
-
+def get_students_list(db: Session, params: FilterParams | None = None):
+    paginator = PaginationMixin()
+    is_paginated = bool(params and params.is_paginated)
     sub_query = (
         select(
             CourseEnrollment.user_id,
-            func.coalesce(func.count(CourseEnrollment.course_id), 0).label(
-                "total_courses"
+            func.count(CourseEnrollment.course_id).label("total_courses"),
+            func.count(UserCourse.course_id)
+            .filter(UserCourse.status == CompletionStatusEnum.COMPLETED)
+            .label("completed_courses"),
+        )
+        .outerjoin(
+            UserCourse,
+            and_(
+                UserCourse.user_id == CourseEnrollment.user_id,
+                UserCourse.course_id == CourseEnrollment.course_id,
             ),
-            func.coalesce(
-                func.count(UserCourse.course_id).filter(
-                    UserCourse.status == CompletionStatusEnum.COMPLETED
-                ),
-                0,
-            ).label("completed_courses"),
         )
-        .group_by(CourseEnrollment.user_id, UserCourse.course_id)
+        .group_by(CourseEnrollment.user_id)
         .subquery()
     )
     statement = (
@@ -183,11 +245,14 @@ def get_students_list(db: Session) -> list[StudentFetchSchema]:
         .where(Profile.role == UserRole.STUDENT)
         .join(Profile, Profile.user_id == User.id)
         .outerjoin(sub_query, sub_query.c.user_id == User.id)
-        .options(joinedload(User.profile), selectinload(User.user_course_links))
+        .options(joinedload(User.profile))
         .order_by(User.id)
     )
-    student_list = db.exec(statement).all()
-    return [
+    if is_paginated:
+        student_list = paginator.paginate_query(statement, params, db)
+    else:
+        student_list = db.exec(statement).all()
+    students = [
         StudentFetchSchema(
             id=user.id,
             profile=ProfileSchema(
@@ -206,6 +271,7 @@ def get_students_list(db: Session) -> list[StudentFetchSchema]:
         )
         for user, profile, total_courses, completed_courses in student_list
     ]
+    return paginator.paginate_response(students) if is_paginated else students
 
 
 def get_minimal_user_list(db: Session) -> list[MinimalUserFetch]:
@@ -0,0 +1,150 @@
+import logging
+
+from datetime import datetime
+from threading import Event, Lock, Thread
+
+from app.api.v1.schemas.common import PlaybackProgress, VideoHeartbeat
+from app.db.crud.common import user_content_playback_flush
+from app.db.session.session import session_scope
+from config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class HeartbeatBuffer:
+    """Video heartbeats of this worker, coalesced per (user, content).
+
+    Recording a heartbeat only touches memory: the latest position wins and
+    watched time adds up. A background thread writes the buffer in bulk every
+    ``flush_interval`` seconds, or as soon as it holds ``max_entries`` pairs,
+    and ``stop`` writes what is left.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float,
+        max_entries: int,
+        max_heartbeat_gap: float,
+        completion_threshold: float,
+    ):
+        self.flush_interval = flush_interval
+        self.max_entries = max_entries
+        self.max_heartbeat_gap = max_heartbeat_gap
+        self.completion_threshold = completion_threshold
+        self.received = 0
+        self.flushed = 0
+        self.completed = 0
+        self.dropped = 0
+        self.errors = 0
+        self._pending: dict[tuple[int, int], PlaybackProgress] = {}
+        self._lock = Lock()
+        self._flush_lock = Lock()
+        self._wake = Event()
+        self._stopped = Event()
+        self._thread: Thread | None = None
+
+    def add(self, user_id: int, heartbeat: VideoHeartbeat):
+        # A client that went quiet (paused, offline) reports the whole gap as
+        # elapsed; only up to max_heartbeat_gap of it counts as watched.
+        watched = min(heartbeat.elapsed_seconds, self.max_heartbeat_gap)
+        key = (user_id, heartbeat.content_id)
+        with self._lock:
+            self.received += 1
+            progress = self._pending.get(key)
+            if progress is None:
+                self._pending[key] = PlaybackProgress(
+                    user_id=user_id,
+                    content_id=heartbeat.content_id,
+                    position_seconds=heartbeat.position_seconds,
+                    watched_seconds=watched,
+                    duration_seconds=heartbeat.duration_seconds,
+                    started_at=datetime.now(),
+                )
+            else:
+                progress.position_seconds = heartbeat.position_seconds
+                # The first reported duration stands; see
+                # user_content_playback_flush.
+                progress.watched_seconds += watched
+            full = len(self._pending) >= self.max_entries
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write the buffered progress; returns how many pairs were written."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            try:
+                with session_scope() as db:
+                    completed = user_content_playback_flush(
+                        list(batch.values()), self.completion_threshold, db
+                    )
+            except Exception:
+                logger.exception(f"Flushing {len(batch)} playback entries failed")
+                self.errors += 1
+                self._requeue(batch)
+                return 0
+            self.flushed += len(batch)
+            self.completed += len(completed)
+            return len(batch)
+
+    def _requeue(self, batch: dict[tuple[int, int], PlaybackProgress]):
+        # Newer heartbeats keep their position; a buffer already full drops the
+        # failed batch instead of growing while the database is down.
+        with self._lock:
+            if len(self._pending) >= self.max_entries:
+                self.dropped += len(batch)
+                return
+            for key, progress in batch.items():
+                newer = self._pending.get(key)
+                if newer is None:
+                    self._pending[key] = progress
+                else:
+                    newer.watched_seconds += progress.watched_seconds
+                    newer.duration_seconds = progress.duration_seconds
+                    newer.started_at = progress.started_at
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = Thread(target=self._run, name="heartbeat-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "pending": pending,
+            "received": self.received,
+            "flushed": self.flushed,
+            "completed": self.completed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "flush_interval": self.flush_interval,
+        }
+
+
+heartbeat_buffer = HeartbeatBuffer(
+    flush_interval=settings.PLAYBACK_FLUSH_INTERVAL,
+    max_entries=settings.PLAYBACK_BUFFER_SIZE,
+    max_heartbeat_gap=settings.PLAYBACK_MAX_HEARTBEAT_GAP,
+    completion_threshold=settings.PLAYBACK_COMPLETION_THRESHOLD,
+)
@@ -0,0 +1,82 @@
+"""progress rollups
+
+Revision ID: 4d2f8a6b1c93
+Revises: 7c1e4b2a9d05
+Create Date: 2026-10-17 15:41:08.270519
+
+Fill the new tables with ``python -m scripts.rebuild_progress``; until then
+progress reads as not started.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d2f8a6b1c93"
+down_revision: Union[str, Sequence[str], None] = "7c1e4b2a9d05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_subject_progress",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("subject_id", sa.Integer(), nullable=False),
+        sa.Column("completed_units", sa.Integer(), nullable=False),
+        sa.Column("total_units", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["subject_id"],
+            ["subjects.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "subject_id"),
+    )
+    op.create_index(
+        op.f("ix_user_subject_progress_subject_id"),
+        "user_subject_progress",
+        ["subject_id"],
+        unique=False,
+    )
+    op.create_table(
+        "user_course_progress",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("course_id", sa.Integer(), nullable=False),
+        sa.Column("completed_subjects", sa.Integer(), nullable=False),
+        sa.Column("total_subjects", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["course_id"],
+            ["courses.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "course_id"),
+    )
+    op.create_index(
+        op.f("ix_user_course_progress_course_id"),
+        "user_course_progress",
+        ["course_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_user_course_progress_course_id"), table_name="user_course_progress"
+    )
+    op.drop_table("user_course_progress")
+    op.drop_index(
+        op.f("ix_user_subject_progress_subject_id"), table_name="user_subject_progress"
+    )
+    op.drop_table("user_subject_progress")
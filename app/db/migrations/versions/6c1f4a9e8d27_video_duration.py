@@ -0,0 +1,35 @@
+"""video duration
+
+Revision ID: 6c1f4a9e8d27
+Revises: 9b3e5d7f2a14
+Create Date: 2026-10-17 06:24:11.382960
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6c1f4a9e8d27"
+down_revision: Union[str, Sequence[str], None] = "9b3e5d7f2a14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "contents", sa.Column("duration_seconds", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "user_contents", sa.Column("duration_seconds", sa.Integer(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("user_contents", "duration_seconds")
+    op.drop_column("contents", "duration_seconds")
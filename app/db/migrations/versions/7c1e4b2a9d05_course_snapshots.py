@@ -0,0 +1,43 @@
+"""course snapshots
+
+Revision ID: 7c1e4b2a9d05
+Revises: ac280c3a5b83
+Create Date: 2026-10-17 12:04:19.513774
+
+Existing courses have no snapshot until ``python -m scripts.rebuild_course_snapshots``
+runs; readers build one on the fly meanwhile.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1e4b2a9d05"
+down_revision: Union[str, Sequence[str], None] = "ac280c3a5b83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "course_snapshots",
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("course_id", sa.Integer(), nullable=False),
+        sa.Column("document", sa.JSON(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["course_id"],
+            ["courses.id"],
+        ),
+        sa.PrimaryKeyConstraint("course_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("course_snapshots")
@@ -0,0 +1,37 @@
+"""video playback progress
+
+Revision ID: 9b3e5d7f2a14
+Revises: 4d2f8a6b1c93
+Create Date: 2026-10-17 18:12:37.604211
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3e5d7f2a14"
+down_revision: Union[str, Sequence[str], None] = "4d2f8a6b1c93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "user_contents",
+        sa.Column("position_seconds", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "user_contents",
+        sa.Column("watched_seconds", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("user_contents", "watched_seconds")
+    op.drop_column("user_contents", "position_seconds")
@@ -0,0 +1,73 @@
+"""hot lookup composite indexes
+
+Revision ID: ac280c3a5b83
+Revises: a538a639bb0d
+Create Date: 2026-10-17 10:12:41.218305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "ac280c3a5b83"
+down_revision: Union[str, Sequence[str], None] = "a538a639bb0d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PUBLISHED = sa.text("status = 'PUBLISHED'")
+
+# (name, table, columns, partial index predicate)
+INDEXES = [
+    ("ix_subjects_course_id_order", "subjects", ["course_id", "order"], None),
+    (
+        "ix_subjects_published_course_id_order",
+        "subjects",
+        ["course_id", "order"],
+        PUBLISHED,
+    ),
+    ("ix_units_subject_id_order", "units", ["subject_id", "order"], None),
+    ("ix_contents_unit_id_order", "contents", ["unit_id", "order"], None),
+    ("ix_assessments_subject_id_order", "assessments", ["subject_id", "order"], None),
+    (
+        "ix_course_enrollments_user_id_course_id_status",
+        "course_enrollments",
+        ["user_id", "course_id", "status"],
+        None,
+    ),
+    ("ix_user_contents_user_id_status", "user_contents", ["user_id", "status"], None),
+    (
+        "ix_user_streaks_streak_by_id_streak_type_id",
+        "user_streaks",
+        ["streak_by_id", "streak_type_id"],
+        None,
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block, and
+    # building without it would lock the tables against writes meanwhile.
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=where,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
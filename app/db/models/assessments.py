@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.services.mixins.db_mixins import BaseTimeStampMixin
@@ -34,6 +35,7 @@ class Assessment(SQLModel, BaseTimeStampMixin, table=True):
     )
 
     __tablename__ = "assessments"
+    __table_args__ = (Index("ix_assessments_subject_id_order", "subject_id", "order"),)
 
 
 class Question(SQLModel, BaseTimeStampMixin, table=True):
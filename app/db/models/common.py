@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.services.enum.courses import CompletionStatusEnum
@@ -31,10 +32,15 @@ class UserContent(SQLModel, table=True):
     )
     started_at: datetime = Field(default_factory=datetime.now)
     completed_at: datetime = Field(nullable=True)
+    position_seconds: int = Field(default=0, ge=0)
+    watched_seconds: int = Field(default=0, ge=0)
+    # First duration the player reported, for videos without duration_seconds.
+    duration_seconds: int | None = Field(default=None, gt=0, nullable=True)
 
     content: "Contents" = Relationship(back_populates="user_content_links")
 
     __tablename__ = "user_contents"
+    __table_args__ = (Index("ix_user_contents_user_id_status", "user_id", "status"),)
 
 
 class UserUnit(SQLModel, table=True):
@@ -61,3 +67,29 @@ class UserSubject(SQLModel, table=True):
     )
     started_at: datetime = Field(default_factory=datetime.now)
     completed_at: datetime = Field(nullable=True)
+
+
+class UserSubjectProgress(SQLModel, table=True):
+    """Completed/total units of a subject for one user.
+
+    Maintained incrementally as units are completed and rebuilt with
+    ``python -m scripts.rebuild_progress``.
+    """
+
+    user_id: int = Field(foreign_key="users.id", primary_key=True)
+    subject_id: int = Field(foreign_key="subjects.id", primary_key=True, index=True)
+    completed_units: int = Field(default=0, ge=0)
+    total_units: int = Field(default=0, ge=0)
+
+    __tablename__ = "user_subject_progress"
+
+
+class UserCourseProgress(SQLModel, table=True):
+    """Completed/total published subjects of a course for one user."""
+
+    user_id: int = Field(foreign_key="users.id", primary_key=True)
+    course_id: int = Field(foreign_key="courses.id", primary_key=True, index=True)
+    completed_subjects: int = Field(default=0, ge=0)
+    total_subjects: int = Field(default=0, ge=0)
+
+    __tablename__ = "user_course_progress"
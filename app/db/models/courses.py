@@ -1,4 +1,5 @@
-from sqlmodel import Field, Relationship, SQLModel
+from sqlalchemy import Index, text
+from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 from app.db.models.common import UserCourse
 from app.db.models.enrollment import CourseEnrollment
@@ -66,6 +67,16 @@ class Subject(SQLModel, BaseTimeStampMixin, table=True):
     # users: list["User"] = Relationship(back_populates="user_subjects", link_model=UserSubject)
 
     __tablename__ = "subjects"
+    __table_args__ = (
+        Index("ix_subjects_course_id_order", "course_id", "order"),
+        Index(
+            "ix_subjects_published_course_id_order",
+            "course_id",
+            "order",
+            postgresql_where=text("status = 'PUBLISHED'"),
+            sqlite_where=text("status = 'PUBLISHED'"),
+        ),
+    )
 
 
 class Unit(SQLModel, BaseTimeStampMixin, table=True):
@@ -84,6 +95,7 @@ class Unit(SQLModel, BaseTimeStampMixin, table=True):
     user_unit_links: list["UserUnit"] = Relationship(back_populates="unit")
 
     __tablename__ = "units"
+    __table_args__ = (Index("ix_units_subject_id_order", "subject_id", "order"),)
 
 
 class UnitContents(SQLModel, BaseTimeStampMixin, table=True):
@@ -106,6 +118,8 @@ class Contents(SQLModel, BaseTimeStampMixin, table=True):
     file_url: str | None
     content_type: ContentTypeEnum = Field(default=ContentTypeEnum.TEXT)
     completion_time: int = Field(default=0, ge=0)
+    # Length of a video; playback completion is measured against it.
+    duration_seconds: int | None = Field(default=None, gt=0, nullable=True)
     unit_id: int | None = Field(foreign_key="units.id", nullable=True)
     order: int | None = Field(ge=0, nullable=True)
     status: StatusEnum | None = Field(nullable=True, default=StatusEnum.DRAFT)
@@ -118,6 +132,7 @@ class Contents(SQLModel, BaseTimeStampMixin, table=True):
     # users: list["User"] = Relationship(back_populates="user_contents", link_model=UserContent)
 
     __tablename__ = "contents"
+    __table_args__ = (Index("ix_contents_unit_id_order", "unit_id", "order"),)
 
 
 class ContentVideoTimeStamp(SQLModel, BaseTimeStampMixin, table=True):
@@ -131,6 +146,13 @@ class ContentVideoTimeStamp(SQLModel, BaseTimeStampMixin, table=True):
     __tablename__ = "video_time_stamps"
 
 
+class CourseSnapshot(SQLModel, BaseTimeStampMixin, table=True):
+    course_id: int = Field(foreign_key="courses.id", primary_key=True)
+    document: dict = Field(sa_column=Column(JSON, nullable=False))
+
+    __tablename__ = "course_snapshots"
+
+
 class CourseRating(SQLModel, BaseTimeStampMixin, table=True):
     id: int | None = Field(default=None, primary_key=True, index=True)
     course_id: int = Field(foreign_key="courses.id", index=True)
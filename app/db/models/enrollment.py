@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 from app.services.enum.courses import PaymentMethod, PaymentStatus
@@ -23,3 +24,11 @@ class CourseEnrollment(SQLModel, BaseTimeStampMixin, table=True):
     course: "Course" = Relationship(back_populates="user_enrollments")
 
     __tablename__ = "course_enrollments"
+    __table_args__ = (
+        Index(
+            "ix_course_enrollments_user_id_course_id_status",
+            "user_id",
+            "course_id",
+            "status",
+        ),
+    )
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.services.enum.extras import AchievementRuleSet
@@ -47,6 +48,13 @@ class UserStreak(SQLModel, table=True):
     streak_by: "User" = Relationship(back_populates="users_streaks")
 
     __tablename__ = "user_streaks"
+    __table_args__ = (
+        Index(
+            "ix_user_streaks_streak_by_id_streak_type_id",
+            "streak_by_id",
+            "streak_type_id",
+        ),
+    )
 
 
 class UserAchievements(SQLModel, table=True):
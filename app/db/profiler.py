@@ -1,12 +1,175 @@
 # db/profiling.py
+import heapq
+import itertools
+import re
+import sys
 import time
 
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from threading import Lock
+
+import greenlet
+
 from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+APP_DIR = Path(__file__).resolve().parents[1]
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDERS = re.compile(r"%\(\w+\)s|\$\d+|\?|(?<!:):\w+")
+_VALUE_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class NPlusOneQueryError(Exception):
+    pass
+
 
-from app.db.session.session import engine
+def normalize_statement(statement: str) -> str:
+    """Collapse literals, placeholders and IN lists so loop queries group together."""
+    # Placeholders first: the literal pass would leave "$?" of asyncpg's "$1".
+    shape = _PLACEHOLDERS.sub("?", statement)
+    shape = _LITERALS.sub("?", shape)
+    shape = _VALUE_LISTS.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
 
 
-query_timings = []  # stores queries per request
+def _call_site() -> str | None:
+    # Innermost application frame outside this module, usually the crud
+    # function running the loop. Async sessions execute inside a greenlet
+    # whose stack ends at the driver, so the awaiting coroutine is found by
+    # continuing through the parent greenlets' suspended frames.
+    frame, current = sys._getframe(1), greenlet.getcurrent()
+    while frame or current:
+        while frame:
+            filename = frame.f_code.co_filename
+            if filename.startswith(str(APP_DIR)) and filename != __file__:
+                return f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+            frame = frame.f_back
+        current = current.parent if current else None
+        frame = current.gr_frame if current else None
+    return None
+
+
+class QueryProfile:
+    """Statements executed while one request (or job) was being handled."""
+
+    def __init__(self, label: str, keep_slowest: int = 5, repeat_threshold: int = 0):
+        self.label = label
+        self.keep_slowest = keep_slowest
+        self.repeat_threshold = repeat_threshold
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.total_time = 0.0
+        self.shapes: Counter[str] = Counter()
+        self.call_sites: dict[str, str | None] = {}
+        self._slowest: list[tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._lock = Lock()
+
+    def record(self, statement: str, parameters, duration: float):
+        entry = (duration, next(self._sequence), statement)
+        shape = normalize_statement(statement) if self.repeat_threshold else None
+        with self._lock:
+            self.query_count += 1
+            self.total_time += duration
+            if len(self._slowest) < self.keep_slowest:
+                heapq.heappush(self._slowest, entry)
+            else:
+                heapq.heappushpop(self._slowest, entry)
+            if shape is None:
+                return
+            self.shapes[shape] += 1
+            repeated = self.shapes[shape] == self.repeat_threshold + 1
+        if repeated:
+            self.call_sites[shape] = _call_site()
+
+    @property
+    def repeated_statements(self) -> list[dict]:
+        return [
+            {
+                "statement": shape,
+                "count": self.shapes[shape],
+                "call_site": call_site,
+            }
+            for shape, call_site in self.call_sites.items()
+        ]
+
+    def check_repeats(self):
+        if self.call_sites:
+            raise NPlusOneQueryError(
+                f"{self.label} repeated statements more than "
+                f"{self.repeat_threshold} times: {self.repeated_statements}"
+            )
+
+    @property
+    def slowest(self) -> list[dict]:
+        return [
+            {"statement": statement, "time": round(duration * 1000, 2)}  # ms
+            for duration, _, statement in sorted(self._slowest, reverse=True)
+        ]
+
+    def summary(self) -> dict:
+        return {
+            "label": self.label,
+            "query_count": self.query_count,
+            "sql_time": round(self.total_time * 1000, 2),  # ms
+            "elapsed": round((time.perf_counter() - self.started) * 1000, 2),  # ms
+            "slowest": self.slowest,
+            "repeated": self.repeated_statements,
+        }
+
+    def server_timing(self) -> str:
+        elapsed = (time.perf_counter() - self.started) * 1000
+        return (
+            f'db;dur={self.total_time * 1000:.2f};desc="{self.query_count} queries", '
+            f"app;dur={elapsed:.2f}"
+        )
+
+
+_current_profile: ContextVar[QueryProfile | None] = ContextVar(
+    "query_profile", default=None
+)
+
+
+_current_scope: ContextVar[dict | None] = ContextVar("request_scope", default=None)
+
+
+def current_profile() -> QueryProfile | None:
+    return _current_profile.get()
+
+
+def current_route() -> str | None:
+    scope = _current_scope.get()
+    if scope is None:
+        return None
+    # The router adds the matched route to the shared scope once resolved, so
+    # statements report the path template rather than the concrete URL.
+    route = scope.get("route")
+    return f"{scope['method']} {route.path if route else scope['path']}"
+
+
+@contextmanager
+def track_request(scope: dict):
+    token = _current_scope.set(scope)
+    try:
+        yield
+    finally:
+        _current_scope.reset(token)
+
+
+@contextmanager
+def profile_queries(label: str, keep_slowest: int = 5, repeat_threshold: int = 0):
+    profile = QueryProfile(label, keep_slowest, repeat_threshold)
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
 
 
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
@@ -14,17 +177,15 @@ def before_cursor_execute(conn, cursor, statement, parameters, context, executem
 
 
 def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    total = time.perf_counter() - context._query_start_time
-    query_timings.append(
-        {
-            "statement": statement,
-            "parameters": parameters,
-            "time": round(total * 1000, 2),  # ms
-        }
-    )
+    profile = _current_profile.get()
+    started = getattr(context, "_query_start_time", None)
+    if profile is None or started is None:
+        return
+    profile.record(statement, parameters, time.perf_counter() - started)
 
 
 def setup_query_profiling():
-    """Attach event listeners to SQLAlchemy Session."""
-    event.listen(engine, "before_cursor_execute", before_cursor_execute)
-    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    """Attach the cursor listeners to every engine (primary, replicas, async)."""
+    if not event.contains(Engine, "before_cursor_execute", before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", after_cursor_execute)
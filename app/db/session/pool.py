@@ -0,0 +1,139 @@
+import os
+import time
+
+from threading import Lock
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from config import settings
+
+
+class PoolMetrics:
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_time_total += seconds
+            self.wait_time_max = max(self.wait_time_max, seconds)
+
+    def increment(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            waits = self.checkouts + self.timeouts
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_time_avg_ms": (
+                    round(self.wait_time_total / waits * 1000, 3) if waits else 0.0
+                ),
+                "wait_time_max_ms": round(self.wait_time_max * 1000, 3),
+            }
+
+
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+class _InstrumentedPoolMixin:
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+
+def instrumented_pool_class(name: str, is_async: bool = False) -> type:
+    # A class per engine keeps the metrics attached across Pool.recreate(),
+    # which rebuilds the pool through self.__class__ after a dispose.
+    metrics = pool_metrics.setdefault(name, PoolMetrics(name))
+    base = AsyncAdaptedQueuePool if is_async else QueuePool
+    return type(
+        f"Instrumented{base.__name__}",
+        (_InstrumentedPoolMixin, base),
+        {"metrics": metrics},
+    )
+
+
+def _statement_timeout_args(url: str, is_async: bool) -> dict:
+    timeout = settings.DATABASE_STATEMENT_TIMEOUT
+    if not timeout or not url.startswith("postgresql"):
+        return {}
+    if is_async:
+        return {"server_settings": {"statement_timeout": str(timeout)}}
+    return {"options": f"-c statement_timeout={timeout}"}
+
+
+def engine_options(url: str, name: str, is_async: bool = False) -> dict:
+    return {
+        "poolclass": instrumented_pool_class(name, is_async),
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "connect_args": _statement_timeout_args(url, is_async),
+    }
+
+
+def register_pool_events(engine: Engine, name: str):
+    metrics = pool_metrics[name]
+    event.listen(engine, "connect", lambda *_: metrics.increment("connects"))
+    event.listen(engine, "checkin", lambda *_: metrics.increment("checkins"))
+    event.listen(engine, "invalidate", lambda *_: metrics.increment("invalidations"))
+
+
+def pool_status(engine: Engine, name: str) -> dict:
+    pool = engine.pool
+    size = settings.DATABASE_POOL_SIZE
+    max_overflow = settings.DATABASE_MAX_OVERFLOW
+    return {
+        "name": name,
+        "pool_size": size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "capacity": size + max_overflow,
+        **pool_metrics[name].snapshot(),
+    }
+
+
+def worker_connection_budget(engine_count: int) -> dict:
+    per_worker = (
+        settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW
+    ) * engine_count
+    return {
+        "pid": os.getpid(),
+        "workers": settings.WEB_CONCURRENCY,
+        "max_connections_per_worker": per_worker,
+        "max_connections_per_host": per_worker * settings.WEB_CONCURRENCY,
+    }
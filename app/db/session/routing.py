@@ -0,0 +1,121 @@
+import itertools
+import math
+import time
+
+from contextlib import contextmanager
+from threading import Lock
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.dml import UpdateBase
+from sqlmodel import Session
+
+
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+
+class ReplicaRouter:
+    def __init__(self, replicas: list[Engine], max_lag: float, check_interval: float):
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._lags: dict[Engine, tuple[float, float]] = {}
+        self._lock = Lock()
+        self._round_robin = itertools.count()
+
+    def measure_lag(self, replica: Engine) -> float:
+        if replica.dialect.name != "postgresql":
+            return 0.0
+        try:
+            with replica.connect() as connection:
+                return float(connection.execute(REPLICA_LAG_QUERY).scalar() or 0)
+        except Exception:
+            return math.inf
+
+    def lag(self, replica: Engine) -> float:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._lags.get(replica)
+            if cached and now - cached[1] < self.check_interval:
+                return cached[0]
+            # Publish the stale value first so concurrent requests keep routing
+            # while a single caller refreshes the measurement.
+            self._lags[replica] = (cached[0] if cached else 0.0, now)
+        measured = self.measure_lag(replica)
+        with self._lock:
+            self._lags[replica] = (measured, time.monotonic())
+        return measured
+
+    def choose(self) -> Engine | None:
+        healthy = [
+            replica for replica in self.replicas if self.lag(replica) <= self.max_lag
+        ]
+        if not healthy:
+            return None
+        return healthy[next(self._round_robin) % len(healthy)]
+
+    def status(self) -> list[dict]:
+        return [
+            {
+                "url": replica.url.render_as_string(hide_password=True),
+                "lag_seconds": self._lags.get(replica, (None, None))[0],
+                "max_lag_seconds": self.max_lag,
+            }
+            for replica in self.replicas
+        ]
+
+
+class RoutingSession(Session):
+    """Session sending reads to a replica unless it has written or is read-write."""
+
+    def __init__(self, primary: Engine, router: ReplicaRouter, **kwargs):
+        super().__init__(bind=primary, **kwargs)
+        self.primary = primary
+        self.router = router
+        self._replica: Engine | None = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if isinstance(clause, UpdateBase):
+            self.info["has_written"] = True
+        if (
+            not self.info.get("read_only")
+            or self.info.get("has_written")
+            or self.info.get("primary_reads")
+            or self._flushing
+        ):
+            return self.primary
+        if self._replica is None:
+            self._replica = self.router.choose() or self.primary
+        return self._replica
+
+
+@contextmanager
+def primary_reads(db: Session):
+    """Send the session's reads to the primary while the block runs.
+
+    For cache fills: a replica still behind the write that invalidated an
+    entry would refill it with the old rows for the entry's whole lifetime.
+    """
+    previous = db.info.get("primary_reads", False)
+    db.info["primary_reads"] = True
+    try:
+        yield db
+    finally:
+        db.info["primary_reads"] = previous
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_to_primary(session, flush_context):
+    # Read-your-writes: once this unit of work has written, every following
+    # statement goes to the primary that holds the change.
+    session.info["has_written"] = True
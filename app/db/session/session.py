@@ -1,13 +1,78 @@
+from contextlib import contextmanager
+
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.db.session.pool import (
+    engine_options,
+    pool_status,
+    register_pool_events,
+    worker_connection_budget,
+)
+from app.db.session.routing import ReplicaRouter, RoutingSession
 from config import settings
 
 
 DATABASE_URL = settings.database_url
+ASYNC_DATABASE_URL = settings.async_database_url
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL, "primary"))
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    **engine_options(ASYNC_DATABASE_URL, "primary_async", is_async=True),
+)
 
-engine = create_engine(DATABASE_URL)
+replica_engines = [
+    create_engine(url, **engine_options(url, f"replica_{index}"))
+    for index, url in enumerate(settings.DATABASE_REPLICA_URLS)
+]
+replica_router = ReplicaRouter(
+    replica_engines,
+    max_lag=settings.DATABASE_REPLICA_MAX_LAG,
+    check_interval=settings.DATABASE_REPLICA_LAG_CHECK_INTERVAL,
+)
+
+pooled_engines = {
+    "primary": engine,
+    "primary_async": async_engine.sync_engine,
+    **{f"replica_{index}": replica for index, replica in enumerate(replica_engines)},
+}
+for pool_name, pooled_engine in pooled_engines.items():
+    register_pool_events(pooled_engine, pool_name)
 
 
 def get_db():
     with Session(engine) as session:
         yield session
+
+
+def get_read_db():
+    # For safe GET handlers only: reads may be served by a replica that is
+    # behind the primary by up to DATABASE_REPLICA_MAX_LAG seconds.
+    with RoutingSession(engine, replica_router, info={"read_only": True}) as session:
+        yield session
+
+
+@contextmanager
+def session_scope():
+    with Session(engine) as session:
+        yield session
+
+
+async def get_async_db():
+    # Attributes stay loaded after commit so response building never triggers
+    # an implicit (and, under asyncio, illegal) lazy refresh.
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+def pool_telemetry() -> dict:
+    return {
+        **worker_connection_budget(len(pooled_engines)),
+        "pools": [
+            pool_status(pooled_engine, pool_name)
+            for pool_name, pooled_engine in pooled_engines.items()
+        ],
+        "replicas": replica_router.status(),
+    }
@@ -0,0 +1,132 @@
+import json
+import logging
+import random
+import time
+
+from collections import deque
+from datetime import UTC, datetime
+from logging.handlers import RotatingFileHandler
+from threading import Lock
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.db.profiler import current_route, setup_query_profiling
+from config import settings
+
+
+EXPLAIN_PREFIX = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) "
+EXPLAIN_SAVEPOINT = "slow_query_explain"
+
+logger = logging.getLogger(__name__)
+
+
+class SlowQueryLog:
+    def __init__(self, threshold_ms: float, max_entries: int, explain_rate: float):
+        self.threshold_ms = threshold_ms
+        self.explain_rate = explain_rate
+        self.entries: deque[dict] = deque(maxlen=max_entries)
+        self.total_recorded = 0
+        self._lock = Lock()
+
+    def record(self, entry: dict):
+        with self._lock:
+            self.entries.append(entry)
+            self.total_recorded += 1
+        logger.info(json.dumps(entry, default=str))
+
+    def snapshot(self, limit: int | None = None) -> list[dict]:
+        with self._lock:
+            entries = list(self.entries)
+        entries.reverse()  # newest first
+        return entries[:limit] if limit else entries
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+
+    def should_explain(self, conn, statement: str, executemany: bool) -> bool:
+        return (
+            not executemany
+            and conn.dialect.name == "postgresql"
+            and statement.lstrip()[:6].upper() == "SELECT"
+            and random.random() < self.explain_rate
+        )
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    max_entries=settings.SLOW_QUERY_BUFFER_SIZE,
+    explain_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+)
+
+
+def explain(conn, statement: str, parameters) -> list | dict | None:
+    # Runs on a raw DBAPI cursor so the EXPLAIN neither re-enters the cursor
+    # events nor, if it fails, aborts the transaction the request is using.
+    # Sampling a plan must never fail the query it samples: errors are logged.
+    dbapi_cursor = None
+    in_savepoint = False
+    try:
+        dbapi_cursor = conn.connection.dbapi_connection.cursor()
+        dbapi_cursor.execute(f"SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        in_savepoint = True
+        dbapi_cursor.execute(EXPLAIN_PREFIX + statement, parameters)
+        plan = dbapi_cursor.fetchone()[0]
+        dbapi_cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        in_savepoint = False
+        return json.loads(plan) if isinstance(plan, str) else plan
+    except Exception as error:
+        logger.warning(f"EXPLAIN failed: {error}")
+        if in_savepoint:
+            try:
+                dbapi_cursor.execute(f"ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}")
+                dbapi_cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            except Exception as error:
+                logger.warning(f"Rolling back the EXPLAIN savepoint failed: {error}")
+        return None
+    finally:
+        if dbapi_cursor is not None:
+            dbapi_cursor.close()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_start_time", None)
+    if started is None:
+        return
+    duration_ms = (time.perf_counter() - started) * 1000
+    if duration_ms < slow_query_log.threshold_ms:
+        return
+    plan = None
+    if slow_query_log.should_explain(conn, statement, executemany):
+        plan = explain(conn, statement, parameters)
+    slow_query_log.record(
+        {
+            "recorded_at": datetime.now(UTC).isoformat(),
+            "duration_ms": round(duration_ms, 2),
+            "route": current_route(),
+            "database": conn.engine.url.database,
+            "statement": statement,
+            "parameters": repr(parameters)[: settings.SLOW_QUERY_MAX_PARAMETER_LENGTH],
+            "plan": plan,
+        }
+    )
+
+
+def setup_slow_query_log():
+    """Attach the slow-query listener and, if configured, the rotating file."""
+    if not settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+    if settings.SLOW_QUERY_LOG_FILE and not logger.handlers:
+        handler = RotatingFileHandler(
+            settings.SLOW_QUERY_LOG_FILE,
+            maxBytes=settings.SLOW_QUERY_LOG_MAX_BYTES,
+            backupCount=settings.SLOW_QUERY_LOG_BACKUP_COUNT,
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    setup_query_profiling()  # stamps the start time on every statement
+    if not event.contains(Engine, "after_cursor_execute", after_cursor_execute):
+        event.listen(Engine, "after_cursor_execute", after_cursor_execute)
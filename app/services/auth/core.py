@@ -9,8 +9,8 @@ from jwt import ExpiredSignatureError, InvalidTokenError
 from pydantic import ValidationError
 from sqlmodel import Session
 
-from app.api.v1.schemas.auth import TokenData
-from app.db.crud.users import get_user_by_username
+from app.api.v1.schemas.auth import Principal, TokenData
+from app.db.crud.users import get_cached_principal, get_user_by_username
 from app.db.models.users import User
 from app.db.session.session import get_db
 from app.services.auth.hash import verify_password
@@ -75,11 +75,11 @@ def create_access_token(refresh_token: str, db: Session) -> str:
         raise
 
 
-async def get_current_user(
+def get_current_user(
     security_scopes: SecurityScopes,
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[Session, Depends(get_db)],
-):
+) -> Principal:
     if security_scopes.scopes:
         authenticate_value = f"Bearer scope={security_scopes.scope_str}"
     else:
@@ -98,9 +98,11 @@ async def get_current_user(
         token_data = TokenData(scopes=token_scopes, username=username)
     except (InvalidTokenError, ValidationError):
         raise credentials_exception
-    user = get_user_by_username(username, db)
+    user = get_cached_principal(username, token, db)
     if user is None:
         raise credentials_exception
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
     for scope in security_scopes.scopes:
         if scope not in token_data.scopes:
             raise HTTPException(
@@ -112,8 +114,8 @@ async def get_current_user(
 
 
 async def get_current_active_user(
-    current_user: Annotated[User, Security(get_current_user, scopes=["me"])],
+    current_user: Annotated[Principal, Security(get_current_user, scopes=["me"])],
 ):
-    if current_user[0].is_active:
+    if current_user.is_active:
         return current_user
     raise HTTPException(status_code=400, detail="Inactive user")
@@ -2,7 +2,7 @@ from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 
-from app.db.models.users import User
+from app.api.v1.schemas.auth import Principal
 from app.services.auth.core import get_current_user
 from app.services.enum.users import UserRole
 
@@ -11,7 +11,9 @@ class BaseRoleMixin:
     def __init__(self, required_role: UserRole | None = None):
         self.required_role = required_role
 
-    def __call__(self, user: Annotated[User, Depends(get_current_user)]) -> User:
+    def __call__(
+        self, user: Annotated[Principal, Depends(get_current_user)]
+    ) -> Principal:
         # Must be authenticated
         if not user:
             raise HTTPException(
@@ -22,7 +24,7 @@ class BaseRoleMixin:
         if user.is_superuser:
             return user
         # Role check if required
-        if self.required_role and user.profile.role != self.required_role:
+        if self.required_role and user.role != self.required_role:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You do not have permission to perform this action",
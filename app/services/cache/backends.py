@@ -0,0 +1,299 @@
+import functools
+import logging
+import os
+import pickle
+import time
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+
+import redis
+
+from config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """Storage under a TTLCache: expiring entries, tag sets and counters.
+
+    Counters (generations and versions) live apart from entries so that
+    evicting an entry can never roll a counter back.
+    """
+
+    # Whether other processes see the same entries.
+    shared = False
+
+    @abstractmethod
+    def get_many(self, keys: list[str]) -> dict[str, object]: ...
+
+    @abstractmethod
+    def set_many(self, items: dict[str, object], ttl: float, tags=()): ...
+
+    @abstractmethod
+    def add(self, key: str, value, ttl: float) -> bool:
+        """Store ``value`` only if ``key`` is absent; report whether it was."""
+
+    @abstractmethod
+    def delete(self, *keys: str): ...
+
+    @abstractmethod
+    def invalidate_tags(self, *tags: str) -> int: ...
+
+    @abstractmethod
+    def counters(self, names: list[str]) -> dict[str, int]: ...
+
+    @abstractmethod
+    def incr(self, *names: str): ...
+
+    @abstractmethod
+    def clear(self): ...
+
+    @abstractmethod
+    def stats(self) -> dict: ...
+
+
+class LRUBackend(CacheBackend):
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: OrderedDict[str, tuple[float, object, tuple]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._counters: dict[str, int] = {}
+        self._lock = Lock()
+
+    def _discard(self, key: str):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _live(self, key: str, now: float):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            self._discard(key)
+            self.expirations += 1
+            return None
+        return entry
+
+    def get_many(self, keys: list[str]) -> dict[str, object]:
+        found = {}
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                entry = self._live(key, now)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = entry[1]
+        return found
+
+    def _store(self, key: str, value, expires_at: float, tags: tuple):
+        if key in self._entries:
+            self._discard(key)
+        self._entries[key] = (expires_at, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+
+    def set_many(self, items: dict[str, object], ttl: float, tags=()):
+        expires_at = time.monotonic() + ttl
+        tags = tuple(tags)
+        with self._lock:
+            for key, value in items.items():
+                self._store(key, value, expires_at, tags)
+            self._evict()
+
+    def add(self, key: str, value, ttl: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self._live(key, now) is not None:
+                return False
+            self._store(key, value, now + ttl, ())
+            self._evict()
+            return True
+
+    def delete(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._discard(key)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        with self._lock:
+            keys = set().union(*(self._tags.get(tag, ()) for tag in tags))
+            for key in keys:
+                self._discard(key)
+            return len(keys)
+
+    def counters(self, names: list[str]) -> dict[str, int]:
+        return {name: self._counters.get(name, 0) for name in names}
+
+    def incr(self, *names: str):
+        with self._lock:
+            for name in names:
+                self._counters[name] = self._counters.get(name, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._counters.clear()
+
+    def stats(self) -> dict:
+        return {
+            "backend": "lru",
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class RedisBackend(CacheBackend):
+    """Entries pickled under ``<namespace>:<key>``, one round trip per call.
+
+    Redis errors are logged and counted, and otherwise read as misses, so an
+    unavailable Redis slows requests down instead of failing them.
+    """
+
+    shared = True
+
+    def __init__(self, client: redis.Redis, namespace: str):
+        self.client = client
+        self.namespace = namespace
+        self.errors = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.namespace}:#tag:{tag}"
+
+    def _counter(self, name: str) -> str:
+        return f"{self.namespace}:#counter:{name}"
+
+    def _failed(self, error: redis.RedisError, fallback=None):
+        self.errors += 1
+        logger.warning(f"Cache backend {self.namespace} unavailable: {error}")
+        return fallback
+
+    def get_many(self, keys: list[str]) -> dict[str, object]:
+        if not keys:
+            return {}
+        try:
+            values = self.client.mget([self._key(key) for key in keys])
+        except redis.RedisError as error:
+            return self._failed(error, {})
+        return {
+            key: pickle.loads(value)
+            for key, value in zip(keys, values, strict=True)
+            if value is not None
+        }
+
+    def set_many(self, items: dict[str, object], ttl: float, tags=()):
+        milliseconds = max(int(ttl * 1000), 1)
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipeline.set(self._key(key), pickle.dumps(value), px=milliseconds)
+            for tag in tags:
+                pipeline.sadd(self._tag(tag), *(self._key(key) for key in items))
+                # Tag sets outlive their members by at most one TTL.
+                pipeline.pexpire(self._tag(tag), milliseconds)
+            pipeline.execute()
+        except redis.RedisError as error:
+            self._failed(error)
+
+    def add(self, key: str, value, ttl: float) -> bool:
+        try:
+            return bool(
+                self.client.set(
+                    self._key(key),
+                    pickle.dumps(value),
+                    px=max(int(ttl * 1000), 1),
+                    nx=True,
+                )
+            )
+        except redis.RedisError as error:
+            return self._failed(error, True)
+
+    def delete(self, *keys: str):
+        if not keys:
+            return
+        try:
+            self.client.delete(*(self._key(key) for key in keys))
+        except redis.RedisError as error:
+            self._failed(error)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        if not tags:
+            return 0
+        tag_keys = [self._tag(tag) for tag in tags]
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipeline.smembers(tag_key)
+            keys = set().union(*pipeline.execute())
+            self.client.delete(*keys, *tag_keys)
+        except redis.RedisError as error:
+            return self._failed(error, 0)
+        return len(keys)
+
+    def counters(self, names: list[str]) -> dict[str, int]:
+        if not names:
+            return {}
+        try:
+            values = self.client.mget([self._counter(name) for name in names])
+        except redis.RedisError as error:
+            return self._failed(error, dict.fromkeys(names, 0))
+        return {
+            name: int(value or 0) for name, value in zip(names, values, strict=True)
+        }
+
+    def incr(self, *names: str):
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            for name in names:
+                pipeline.incr(self._counter(name))
+            pipeline.execute()
+        except redis.RedisError as error:
+            self._failed(error)
+
+    def clear(self):
+        try:
+            keys = list(self.client.scan_iter(match=f"{self.namespace}:*", count=500))
+            for start in range(0, len(keys), 500):
+                self.client.delete(*keys[start : start + 500])
+        except redis.RedisError as error:
+            self._failed(error)
+
+    def stats(self) -> dict:
+        return {"backend": "redis", "errors": self.errors}
+
+
+@functools.cache
+def redis_client() -> redis.Redis:
+    return redis.Redis.from_url(settings.CACHE_REDIS_URL)
+
+
+def make_backend(namespace: str) -> CacheBackend:
+    if settings.CACHE_SHARED_DIR and namespace in settings.CACHE_SHARED_CACHES:
+        # POSIX only (fcntl), hence imported on demand.
+        from app.services.cache.shared_memory import SharedMemoryBackend
+
+        return SharedMemoryBackend(os.path.join(settings.CACHE_SHARED_DIR, namespace))
+    if settings.CACHE_BACKEND == "redis":
+        return RedisBackend(redis_client(), namespace)
+    return LRUBackend(settings.CACHE_MAX_ENTRIES)
@@ -0,0 +1,182 @@
+import functools
+import inspect
+import time
+
+from contextlib import nullcontext
+
+from sqlmodel import Session
+
+from app.db.session.routing import primary_reads
+from app.services.cache.backends import CacheBackend, make_backend
+from app.services.cache.single_flight import SingleFlight, call_key
+from config import settings
+
+
+class TTLCache:
+    """Key/value cache whose entries expire after ``ttl`` seconds.
+
+    Keys are ``"<prefix>:<arguments>"`` strings, so every variant of a cached
+    call is dropped with one ``invalidate(prefix)``. Each invalidation also
+    bumps the prefix generation, so a read that started before a write cannot
+    store its stale result after it. Versions serve the same purpose for
+    single records: readers put ``version(name)`` in the key and writers
+    ``bump(name)``, leaving the old entry to expire unread.
+
+    Entries are kept by a backend, an in-process LRU or Redis, picked with
+    CACHE_BACKEND. Caches named in CACHE_SHARED_CACHES instead share files
+    under CACHE_SHARED_DIR with the other workers on the host, when set.
+    """
+
+    # How long other workers wait for the one computing a shared entry.
+    fill_timeout = 5.0
+
+    def __init__(self, name: str, ttl: float, backend: CacheBackend | None = None):
+        self.name = name
+        self.ttl = ttl
+        self.backend = backend or make_backend(name)
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.flights = SingleFlight(f"cache:{name}")
+
+    def get(self, key: str, default=None):
+        found = self.get_many([key])
+        return found[key] if key in found else default
+
+    def get_many(self, keys: list[str]) -> dict[str, object]:
+        found = self.backend.get_many(keys)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def generation(self, prefix: str) -> int:
+        return self.backend.counters([f"generation:{prefix}"])[f"generation:{prefix}"]
+
+    def version(self, name: str) -> int:
+        return self.backend.counters([f"version:{name}"])[f"version:{name}"]
+
+    def bump(self, *names: str):
+        self.backend.incr(*(f"version:{name}" for name in names))
+
+    def set(
+        self,
+        key: str,
+        value,
+        ttl: float | None = None,
+        generation: int | None = None,
+        tags=(),
+    ):
+        prefix = key.partition(":")[0]
+        if generation is not None and generation != self.generation(prefix):
+            return
+        self.backend.set_many(
+            {key: value}, self.ttl if ttl is None else ttl, (prefix, *tags)
+        )
+
+    def set_many(self, items: dict[str, object], ttl: float | None = None, tags=()):
+        by_prefix = {}
+        for key, value in items.items():
+            by_prefix.setdefault(key.partition(":")[0], {})[key] = value
+        for prefix, entries in by_prefix.items():
+            self.backend.set_many(
+                entries, self.ttl if ttl is None else ttl, (prefix, *tags)
+            )
+
+    def delete(self, *keys: str):
+        self.backend.delete(*keys)
+
+    def get_or_set(self, key: str, factory, ttl: float | None = None, tags=()):
+        """Return the cached value, computing it with ``factory()`` on a miss.
+
+        Concurrent misses on one key compute it once: threads of this
+        process join a single flight, and processes sharing the backend wait
+        for the first one's entry for up to ``fill_timeout`` seconds.
+        """
+        found = self.get_many([key])
+        if key in found:
+            return found[key]
+        return self.flights.do(key, lambda: self._fill(key, factory, ttl, tags))
+
+    def _fill(self, key: str, factory, ttl: float | None, tags):
+        # Another flight may have landed between our miss and this one.
+        found = self.backend.get_many([key])
+        if key in found:
+            return found[key]
+        if self.backend.shared and not self.backend.add(
+            f"#fill:{key}", True, self.fill_timeout
+        ):
+            deadline = time.monotonic() + self.fill_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                found = self.backend.get_many([key])
+                if key in found:
+                    self.waits += 1
+                    return found[key]
+        generation = self.generation(key.partition(":")[0])
+        value = factory()
+        self.set(key, value, ttl, generation, tags)
+        if self.backend.shared:
+            self.backend.delete(f"#fill:{key}")
+        return value
+
+    def invalidate(self, *prefixes: str):
+        self.backend.incr(*(f"generation:{prefix}" for prefix in prefixes))
+        self.backend.invalidate_tags(*prefixes)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        return self.backend.invalidate_tags(*tags)
+
+    def clear(self):
+        self.backend.clear()
+        self.hits = self.misses = self.waits = 0
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "waits": self.waits,
+            "coalesced": self.flights.coalesced,
+            **self.backend.stats(),
+        }
+
+
+reference_cache = TTLCache("reference", settings.REFERENCE_CACHE_TTL)
+course_detail_cache = TTLCache("course_detail", settings.COURSE_DETAIL_CACHE_TTL)
+principal_cache = TTLCache("principal", settings.PRINCIPAL_CACHE_TTL)
+count_cache = TTLCache("count", settings.COUNT_CACHE_TTL)
+caches = [reference_cache, course_detail_cache, principal_cache, count_cache]
+
+
+def cached(prefix: str, cache: TTLCache = reference_cache, ttl: float | None = None):
+    """Memoize a crud reader on its arguments, ignoring the session.
+
+    Misses are filled from the primary, never from a replica that may not
+    have caught up with the write that invalidated the entry.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not cache.ttl:
+                return func(*args, **kwargs)
+            key = f"{prefix}:{call_key(signature, args, kwargs)}"
+
+            sessions = [
+                value
+                for value in (*args, *kwargs.values())
+                if isinstance(value, Session)
+            ]
+
+            def fill():
+                with primary_reads(sessions[0]) if sessions else nullcontext():
+                    return func(*args, **kwargs)
+
+            return cache.get_or_set(key, fill, ttl)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,252 @@
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import time
+
+from app.services.cache.backends import CacheBackend
+
+
+logger = logging.getLogger(__name__)
+
+# Wall-clock expiry: monotonic clocks are not comparable across processes.
+HEADER = struct.Struct("<d")
+COUNTER = struct.Struct("<q")
+
+
+def _digest(name: str) -> str:
+    return hashlib.sha1(name.encode()).hexdigest()
+
+
+class SharedMemoryBackend(CacheBackend):
+    """Entries shared by every worker on a host through memory-mapped files.
+
+    Each entry is one file, written beside its final name and swapped in
+    with ``os.replace``, so readers map either the old version or the new
+    one and never a partial write. Pointing ``directory`` at a tmpfs such as
+    /dev/shm keeps the pages in memory, where each worker maps the same
+    copy instead of holding its own, and a restarted worker starts warm.
+    """
+
+    shared = True
+    prune_every = 100
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.errors = 0
+        self._writes = 0
+        for part in ("entries", "tags", "counters"):
+            os.makedirs(os.path.join(directory, part), exist_ok=True)
+        self._counter_lock = os.path.join(directory, "counters.lock")
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.directory, "entries", _digest(key))
+
+    def _tag(self, tag: str) -> str:
+        return os.path.join(self.directory, "tags", _digest(tag))
+
+    def _counter(self, name: str) -> str:
+        return os.path.join(self.directory, "counters", _digest(name))
+
+    def _failed(self, error: OSError, fallback=None):
+        self.errors += 1
+        logger.warning(f"Shared cache {self.directory} unavailable: {error}")
+        return fallback
+
+    def _read(self, path: str):
+        """The (key, value) stored at ``path``, or None if absent or expired."""
+        try:
+            with open(path, "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                if size <= HEADER.size:
+                    return None
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    (expires_at,) = HEADER.unpack_from(mapped)
+                    if expires_at <= time.time():
+                        return None
+                    with memoryview(mapped) as view, view[HEADER.size :] as body:
+                        return pickle.loads(body)
+        except FileNotFoundError:
+            return None
+
+    def _replace(self, path: str, data: bytes):
+        """Swap ``data`` in at ``path`` in one step."""
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def get_many(self, keys: list[str]) -> dict[str, object]:
+        found = {}
+        try:
+            for key in keys:
+                entry = self._read(self._entry(key))
+                # The stored key guards against digest collisions.
+                if entry is not None and entry[0] == key:
+                    found[key] = entry[1]
+        except (OSError, EOFError, pickle.UnpicklingError) as error:
+            return self._failed(error, found)
+        return found
+
+    def set_many(self, items: dict[str, object], ttl: float, tags=()):
+        expires_at = time.time() + ttl
+        try:
+            for key, value in items.items():
+                self._replace(
+                    self._entry(key),
+                    HEADER.pack(expires_at) + pickle.dumps((key, value)),
+                )
+                for tag in tags:
+                    self._add_member(tag, key)
+        except OSError as error:
+            self._failed(error)
+            return
+        self._writes += 1
+        if self._writes % self.prune_every == 0:
+            self.prune()
+
+    def _add_member(self, tag: str, key: str):
+        # prune may remove the tag directory once empty, so create it again
+        # if it disappears between the two calls.
+        for _ in range(2):
+            os.makedirs(self._tag(tag), exist_ok=True)
+            try:
+                open(os.path.join(self._tag(tag), _digest(key)), "a").close()
+                return
+            except FileNotFoundError:
+                continue
+
+    def add(self, key: str, value, ttl: float) -> bool:
+        path = self._entry(key)
+        data = HEADER.pack(time.time() + ttl) + pickle.dumps((key, value))
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            # Unlike os.replace, os.link fails when the name is taken.
+            for _ in range(2):
+                try:
+                    os.link(temporary, path)
+                    return True
+                except FileExistsError:
+                    if self._read(path) is not None:
+                        return False
+                    self._unlink(path)
+            return False
+        except OSError as error:
+            return self._failed(error, True)
+        finally:
+            self._unlink(temporary)
+
+    def _unlink(self, path: str) -> bool:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def delete(self, *keys: str):
+        try:
+            for key in keys:
+                self._unlink(self._entry(key))
+        except OSError as error:
+            self._failed(error)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        removed = 0
+        try:
+            for tag in tags:
+                directory = self._tag(tag)
+                if not os.path.isdir(directory):
+                    continue
+                for member in os.listdir(directory):
+                    removed += self._unlink(
+                        os.path.join(self.directory, "entries", member)
+                    )
+                    self._unlink(os.path.join(directory, member))
+        except OSError as error:
+            self._failed(error)
+        return removed
+
+    def counters(self, names: list[str]) -> dict[str, int]:
+        values = {}
+        for name in names:
+            try:
+                with open(self._counter(name), "rb") as file:
+                    (values[name],) = COUNTER.unpack(file.read(COUNTER.size))
+            except FileNotFoundError:
+                values[name] = 0
+            except (OSError, struct.error) as error:
+                values[name] = self._failed(error, 0)
+        return values
+
+    def incr(self, *names: str):
+        try:
+            with open(self._counter_lock, "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                for name, value in self.counters(list(names)).items():
+                    self._replace(self._counter(name), COUNTER.pack(value + 1))
+        except OSError as error:
+            self._failed(error)
+
+    def prune(self):
+        """Drop expired entries, then the tag members left without an entry."""
+        entries = os.path.join(self.directory, "entries")
+        now = time.time()
+        for name in os.listdir(entries):
+            path = os.path.join(entries, name)
+            try:
+                with open(path, "rb") as file:
+                    header = file.read(HEADER.size)
+            except FileNotFoundError:
+                continue
+            if len(header) == HEADER.size and HEADER.unpack(header)[0] <= now:
+                self._unlink(path)
+        tags = os.path.join(self.directory, "tags")
+        for tag in os.listdir(tags):
+            directory = os.path.join(tags, tag)
+            try:
+                members = os.listdir(directory)
+            except FileNotFoundError:
+                continue
+            for member in members:
+                entry = os.path.join(entries, member)
+                if os.path.exists(entry):
+                    continue
+                self._unlink(os.path.join(directory, member))
+                # set_many writes the entry before its member: an entry that
+                # appeared meanwhile keeps its member.
+                if os.path.exists(entry):
+                    open(os.path.join(directory, member), "a").close()
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass  # not empty, or already gone
+
+    def clear(self):
+        for part in ("entries", "tags", "counters"):
+            root = os.path.join(self.directory, part)
+            for parent, directories, files in os.walk(root, topdown=False):
+                for name in files:
+                    os.unlink(os.path.join(parent, name))
+                for name in directories:
+                    os.rmdir(os.path.join(parent, name))
+
+    def stats(self) -> dict:
+        entries = os.scandir(os.path.join(self.directory, "entries"))
+        with entries:
+            sizes = [entry.stat().st_size for entry in entries]
+        return {
+            "backend": "shared_memory",
+            "entries": len(sizes),
+            "bytes": sum(sizes),
+            "errors": self.errors,
+        }
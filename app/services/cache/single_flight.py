@@ -0,0 +1,127 @@
+import asyncio
+import functools
+import inspect
+import weakref
+
+from concurrent.futures import Future
+from threading import Lock
+
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+# Every live SingleFlight, for telemetry.
+registry: "weakref.WeakSet[SingleFlight]" = weakref.WeakSet()
+
+
+def call_key(signature: inspect.Signature, args, kwargs) -> str:
+    """The arguments of a call as a string key, leaving out the session."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return ",".join(
+        repr(value)
+        for value in bound.arguments.values()
+        if not isinstance(value, Session | AsyncSession)
+    )
+
+
+class SingleFlight:
+    """Run one computation per key at a time and share it with late callers.
+
+    The first caller for a key runs it; callers arriving while it runs wait
+    for its result (or exception) instead of starting their own. Threadpool
+    callers use ``do`` and coroutines ``do_async``, and either kind can wait
+    on a computation started by the other. ``do`` blocks, so it must not be
+    called on the event loop thread.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.executions = 0
+        self.coalesced = 0
+        self._flights: dict[str, Future] = {}
+        self._lock = Lock()
+        registry.add(self)
+
+    def _join(self, key: str) -> tuple[Future, bool]:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.coalesced += 1
+                return flight, False
+            flight = self._flights[key] = Future()
+            self.executions += 1
+            return flight, True
+
+    def _land(self, key: str, flight: Future, result=None, error=None):
+        with self._lock:
+            del self._flights[key]
+        if error is not None:
+            flight.set_exception(error)
+        else:
+            flight.set_result(result)
+
+    def do(self, key: str, fn):
+        flight, leader = self._join(key)
+        if not leader:
+            return flight.result()
+        try:
+            result = fn()
+        except BaseException as error:
+            self._land(key, flight, error=error)
+            raise
+        self._land(key, flight, result)
+        return result
+
+    async def do_async(self, key: str, fn):
+        flight, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(flight)
+        try:
+            result = await fn()
+        except BaseException as error:
+            self._land(key, flight, error=error)
+            raise
+        self._land(key, flight, result)
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights),
+        }
+
+
+def coalesced(name: str):
+    """Share one execution of a crud reader among concurrent identical calls.
+
+    Unlike ``cached`` nothing outlives the call: only callers that overlap
+    the running query get its result. A result is therefore at most one
+    in-flight call old, and a caller joining a flight started before a
+    concurrent write gets the pre-write result.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        flight = SingleFlight(name)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = call_key(signature, args, kwargs)
+                return await flight.do_async(key, lambda: func(*args, **kwargs))
+
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = call_key(signature, args, kwargs)
+                return flight.do(key, lambda: func(*args, **kwargs))
+
+        wrapper.flight = flight
+        return wrapper
+
+    return decorator
@@ -38,3 +38,17 @@ class PaymentStatus(Enum):
     PAID = "PAID"
     REJECTED = "REJECTED"
     REFUNDED = "REFUNDED"
+
+
+class ProgressEventAction(Enum):
+    START = "START"
+    COMPLETE = "COMPLETE"
+
+
+class ProgressEventResult(Enum):
+    STARTED = "STARTED"
+    ALREADY_STARTED = "ALREADY_STARTED"
+    COMPLETED = "COMPLETED"
+    ALREADY_COMPLETED = "ALREADY_COMPLETED"
+    DUPLICATE = "DUPLICATE"
+    NOT_FOUND = "NOT_FOUND"
@@ -20,6 +20,12 @@ class NotificationStatus(Enum):
     FAILED = "FAILED"
 
 
+class CountStrategy(Enum):
+    EXACT = "EXACT"
+    ESTIMATED = "ESTIMATED"
+    NONE = "NONE"
+
+
 class AchievementRuleSet(Enum):
     COURSE = "COURSE"
     SUBJECT = "SUBJECT"
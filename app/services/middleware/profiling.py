@@ -0,0 +1,67 @@
+import json
+import logging
+import secrets
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.db.profiler import QueryProfile, profile_queries, track_request
+from config import settings
+
+
+PROFILE_HEADER = "X-Query-Profile"
+
+logger = logging.getLogger(__name__)
+
+
+def profiling_requested(request: Request) -> bool:
+    token = settings.QUERY_PROFILER_TOKEN
+    supplied = request.headers.get(PROFILE_HEADER)
+    if not token or not supplied:
+        return False
+    return secrets.compare_digest(supplied.encode(), token.encode())
+
+
+class QueryProfilerMiddleware(BaseHTTPMiddleware):
+    """Profile token-carrying requests and check all requests for N+1 patterns."""
+
+    async def dispatch(self, request: Request, call_next):
+        with track_request(request.scope):
+            return await self.profile(request, call_next)
+
+    async def profile(self, request: Request, call_next):
+        requested = profiling_requested(request)
+        threshold = settings.QUERY_NPLUSONE_THRESHOLD
+        if not requested and not threshold:
+            return await call_next(request)
+        label = f"{request.method} {request.url.path}"
+        with profile_queries(
+            label, settings.QUERY_PROFILER_KEEP_SLOWEST, threshold
+        ) as profile:
+            response = await call_next(request)
+        if profile.call_sites:
+            report_repeats(profile)
+        if requested:
+            add_profile_headers(response, profile)
+        return response
+
+
+def report_repeats(profile: QueryProfile):
+    if settings.QUERY_NPLUSONE_RAISE:
+        profile.check_repeats()
+    for repeated in profile.repeated_statements:
+        logger.warning(
+            json.dumps({"event": "n_plus_one", "label": profile.label} | repeated)
+        )
+
+
+def add_profile_headers(response: Response, profile: QueryProfile):
+    response.headers["Server-Timing"] = profile.server_timing()
+    response.headers["X-Query-Count"] = str(profile.query_count)
+    logger.info(
+        json.dumps(
+            {"event": "query_profile", "status": response.status_code}
+            | profile.summary()
+        )
+    )
@@ -1,28 +1,146 @@
 from math import ceil
 
+from sqlalchemy import and_, false, inspect, or_, true
 from sqlalchemy.exc import InvalidRequestError
-from sqlmodel import Session, func, select
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression, _label_reference
+from sqlmodel import Session
 
 from app.api.v1.schemas.extras import FilterParams
+from app.db.counts import count_rows
+from app.services.utils.cursors import decode_cursor, encode_cursor
+
+
+class _SortKey:
+    """One ORDER BY term, with NULLs placed last when paging forwards."""
+
+    def __init__(self, clause):
+        self.descending = False
+        element = clause
+        while isinstance(element, UnaryExpression | _label_reference):
+            if getattr(element, "modifier", None) is operators.desc_op:
+                self.descending = True
+            element = element.element
+        self.expression = element
+
+    def order_by(self, backwards: bool):
+        descending = self.descending != backwards
+        ordered = self.expression.desc() if descending else self.expression.asc()
+        return ordered.nulls_first() if backwards else ordered.nulls_last()
+
+    def after(self, value, backwards: bool):
+        # Rows strictly past ``value`` in this key's (possibly reversed) order.
+        if value is None:
+            return self.expression.is_not(None) if backwards else false()
+        descending = self.descending != backwards
+        past = self.expression < value if descending else self.expression > value
+        return past if backwards else or_(past, self.expression.is_(None))
+
+    def equal(self, value):
+        if value is None:
+            return self.expression.is_(None)
+        return self.expression == value
 
 
 class PaginationMixin:
     def __init__(self):
         self.total_pages = 0
         self.current_page = 0
+        self.next_cursor = None
+        self.prev_cursor = None
+        self.is_cursor = False
 
     def paginate_query(self, statement, params: FilterParams, db: Session):
-        if params.offset is None or params.limit is None:
+        if params.cursor is not None:
+            return self.paginate_keyset(statement, params, db)
+        if params.offset is None or not params.limit:
             raise InvalidRequestError("offset and limit are required")
-        total_items = db.exec(
-            select(func.count()).select_from(statement.subquery())
-        ).one()
+        self.total_pages = self.count_pages(statement, params, db)
         data = db.exec(statement.offset(params.offset).limit(params.limit)).all()
-        self.total_pages = ceil(total_items / params.page) if total_items else 0
         self.current_page = (params.offset // params.limit) + 1
         return data
 
+    @staticmethod
+    def count_pages(statement, params: FilterParams, db: Session) -> int | None:
+        total_items = count_rows(statement, params.count, db)
+        if total_items is None:
+            return None
+        return ceil(total_items / params.limit)
+
+    def paginate_keyset(self, statement, params: FilterParams, db: Session):
+        """Seek past the cursor's ORDER BY values instead of skipping rows.
+
+        The statement's ORDER BY plus the primary key of its first entity
+        form the key, so pages stay stable while rows are inserted and deep
+        pages cost the same as the first one.
+        """
+        if not params.limit:
+            raise InvalidRequestError("limit is required")
+        self.is_cursor = True
+        self.current_page = None
+        self.total_pages = self.count_pages(statement, params, db)
+
+        keys = [_SortKey(clause) for clause in statement._order_by_clauses]
+        entity = statement.column_descriptions[0]["entity"]
+        for column in inspect(entity).primary_key:
+            if not any(key.expression is column for key in keys):
+                keys.append(_SortKey(column))
+        values, backwards = (
+            decode_cursor(params.cursor) if params.cursor else ([], False)
+        )
+
+        width = len(statement.column_descriptions)
+        keyset = statement.add_columns(
+            *(
+                key.expression.label(f"_cursor_{index}")
+                for index, key in enumerate(keys)
+            )
+        )
+        keyset = keyset.order_by(None).order_by(
+            *(key.order_by(backwards) for key in keys)
+        )
+        if values:
+            seek = self._seek(keys, values, backwards)
+            # Aggregated sort keys can only be compared after grouping.
+            if statement._group_by_clauses:
+                keyset = keyset.having(seek)
+            else:
+                keyset = keyset.where(seek)
+        # exec() would collapse single-entity rows and drop the cursor columns.
+        rows = db.execute(keyset.limit(params.limit + 1)).all()
+        has_more = len(rows) > params.limit
+        rows = rows[: params.limit]
+        if backwards:
+            rows.reverse()
+
+        if rows:
+            first, last = list(rows[0][width:]), list(rows[-1][width:])
+            if backwards:
+                self.next_cursor = encode_cursor(last)
+                self.prev_cursor = encode_cursor(first, True) if has_more else None
+            else:
+                self.next_cursor = encode_cursor(last) if has_more else None
+                self.prev_cursor = encode_cursor(first, True) if values else None
+        if width == 1:
+            return [row[0] for row in rows]
+        return [tuple(row[:width]) for row in rows]
+
+    @staticmethod
+    def _seek(keys: list[_SortKey], values: list, backwards: bool):
+        clauses = []
+        for index, key in enumerate(keys):
+            ties = [keys[tie].equal(values[tie]) for tie in range(index)]
+            clauses.append(and_(true(), *ties, key.after(values[index], backwards)))
+        return or_(*clauses)
+
     def paginate_response(self, response):
+        if self.is_cursor:
+            return {
+                "data": response,
+                "total_pages": self.total_pages,
+                "next_cursor": self.next_cursor,
+                "prev_cursor": self.prev_cursor,
+            }
         return {
             "data": response,
             "total_pages": self.total_pages,
@@ -0,0 +1,61 @@
+import hashlib
+
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+
+
+class Validator:
+    """ETag and Last-Modified derived from the state of a payload's source rows."""
+
+    def __init__(self, kind: str, state):
+        state = tuple(state)
+        digest = hashlib.sha256(repr((kind, state)).encode()).hexdigest()
+        self.etag = f'"{digest[:32]}"'
+        stamps = [value for value in state if isinstance(value, datetime)]
+        # Timestamps are stored as naive local time.
+        self.last_modified = (
+            max(stamps).astimezone(UTC).replace(microsecond=0) if stamps else None
+        )
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _not_modified_since(header: str, last_modified: datetime | None) -> bool:
+    if last_modified is None:
+        return False
+    try:
+        return last_modified <= parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified(
+    request: Request, response: Response, validator: Validator | None
+) -> Response | None:
+    """Set the validator headers and return a 304 if the client copy is current.
+
+    If-None-Match takes precedence over If-Modified-Since, as in RFC 9110.
+    """
+    if validator is None:
+        return None
+    response.headers["ETag"] = validator.etag
+    response.headers["Cache-Control"] = "no-cache"
+    if validator.last_modified:
+        response.headers["Last-Modified"] = format_datetime(
+            validator.last_modified, usegmt=True
+        )
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, validator.etag)
+    else:
+        fresh = _not_modified_since(
+            request.headers.get("if-modified-since"), validator.last_modified
+        )
+    if fresh:
+        return Response(status_code=304, headers=dict(response.headers))
+    return None
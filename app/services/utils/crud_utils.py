@@ -1,18 +1,20 @@
+from contextlib import contextmanager
+
 from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db.models.assessments import Assessment
 from app.db.models.common import UserCourse, UserSubject, UserUnit
 from app.db.models.enrollment import CourseEnrollment
 from app.db.models.gamification import UserStreak
-from app.db.session.session import get_db
+from app.db.session.session import session_scope
 from app.services.enum.courses import CompletionStatusEnum, PaymentStatus
 from app.services.enum.extras import AchievementRuleSet
 
 
-db = next(get_db())
-
 rule_and_model_map = {
     AchievementRuleSet.COURSE: UserCourse,
     AchievementRuleSet.SUBJECT: UserSubject,
@@ -45,12 +47,21 @@ def update_model_instance(instance: any, data: dict):
     return instance
 
 
-def get_model_instance_by_id(model: any, instance_id: int):
-    db = next(get_db())
-    return db.get(model, instance_id)
+@contextmanager
+def _use_session(db: Session | None):
+    if db is not None:
+        yield db
+        return
+    with session_scope() as session:
+        yield session
+
+
+def get_model_instance_by_id(model: any, instance_id: int, db: Session | None = None):
+    with _use_session(db) as session:
+        return session.get(model, instance_id)
 
 
-def create_model_instance(model: any, data: dict):
+def create_model_instance(model: any, data: dict, db: Session):
     try:
         model_instance = model(**data)
         db.add(model_instance)
@@ -59,7 +70,7 @@ def create_model_instance(model: any, data: dict):
         return model_instance
     except IntegrityError:
         db.rollback()
-        raise IntegrityError
+        raise
 
 
 def validate_unique_field(
@@ -74,19 +85,32 @@ def validate_unique_field(
         raise e
 
 
-def validate_instances_existence(model_id: int, model: any):
-    return db.get(model, model_id)
+async def async_validate_unique_field(
+    model: any, field: str, data: any, db: AsyncSession, instance: any
+):
+    statement = select(model).where(getattr(model, field) == data)
+    model_instance = (await db.exec(statement)).first()
+    if model_instance and (instance.id is None or model_instance.id != instance.id):
+        raise IntegrityError(f"{model} with this {field} already exists")
 
 
-def fetch_existing_order_assessments(subject_id: int, order: int):
-    return db.exec(
-        select(Assessment).where(
-            Assessment.subject_id == subject_id, Assessment.order == order
-        )
-    ).all()
+def validate_instances_existence(model_id: int, model: any, db: Session | None = None):
+    with _use_session(db) as session:
+        return session.get(model, model_id)
+
+
+def fetch_existing_order_assessments(
+    subject_id: int, order: int, db: Session | None = None
+):
+    with _use_session(db) as session:
+        return session.exec(
+            select(Assessment).where(
+                Assessment.subject_id == subject_id, Assessment.order == order
+            )
+        ).all()
 
 
-def map_model_with_type(rule_type: AchievementRuleSet, user_id: int):
+def map_model_with_type(rule_type: AchievementRuleSet, user_id: int, db: Session):
     model = rule_and_model_map[rule_type]
     model_field, count_field = user_and_model_map[model]
     model_filter_field, filter_value = filter_and_model_map[model]
@@ -99,3 +123,26 @@ def map_model_with_type(rule_type: AchievementRuleSet, user_id: int):
         )
     )
     return db.exec(statement).all(), db.exec(count_statement).first()
+
+
+def change_state_statement(*sources):
+    """Select (count, max(updated_at), sum(id)) for each ``(model, *criteria)``.
+
+    Any insert, delete or update among the matched rows changes the result,
+    which makes it a one-round-trip validator for payloads built from them.
+    """
+    columns = []
+    for model, *criteria in sources:
+        columns += [
+            select(func.count(model.id)).where(*criteria).scalar_subquery(),
+            select(func.max(model.updated_at)).where(*criteria).scalar_subquery(),
+            select(func.sum(model.id)).where(*criteria).scalar_subquery(),
+        ]
+    return select(*columns)
+
+
+def dialect_insert(model: any, db: Session):
+    """``INSERT`` into ``model`` with the session dialect's ``ON CONFLICT`` clauses."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
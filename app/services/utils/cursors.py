@@ -0,0 +1,45 @@
+import base64
+import binascii
+import json
+
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, Enum):
+        return {"enum": value.name}
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _decode_value(value):
+    if not isinstance(value, dict):
+        return value
+    if "datetime" in value:
+        return datetime.fromisoformat(value["datetime"])
+    if "date" in value:
+        return date.fromisoformat(value["date"])
+    # Enum columns bind by member name.
+    return value["enum"]
+
+
+def encode_cursor(values: list, backwards: bool = False) -> str:
+    payload = {"v": [_encode_value(value) for value in values], "b": backwards}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[list, bool]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        return [_decode_value(value) for value in payload["v"]], payload["b"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("invalid pagination cursor")
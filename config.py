@@ -9,6 +9,45 @@ class Settings(BaseSettings):
     DATABASE_USER: str
     DATABASE_PASSWORD: str
     DATABASE_HOST: str
+    DATABASE_ASYNC_DRIVER: str = "asyncpg"
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: int = 30
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_STATEMENT_TIMEOUT: int = 0
+    DATABASE_REPLICA_URLS: list[str] = []
+    DATABASE_REPLICA_MAX_LAG: float = 1.0
+    DATABASE_REPLICA_LAG_CHECK_INTERVAL: float = 5.0
+    WEB_CONCURRENCY: int = 1
+    QUERY_PROFILER_TOKEN: str = ""
+    QUERY_PROFILER_KEEP_SLOWEST: int = 5
+    QUERY_NPLUSONE_THRESHOLD: int = 0
+    QUERY_NPLUSONE_RAISE: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 500
+    SLOW_QUERY_BUFFER_SIZE: int = 200
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+    SLOW_QUERY_MAX_PARAMETER_LENGTH: int = 1000
+    SLOW_QUERY_LOG_FILE: str = ""
+    SLOW_QUERY_LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    SLOW_QUERY_LOG_BACKUP_COUNT: int = 5
+    REFERENCE_CACHE_TTL: float = 300
+    COURSE_DETAIL_CACHE_TTL: float = 600
+    # Unless CACHE_BACKEND is shared (redis), a role or account change only
+    # evicts the principal in the worker that made it; the other workers keep
+    # serving the old one for up to this many seconds.
+    PRINCIPAL_CACHE_TTL: float = 10
+    COUNT_CACHE_TTL: float = 60
+    LATEST_COURSES_CANDIDATES: int = 50
+    CACHE_BACKEND: str = "memory"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_SHARED_DIR: str = ""
+    CACHE_SHARED_CACHES: list[str] = ["reference", "course_detail"]
+    PLAYBACK_FLUSH_INTERVAL: float = 5.0
+    PLAYBACK_BUFFER_SIZE: int = 10000
+    PLAYBACK_MAX_HEARTBEAT_GAP: float = 30.0
+    PLAYBACK_COMPLETION_THRESHOLD: float = 0.9
     SECRET_KEY: str
     ALGORITHM: str
     ORIGINS: list[str] = []
@@ -28,6 +67,11 @@ class Settings(BaseSettings):
     def database_url(self) -> str:
         return f"{self.DATABASE_ENGINE}://{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}/{self.DATABASE_NAME}"
 
+    @property
+    def async_database_url(self) -> str:
+        dialect = self.DATABASE_ENGINE.split("+")[0]
+        return f"{dialect}+{self.DATABASE_ASYNC_DRIVER}://{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}/{self.DATABASE_NAME}"
+
 
 settings = Settings()
 
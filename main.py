@@ -1,9 +1,12 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 from starlette.staticfiles import StaticFiles
 
+from app.api.v1.routers.admin import admin_router
 from app.api.v1.routers.assessments import assessments_router
 from app.api.v1.routers.auth import auth_router
 from app.api.v1.routers.common import common_router
@@ -11,12 +14,27 @@ from app.api.v1.routers.courses import course_router
 from app.api.v1.routers.enrollment import enrollment_router
 from app.api.v1.routers.gamification import gamification_router
 from app.api.v1.routers.users import user_router
+from app.db.counts import setup_count_cache
+from app.db.heartbeats import heartbeat_buffer
+from app.db.profiler import setup_query_profiling
 from app.db.session.initialize import init_db
+from app.db.slow_queries import setup_slow_query_log
+from app.services.middleware.profiling import QueryProfilerMiddleware
 from config import settings
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    heartbeat_buffer.start()
+    yield
+    heartbeat_buffer.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 init_db()
+setup_query_profiling()
+setup_count_cache()
+setup_slow_query_log()
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,6 +45,7 @@ app.add_middleware(
 )
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.ALLOWED_HOSTS)
 app.add_middleware(GZipMiddleware, compresslevel=5)
+app.add_middleware(QueryProfilerMiddleware)
 
 app.include_router(auth_router)
 app.include_router(user_router)
@@ -35,5 +54,6 @@ app.include_router(common_router)
 app.include_router(enrollment_router)
 app.include_router(assessments_router)
 app.include_router(gamification_router)
+app.include_router(admin_router)
 
 app.mount("/media", StaticFiles(directory="media"), name="media")
@@ -0,0 +1,359 @@
+"""Benchmark the content completion cascade against the previous version.
+
+Seeds a scratch database with learners part-way through their course, then
+has half of them complete every content with the set-based cascade and the
+other half with the previous row-by-row version, which is kept here
+verbatim. Finally several threads complete the contents of one unit at once
+for the same learner, which must leave the unit completed::
+
+    python -m scripts.benchmark_completion
+    python -m scripts.benchmark_completion --database-url postgresql://.../scratch
+
+The database must be empty: the script creates and fills every table.
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event, func, insert
+from sqlalchemy.exc import NoResultFound
+from sqlmodel import Session, SQLModel, select
+
+from app.api.v1.schemas.common import UserContentStatusUpdate
+from app.db.crud.common import user_content_status_update
+from app.db.crud.progress import record_subject_completed, record_unit_completed
+from app.db.models.common import UserContent, UserCourse, UserSubject, UserUnit
+from app.db.models.courses import Contents, Course, Subject, Unit
+from app.db.models.users import User
+from app.services.enum.courses import CompletionStatusEnum, StatusEnum
+from app.services.utils.crud_utils import update_model_instance
+
+
+SUBJECTS, UNITS, CONTENTS = 4, 4, 5
+
+
+def previous_status_update(user_content_data: UserContentStatusUpdate, db: Session):
+    try:
+        content = db.get(Contents, user_content_data.content_id)
+        if not content:
+            raise NoResultFound(
+                f"Content with id {user_content_data.content_id} not found"
+            )
+        user_content_instance = db.exec(
+            select(UserContent).where(
+                UserContent.user_id == user_content_data.user_id,
+                UserContent.content_id == user_content_data.content_id,
+            )
+        ).first()
+        unit_instance = db.exec(select(Unit).where(Unit.id == content.unit_id)).first()
+        if not user_content_instance:
+            raise NoResultFound("User has not started this content")
+        if user_content_instance.status == CompletionStatusEnum.COMPLETED:
+            raise HTTPException(
+                status_code=400, detail="User has already completed this content!"
+            )
+        data = user_content_data.model_dump()
+        updated_user_content_instance = update_model_instance(
+            user_content_instance, data
+        )
+        updated_user_content_instance.completed_at = datetime.now()
+        db.add(updated_user_content_instance)
+        user_unit_instance = db.exec(
+            select(UserUnit).where(
+                UserUnit.user_id == user_content_data.user_id,
+                UserUnit.unit_id == content.unit_id,
+            )
+        ).first()
+        unit_contents = db.exec(
+            select(UserContent.status).where(
+                UserContent.user_id == user_content_data.user_id,
+                UserContent.content_id == user_content_data.content_id,
+            )
+        ).all()
+        course_completed = False
+        is_all_contents_completed = all(
+            item == CompletionStatusEnum.COMPLETED for item in unit_contents
+        )
+        if is_all_contents_completed:
+            unit_newly_completed = (
+                user_unit_instance.status != CompletionStatusEnum.COMPLETED
+            )
+            user_unit_instance.status = CompletionStatusEnum.COMPLETED
+            user_unit_instance.completed_at = datetime.now()
+            db.add(user_unit_instance)
+            db.flush()
+            if unit_newly_completed:
+                record_unit_completed(
+                    user_content_data.user_id, unit_instance.subject_id, db
+                )
+            user_units = db.exec(
+                select(UserUnit.status).where(
+                    UserUnit.unit_id == unit_instance.id,
+                    UserUnit.user_id == user_content_data.user_id,
+                )
+            ).all()
+            is_all_units_completed = all(
+                user_unit == CompletionStatusEnum.COMPLETED for user_unit in user_units
+            )
+            if is_all_units_completed:
+                subject_instance = db.exec(
+                    select(Subject).where(
+                        Subject.id == unit_instance.subject_id,
+                        Subject.status == StatusEnum.PUBLISHED,
+                    )
+                ).first()
+                user_subject_instance = db.exec(
+                    select(UserSubject).where(
+                        UserSubject.subject_id == subject_instance.id,
+                        UserSubject.user_id == user_content_data.user_id,
+                    )
+                ).first()
+                subject_newly_completed = (
+                    user_subject_instance.status != CompletionStatusEnum.COMPLETED
+                )
+                user_subject_instance.status = CompletionStatusEnum.COMPLETED
+                user_subject_instance.completed_at = datetime.now()
+                db.add(user_subject_instance)
+                db.flush()
+                if subject_newly_completed:
+                    record_subject_completed(
+                        user_content_data.user_id, subject_instance.course_id, db
+                    )
+                user_subjects = db.exec(
+                    select(UserSubject.status).where(
+                        UserSubject.subject_id == subject_instance.id
+                    )
+                ).all()
+                is_all_subjects_completed = all(
+                    user_subject == CompletionStatusEnum.COMPLETED
+                    for user_subject in user_subjects
+                )
+                if is_all_subjects_completed:
+                    user_course = db.exec(
+                        select(UserCourse).where(
+                            UserCourse.course_id == subject_instance.course_id
+                        )
+                    ).first()
+                    user_course.status = CompletionStatusEnum.COMPLETED
+                    user_course.completed_at = datetime.now()
+                    course_completed = True
+                    db.add(user_course)
+                    db.flush()
+        db.commit()
+        db.refresh(updated_user_content_instance)
+        return True, course_completed
+    except Exception as e:
+        db.rollback()
+        raise e
+
+
+def seed(engine, courses: int, users: int) -> dict[int, list[int]]:
+    """Enrol every user in one course; return their contents in course order."""
+    now = datetime.now()
+    stamps = {"created_at": now, "updated_at": now}
+    with engine.begin() as connection:
+        connection.execute(
+            insert(User),
+            [
+                {
+                    "username": f"user{index}",
+                    "email": f"user{index}@example.com",
+                    "password": "x",
+                    "is_superuser": False,
+                    "is_active": True,
+                    **stamps,
+                }
+                for index in range(users)
+            ],
+        )
+        connection.execute(
+            insert(Course),
+            [
+                {"title": f"Course {index}", "status": "PUBLISHED", **stamps}
+                for index in range(courses)
+            ],
+        )
+        connection.execute(
+            insert(Subject),
+            [
+                {
+                    "title": f"Subject {order}",
+                    "course_id": course,
+                    "order": order,
+                    "status": "PUBLISHED",
+                    "completion_time": 0,
+                    **stamps,
+                }
+                for course in range(1, courses + 1)
+                for order in range(SUBJECTS)
+            ],
+        )
+        connection.execute(
+            insert(Unit),
+            [
+                {
+                    "title": f"Unit {order}",
+                    "subject_id": subject,
+                    "order": order,
+                    "status": "PUBLISHED",
+                    **stamps,
+                }
+                for subject in range(1, courses * SUBJECTS + 1)
+                for order in range(UNITS)
+            ],
+        )
+        connection.execute(
+            insert(Contents),
+            [
+                {
+                    "title": f"Content {order}",
+                    "unit_id": unit,
+                    "order": order,
+                    "status": "PUBLISHED",
+                    "content_type": "TEXT",
+                    "completion_time": 0,
+                    **stamps,
+                }
+                for unit in range(1, courses * SUBJECTS * UNITS + 1)
+                for order in range(CONTENTS)
+            ],
+        )
+
+    with Session(engine) as db:
+        tree = db.exec(
+            select(Subject.course_id, Subject.id, Unit.id, Contents.id)
+            .join(Unit, Unit.subject_id == Subject.id)
+            .join(Contents, Contents.unit_id == Unit.id)
+            .order_by(Subject.id, Unit.id, Contents.id)
+        ).all()
+    by_course = {}
+    for course_id, subject_id, unit_id, content_id in tree:
+        by_course.setdefault(course_id, []).append((subject_id, unit_id, content_id))
+
+    plan = {}
+    rows = {UserCourse: [], UserSubject: [], UserUnit: [], UserContent: []}
+    for user_id in range(1, users + 1):
+        course_id = (user_id - 1) % courses + 1
+        nodes = by_course[course_id]
+        plan[user_id] = [content_id for _, _, content_id in nodes]
+        started = {"user_id": user_id, "started_at": now, "expected_completion_time": 0}
+        rows[UserCourse].append(started | {"course_id": course_id, **stamps})
+        rows[UserSubject].extend(
+            started | {"subject_id": subject_id, "status": "IN_PROGRESS"}
+            for subject_id in dict.fromkeys(subject for subject, _, _ in nodes)
+        )
+        rows[UserUnit].extend(
+            started | {"unit_id": unit_id, "status": "IN_PROGRESS"}
+            for unit_id in dict.fromkeys(unit for _, unit, _ in nodes)
+        )
+        rows[UserContent].extend(
+            started | {"content_id": content_id, "status": "IN_PROGRESS"}
+            for content_id in plan[user_id]
+        )
+    with engine.begin() as connection:
+        for model, values in rows.items():
+            connection.execute(insert(model), values)
+    return plan
+
+
+def run(engine, statements: list[int], cascade, users: dict[int, list[int]]):
+    samples, counts = [], []
+    for user_id, content_ids in users.items():
+        for content_id in content_ids:
+            before = statements[0]
+            started = time.perf_counter()
+            with Session(engine) as db:
+                cascade(
+                    UserContentStatusUpdate(
+                        user_id=user_id,
+                        content_id=content_id,
+                        status=CompletionStatusEnum.COMPLETED,
+                    ),
+                    db,
+                )
+            samples.append((time.perf_counter() - started) * 1000)
+            counts.append(statements[0] - before)
+    return samples, counts
+
+
+def completed_courses(engine, user_ids) -> int:
+    with Session(engine) as db:
+        return db.exec(
+            select(func.count()).where(
+                UserCourse.user_id.in_(user_ids),
+                UserCourse.status == CompletionStatusEnum.COMPLETED,
+            )
+        ).one()
+
+
+def check_concurrent(engine, user_id: int, content_ids: list[int]) -> bool:
+    """Complete a unit's contents all at once; the unit must end up completed."""
+    unit = content_ids[:CONTENTS]
+    with ThreadPoolExecutor(len(unit)) as pool:
+        list(
+            pool.map(
+                lambda content_id: run(
+                    engine, [0], user_content_status_update, {user_id: [content_id]}
+                ),
+                unit,
+            )
+        )
+    with Session(engine) as db:
+        unit_id = db.get(Contents, unit[0]).unit_id
+        return (
+            db.get(UserUnit, (user_id, unit_id)).status
+            == CompletionStatusEnum.COMPLETED
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url")
+    parser.add_argument("--courses", type=int, default=20)
+    parser.add_argument("--users", type=int, default=40)
+    args = parser.parse_args()
+
+    url = args.database_url
+    if url is None:
+        url = f"sqlite:///{tempfile.mkdtemp()}/benchmark.sqlite3"
+    engine = create_engine(url)
+    SQLModel.metadata.create_all(engine)
+    plan = seed(engine, args.courses, args.users + 1)
+    statements = [0]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(*_):
+        statements[0] += 1
+
+    racer_id = max(plan)
+    racer = plan.pop(racer_id)
+    half = len(plan) // 2
+    groups = {
+        "previous": (previous_status_update, dict(list(plan.items())[:half])),
+        "set-based": (user_content_status_update, dict(list(plan.items())[half:])),
+    }
+    print(f"{engine.dialect.name}: {len(plan)} learners, {len(racer)} contents each")
+    print(
+        f"{'cascade':<12}{'median ms':>10}{'p95 ms':>10}"
+        f"{'statements':>12}{'courses done':>14}"
+    )
+    for label, (cascade, users) in groups.items():
+        samples, counts = run(engine, statements, cascade, users)
+        print(
+            f"{label:<12}{statistics.median(samples):>10.3f}"
+            f"{statistics.quantiles(samples, n=20)[-1]:>10.3f}"
+            f"{statistics.mean(counts):>12.1f}"
+            f"{completed_courses(engine, users):>9}/{len(users)}"
+        )
+    concurrent = check_concurrent(engine, racer_id, racer)
+    print(f"concurrent completions of one unit: {'ok' if concurrent else 'LOST'}")
+
+
+if __name__ == "__main__":
+    main()
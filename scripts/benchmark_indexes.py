@@ -0,0 +1,293 @@
+"""Benchmark the hot lookup queries with and without the composite indexes.
+
+Builds the schema on a scratch database, seeds it, then times each lookup
+before and after creating the indexes added in revision ac280c3a5b83::
+
+    python -m scripts.benchmark_indexes
+    python -m scripts.benchmark_indexes --database-url postgresql://.../scratch
+
+The database must be empty: the script creates and fills every table.
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert, text
+from sqlmodel import SQLModel
+
+from app.db.models.assessments import Assessment, AssessmentType
+from app.db.models.common import UserContent
+from app.db.models.courses import Contents, Course, Subject, Unit
+from app.db.models.enrollment import CourseEnrollment
+from app.db.models.gamification import StreakType, UserStreak
+from app.db.models.users import User
+
+
+HOT_INDEXES = {
+    "ix_subjects_course_id_order",
+    "ix_subjects_published_course_id_order",
+    "ix_units_subject_id_order",
+    "ix_contents_unit_id_order",
+    "ix_assessments_subject_id_order",
+    "ix_course_enrollments_user_id_course_id_status",
+    "ix_user_contents_user_id_status",
+    "ix_user_streaks_streak_by_id_streak_type_id",
+}
+
+# (label, statement, parameter factory)
+LOOKUPS = [
+    (
+        "published subjects of a course",
+        "SELECT * FROM subjects WHERE course_id = :id AND status = 'PUBLISHED' ORDER BY \"order\"",
+        lambda size: {"id": random.randint(1, size["courses"])},
+    ),
+    (
+        "units of a subject",
+        'SELECT * FROM units WHERE subject_id = :id ORDER BY "order"',
+        lambda size: {"id": random.randint(1, size["subjects"])},
+    ),
+    (
+        "contents of a unit",
+        'SELECT * FROM contents WHERE unit_id = :id ORDER BY "order"',
+        lambda size: {"id": random.randint(1, size["units"])},
+    ),
+    (
+        "assessments of a subject",
+        'SELECT * FROM assessments WHERE subject_id = :id ORDER BY "order"',
+        lambda size: {"id": random.randint(1, size["subjects"])},
+    ),
+    (
+        "paid enrollment of a user",
+        "SELECT id FROM course_enrollments WHERE user_id = :user AND course_id = :course AND status = 'PAID'",
+        lambda size: {
+            "user": random.randint(1, size["users"]),
+            "course": random.randint(1, size["courses"]),
+        },
+    ),
+    (
+        "completed contents of a user",
+        "SELECT count(*) FROM user_contents WHERE user_id = :user AND status = 'COMPLETED'",
+        lambda size: {"user": random.randint(1, size["users"])},
+    ),
+    (
+        "streak of a user",
+        "SELECT * FROM user_streaks WHERE streak_by_id = :user AND streak_type_id = :type",
+        lambda size: {"user": random.randint(1, size["users"]), "type": 1},
+    ),
+]
+
+
+def seed(engine, courses: int, users: int):
+    now = datetime.now()
+    stamps = {"created_at": now, "updated_at": now}
+    statuses = ["PUBLISHED", "PUBLISHED", "PUBLISHED", "DRAFT"]
+    size = {"courses": courses, "users": users}
+    with engine.begin() as connection:
+        connection.execute(
+            insert(User),
+            [
+                {
+                    "username": f"user{index}",
+                    "email": f"user{index}@example.com",
+                    "password": "x",
+                    "is_superuser": False,
+                    "is_active": True,
+                    **stamps,
+                }
+                for index in range(users)
+            ],
+        )
+        connection.execute(
+            insert(Course),
+            [
+                {"title": f"Course {index}", "status": "PUBLISHED", **stamps}
+                for index in range(courses)
+            ],
+        )
+        subjects = [
+            {
+                "title": f"Subject {order}",
+                "course_id": course,
+                "order": order,
+                "status": statuses[order % 4],
+                "completion_time": 0,
+                **stamps,
+            }
+            for course in range(1, courses + 1)
+            for order in range(10)
+        ]
+        connection.execute(insert(Subject), subjects)
+        size["subjects"] = len(subjects)
+        units = [
+            {
+                "title": f"Unit {order}",
+                "subject_id": subject,
+                "order": order,
+                "status": "PUBLISHED",
+                **stamps,
+            }
+            for subject in range(1, size["subjects"] + 1)
+            for order in range(8)
+        ]
+        connection.execute(insert(Unit), units)
+        size["units"] = len(units)
+        connection.execute(
+            insert(Contents),
+            [
+                {
+                    "title": f"Content {order}",
+                    "unit_id": unit,
+                    "order": order,
+                    "status": "PUBLISHED",
+                    "content_type": "TEXT",
+                    "completion_time": 0,
+                    **stamps,
+                }
+                for unit in range(1, size["units"] + 1)
+                for order in range(5)
+            ],
+        )
+        connection.execute(
+            insert(AssessmentType),
+            [{"title": "Quiz", "icon": "quiz", "description": "Quiz", **stamps}],
+        )
+        connection.execute(
+            insert(Assessment),
+            [
+                {
+                    "title": f"Assessment {order}",
+                    "assessment_type_id": 1,
+                    "subject_id": subject,
+                    "order": order,
+                    "max_points": 10,
+                    "pass_points": 5,
+                    **stamps,
+                }
+                for subject in range(1, size["subjects"] + 1)
+                for order in range(3)
+            ],
+        )
+        enrollments = {
+            (user, random.randint(1, courses))
+            for user in range(1, users + 1)
+            for _ in range(4)
+        }
+        connection.execute(
+            insert(CourseEnrollment),
+            [
+                {
+                    "user_id": user,
+                    "course_id": course,
+                    "status": random.choice(["PAID", "PAID", "PENDING"]),
+                    "provider": "STRIPE",
+                    "currency": "USD",
+                    **stamps,
+                }
+                for user, course in enrollments
+            ],
+        )
+        connection.execute(
+            insert(UserContent),
+            [
+                {
+                    "user_id": user,
+                    "content_id": content,
+                    "status": random.choice(["COMPLETED", "IN_PROGRESS"]),
+                    "expected_completion_time": 0,
+                    "started_at": now,
+                }
+                for user in range(1, users + 1)
+                for content in random.sample(range(1, size["units"] * 5 + 1), 40)
+            ],
+        )
+        connection.execute(
+            insert(StreakType),
+            [{"title": title, "is_active": True} for title in ("Login", "Lesson")],
+        )
+        connection.execute(
+            insert(UserStreak),
+            [
+                {
+                    "streak_by_id": user,
+                    "streak_type_id": streak_type,
+                    "current_streak": 1,
+                    "longest_streak": 1,
+                }
+                for user in range(1, users + 1)
+                for streak_type in (1, 2)
+            ],
+        )
+    return size
+
+
+def hot_indexes():
+    return [
+        index
+        for table in SQLModel.metadata.sorted_tables
+        for index in table.indexes
+        if index.name in HOT_INDEXES
+    ]
+
+
+def analyze(engine):
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+
+
+def time_lookups(engine, size: dict, repeat: int) -> dict:
+    timings = {}
+    with engine.connect() as connection:
+        for label, statement, parameters in LOOKUPS:
+            statement = text(statement)
+            samples = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                connection.execute(statement, parameters(size)).all()
+                samples.append((time.perf_counter() - started) * 1000)
+            timings[label] = statistics.median(samples)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url")
+    parser.add_argument("--courses", type=int, default=200)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+    random.seed(0)
+
+    url = args.database_url
+    if url is None:
+        url = f"sqlite:///{tempfile.mkdtemp()}/benchmark.sqlite3"
+    engine = create_engine(url)
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for index in hot_indexes():
+            index.drop(connection)
+    size = seed(engine, args.courses, args.users)
+    print(f"{engine.dialect.name}: " + ", ".join(f"{v} {k}" for k, v in size.items()))
+
+    analyze(engine)
+    before = time_lookups(engine, size, args.repeat)
+    with engine.begin() as connection:
+        for index in hot_indexes():
+            index.create(connection)
+    analyze(engine)
+    after = time_lookups(engine, size, args.repeat)
+
+    print(f"{'lookup (median ms)':<32}{'before':>10}{'after':>10}{'speedup':>10}")
+    for label, _, _ in LOOKUPS:
+        print(
+            f"{label:<32}{before[label]:>10.3f}{after[label]:>10.3f}"
+            f"{before[label] / after[label]:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Rebuild the stored course-tree snapshots from the catalog tables.
+
+Writers keep snapshots current, so this is only needed after migrating, or
+after changing catalog rows outside the API::
+
+    python -m scripts.rebuild_course_snapshots
+    python -m scripts.rebuild_course_snapshots --course-id 3 --course-id 7
+"""
+
+import argparse
+
+from app.db.crud.snapshots import rebuild_all_course_snapshots, refresh_course_snapshots
+from app.db.session.session import session_scope
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--course-id", type=int, action="append", dest="course_ids")
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    with session_scope() as db:
+        if args.course_ids:
+            refresh_course_snapshots(args.course_ids, db)
+            db.commit()
+            rebuilt = len(args.course_ids)
+        else:
+            rebuilt = rebuild_all_course_snapshots(db, args.batch_size)
+    print(f"Rebuilt {rebuilt} course snapshot(s)")
+
+
+if __name__ == "__main__":
+    main()
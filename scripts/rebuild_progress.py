@@ -0,0 +1,28 @@
+"""Recount the progress rollups from the raw UserUnit/UserSubject rows.
+
+Completing content keeps the rollups current, so this is only needed after
+migrating, or when progress rows were changed outside that path::
+
+    python -m scripts.rebuild_progress
+    python -m scripts.rebuild_progress --user-id 3 --user-id 7
+"""
+
+import argparse
+
+from app.db.crud.progress import rebuild_progress
+from app.db.session.session import session_scope
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user-id", type=int, action="append", dest="user_ids")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    with session_scope() as db:
+        rebuilt = rebuild_progress(db, args.user_ids, args.batch_size)
+    print(f"Rebuilt progress of {rebuilt} user(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import os
+import tempfile
+
+import pytest
+
+
+TEST_ENVIRONMENT = {
+    "DATABASE_ENGINE": "postgresql",
+    "DATABASE_NAME": "e_learning_test",
+    "DATABASE_USER": "test",
+    "DATABASE_PASSWORD": "test",
+    "DATABASE_HOST": "localhost",
+    "SECRET_KEY": "test-secret-key",
+    "ALGORITHM": "HS256",
+    "API_DOMAIN": "http://testserver/",
+    "ALLOWED_HOSTS": '["testserver"]',
+    "STRIPE_PUBLISHABLE_KEY": "pk_test",
+    "STRIPE_SECRET_KEY": "sk_test",
+    "STRIPE_WEBHOOK_SECRET": "whsec_test",
+    "QUERY_PROFILER_TOKEN": "test-profiler-token",
+    # Any statement repeated more than three times in one request fails it.
+    "QUERY_NPLUSONE_THRESHOLD": "3",
+    "QUERY_NPLUSONE_RAISE": "true",
+    # Tests flush the heartbeat buffer themselves.
+    "PLAYBACK_FLUSH_INTERVAL": "3600",
+}
+for key, value in TEST_ENVIRONMENT.items():
+    os.environ.setdefault(key, value)
+
+# Settings are read at import time, so the application is imported only once
+# the environment above is in place.
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
+from sqlmodel import Session, SQLModel  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+from app.db.crud.progress import rebuild_progress  # noqa: E402
+from app.db.crud.snapshots import rebuild_all_course_snapshots  # noqa: E402
+from app.db.session import session as session_module  # noqa: E402
+from app.db.session.session import get_async_db, get_db, get_read_db  # noqa: E402
+from app.services.cache.backends import RedisBackend  # noqa: E402
+from app.services.cache.memory import caches  # noqa: E402
+from app.services.cache.shared_memory import SharedMemoryBackend  # noqa: E402
+from main import app  # noqa: E402
+from tests.fake_redis import FakeRedis  # noqa: E402
+from tests.seed import seed_database  # noqa: E402
+from tests.utils import RowCountingConnection  # noqa: E402
+
+
+# TEST_CACHE_BACKEND=redis runs the suite with every cache on RedisBackend,
+# backed by an in-memory stand-in for the server, and =shared on
+# SharedMemoryBackend in a temporary directory.
+if os.environ.get("TEST_CACHE_BACKEND") == "redis":
+    for cache in caches:
+        cache.backend = RedisBackend(FakeRedis(), cache.name)
+elif os.environ.get("TEST_CACHE_BACKEND") == "shared":
+    shared_directory = tempfile.mkdtemp(prefix="cache-")
+    for cache in caches:
+        cache.backend = SharedMemoryBackend(os.path.join(shared_directory, cache.name))
+
+
+class SeededDatabase:
+    """A seeded SQLite file shared by a sync and an async engine."""
+
+    def __init__(self, path):
+        connect_args = {"factory": RowCountingConnection, "check_same_thread": False}
+        self.engine = create_engine(f"sqlite:///{path}", connect_args=connect_args)
+        # NullPool: aiosqlite connections run on their own threads and must not
+        # outlive the event loop of the request that opened them.
+        self.async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{path}",
+            connect_args=connect_args,
+            poolclass=NullPool,
+        )
+        SQLModel.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            self.ids = seed_database(session)
+            rebuild_all_course_snapshots(session)
+            rebuild_progress(session)
+
+    def dispose(self):
+        self.engine.dispose()
+
+
+def build_client(database: SeededDatabase, monkeypatch) -> TestClient:
+    def override_get_db():
+        with Session(database.engine) as session:
+            yield session
+
+    async def override_get_async_db():
+        async with AsyncSession(
+            database.async_engine, expire_on_commit=False
+        ) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # Schema validators look rows up through session_scope().
+    monkeypatch.setattr(session_module, "engine", database.engine)
+    # Cached data belongs to whichever database filled it.
+    for cache in caches:
+        cache.clear()
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def database(tmp_path_factory):
+    database = SeededDatabase(tmp_path_factory.mktemp("db") / "catalog.sqlite3")
+    yield database
+    database.dispose()
+
+
+@pytest.fixture
+def fresh_database(tmp_path):
+    """A private copy of the dataset for tests that write."""
+    database = SeededDatabase(tmp_path / "catalog.sqlite3")
+    yield database
+    database.dispose()
+
+
+@pytest.fixture
+def client(database, monkeypatch):
+    with build_client(database, monkeypatch) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def fresh_client(fresh_database, monkeypatch):
+    with build_client(fresh_database, monkeypatch) as client:
+        yield client
+    app.dependency_overrides.clear()
@@ -0,0 +1,119 @@
+import fnmatch
+import time
+
+
+def _bytes(value) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
+
+
+class FakeRedis:
+    """The subset of redis.Redis that RedisBackend uses, kept in a dict.
+
+    Values come back as bytes and keys expire like in Redis; ``calls``
+    counts round trips, with a pipeline counting as one.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self._data: dict[str, object] = {}
+        self._expires: dict[str, float] = {}
+
+    def _alive(self, name: str) -> bool:
+        expires_at = self._expires.get(name)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._data.pop(name, None)
+            self._expires.pop(name, None)
+        return name in self._data
+
+    def _call(self, command: str, *args, **kwargs):
+        self.calls += 1
+        return getattr(self, f"_{command}")(*args, **kwargs)
+
+    def _mget(self, names):
+        return [self._data[name] if self._alive(name) else None for name in names]
+
+    def _set(self, name, value, px=None, nx=False):
+        if nx and self._alive(name):
+            return None
+        self._data[name] = _bytes(value)
+        self._expires.pop(name, None)
+        if px is not None:
+            self._expires[name] = time.monotonic() + px / 1000
+        return True
+
+    def _delete(self, *names):
+        removed = 0
+        for name in names:
+            name = name.decode() if isinstance(name, bytes) else name
+            removed += self._alive(name)
+            self._data.pop(name, None)
+            self._expires.pop(name, None)
+        return removed
+
+    def _sadd(self, name, *values):
+        if not self._alive(name):
+            self._data[name] = set()
+        members = self._data[name]
+        before = len(members)
+        members.update(_bytes(value) for value in values)
+        return len(members) - before
+
+    def _smembers(self, name):
+        return set(self._data[name]) if self._alive(name) else set()
+
+    def _pexpire(self, name, milliseconds):
+        if not self._alive(name):
+            return False
+        self._expires[name] = time.monotonic() + milliseconds / 1000
+        return True
+
+    def _incr(self, name):
+        value = int(self._data[name]) + 1 if self._alive(name) else 1
+        self._data[name] = _bytes(value)
+        return value
+
+    def mget(self, names):
+        return self._call("mget", names)
+
+    def set(self, name, value, px=None, nx=False):
+        return self._call("set", name, value, px=px, nx=nx)
+
+    def delete(self, *names):
+        return self._call("delete", *names)
+
+    def incr(self, name):
+        return self._call("incr", name)
+
+    def scan_iter(self, match="*", count=None):
+        self.calls += 1
+        return [
+            name
+            for name in list(self._data)
+            if self._alive(name) and fnmatch.fnmatchcase(name, match)
+        ]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, command):
+        def queue(*args, **kwargs):
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        self.client.calls += 1
+        commands, self.commands = self.commands, []
+        return [
+            getattr(self.client, f"_{command}")(*args, **kwargs)
+            for command, args, kwargs in commands
+        ]
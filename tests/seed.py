@@ -0,0 +1,376 @@
+from datetime import date, datetime, timedelta
+
+from sqlmodel import Session
+
+from app.db.models.assessments import (
+    Assessment,
+    AssessmentType,
+    Options,
+    Question,
+    StudentAssessmentSession,
+)
+from app.db.models.common import UserContent, UserCourse, UserSubject, UserUnit
+from app.db.models.courses import (
+    Category,
+    CategoryCourseLink,
+    Contents,
+    ContentVideoTimeStamp,
+    Course,
+    CourseRating,
+    Subject,
+    Unit,
+)
+from app.db.models.enrollment import CourseEnrollment
+from app.db.models.gamification import (
+    Achievements,
+    StreakType,
+    UserAchievements,
+    UserStreak,
+)
+from app.db.models.users import Profile, User
+from app.services.auth.hash import get_password_hash
+from app.services.enum.courses import (
+    CompletionStatusEnum,
+    ContentTypeEnum,
+    LevelEnum,
+    PaymentStatus,
+    StatusEnum,
+)
+from app.services.enum.extras import AchievementRuleSet
+from app.services.enum.users import UserGender, UserRole
+
+
+PASSWORD = "password"
+
+COURSES = 4
+SUBJECTS_PER_COURSE = 4
+UNITS_PER_SUBJECT = 3
+CONTENTS_PER_UNIT = 3
+TUTORS = 2
+STUDENTS = 8
+
+
+def _user(db: Session, username: str, role: UserRole, password: str, **kwargs):
+    user = User(
+        username=username,
+        email=f"{username}@example.com",
+        password=password,
+        last_login=datetime.now() - timedelta(days=1),
+        **kwargs,
+    )
+    db.add(user)
+    db.flush()
+    db.add(
+        Profile(
+            user_id=user.id,
+            name=username.title(),
+            gender=UserGender.OTHER,
+            dob=date(2000, 1, 1),
+            role=role,
+        )
+    )
+    return user
+
+
+def seed_database(db: Session) -> dict:
+    """Build a small but realistic catalog with enrollments and progress.
+
+    Returns the ids the tests address endpoints with.
+    """
+    password = get_password_hash(PASSWORD)
+    admin = _user(db, "admin", UserRole.ADMIN, password, is_superuser=True)
+    tutors = [
+        _user(db, f"tutor{index}", UserRole.TUTOR, password) for index in range(TUTORS)
+    ]
+    students = [
+        _user(db, f"student{index}", UserRole.STUDENT, password)
+        for index in range(STUDENTS)
+    ]
+
+    categories = [Category(title=title) for title in ("Backend", "Frontend", "Data")]
+    db.add_all(categories)
+
+    courses, subjects, units, contents = [], [], [], []
+    for course_index in range(COURSES):
+        course = Course(
+            title=f"Course {course_index}",
+            price=49.0 + course_index,
+            completion_time=600,
+            instructor_id=tutors[course_index % TUTORS].id,
+            description="Course description",
+            requirements="Requirements",
+            objectives="Objectives",
+            level=LevelEnum.BEGINNER,
+            status=(
+                StatusEnum.PUBLISHED if course_index < COURSES - 1 else StatusEnum.DRAFT
+            ),
+        )
+        db.add(course)
+        db.flush()
+        courses.append(course)
+        for subject_order in range(1, SUBJECTS_PER_COURSE + 1):
+            subject = Subject(
+                title=f"Subject {course_index}.{subject_order}",
+                completion_time=120,
+                course_id=course.id,
+                order=subject_order,
+                status=(
+                    StatusEnum.PUBLISHED
+                    if subject_order < SUBJECTS_PER_COURSE
+                    else StatusEnum.DRAFT
+                ),
+                description="Subject description",
+                objectives="Objectives",
+            )
+            db.add(subject)
+            db.flush()
+            subjects.append(subject)
+            for unit_order in range(1, UNITS_PER_SUBJECT + 1):
+                unit = Unit(
+                    title=f"Unit {subject.title}.{unit_order}",
+                    completion_time=40,
+                    subject_id=subject.id,
+                    order=unit_order,
+                    status=StatusEnum.PUBLISHED,
+                    description="Unit description",
+                    objectives="Objectives",
+                )
+                db.add(unit)
+                db.flush()
+                units.append(unit)
+                for content_order in range(1, CONTENTS_PER_UNIT + 1):
+                    is_video = content_order == 1
+                    content = Contents(
+                        title=f"Content {unit.title}.{content_order}",
+                        description="Content description",
+                        file_url=(
+                            "media/courses/content/video.mp4" if is_video else None
+                        ),
+                        content_type=(
+                            ContentTypeEnum.VIDEO if is_video else ContentTypeEnum.TEXT
+                        ),
+                        completion_time=10,
+                        unit_id=unit.id,
+                        order=content_order,
+                        status=StatusEnum.PUBLISHED,
+                    )
+                    db.add(content)
+                    db.flush()
+                    contents.append(content)
+                    if is_video:
+                        db.add_all(
+                            ContentVideoTimeStamp(
+                                title=f"Chapter {chapter}",
+                                content_id=content.id,
+                                time_stamp=chapter * 60,
+                            )
+                            for chapter in range(2)
+                        )
+    db.flush()
+    db.add_all(
+        CategoryCourseLink(
+            course_id=course.id, category_id=categories[index % len(categories)].id
+        )
+        for index, course in enumerate(courses)
+    )
+
+    published_courses = courses[:-1]
+    for student_index, student in enumerate(students):
+        for course in published_courses[: 1 + student_index % 2]:
+            db.add(
+                CourseEnrollment(
+                    user_id=student.id,
+                    course_id=course.id,
+                    status=PaymentStatus.PAID,
+                    amount=int(course.price * 100),
+                    provider_metadata={},
+                )
+            )
+            db.add(UserCourse(user_id=student.id, course_id=course.id))
+            db.add(
+                CourseRating(
+                    course_id=course.id,
+                    user_id=student.id,
+                    rating=3 + student_index % 3,
+                    remarks="Good",
+                )
+            )
+    db.add(
+        CourseEnrollment(
+            user_id=students[0].id,
+            course_id=published_courses[-1].id,
+            status=PaymentStatus.PENDING,
+            provider_metadata={},
+        )
+    )
+
+    # The first student is midway through the first course: its first subject
+    # is complete and the second one is in progress.
+    learner = students[0]
+    first_course_subjects = [
+        subject for subject in subjects if subject.course_id == courses[0].id
+    ]
+    completed_at = datetime.now() - timedelta(hours=1)
+    for subject_index, subject in enumerate(first_course_subjects[:2]):
+        subject_done = subject_index == 0
+        db.add(
+            UserSubject(
+                user_id=learner.id,
+                subject_id=subject.id,
+                status=(
+                    CompletionStatusEnum.COMPLETED
+                    if subject_done
+                    else CompletionStatusEnum.IN_PROGRESS
+                ),
+                completed_at=completed_at if subject_done else None,
+            )
+        )
+        for unit in (unit for unit in units if unit.subject_id == subject.id):
+            unit_done = subject_done or unit.order == 1
+            db.add(
+                UserUnit(
+                    user_id=learner.id,
+                    unit_id=unit.id,
+                    status=(
+                        CompletionStatusEnum.COMPLETED
+                        if unit_done
+                        else CompletionStatusEnum.IN_PROGRESS
+                    ),
+                    completed_at=completed_at if unit_done else None,
+                )
+            )
+            db.add_all(
+                UserContent(
+                    user_id=learner.id,
+                    content_id=content.id,
+                    status=CompletionStatusEnum.COMPLETED,
+                    completed_at=completed_at,
+                )
+                for content in contents
+                if content.unit_id == unit.id and unit_done
+            )
+
+    assessment_types = [
+        AssessmentType(title=title, icon="icon", description=f"{title} assessment")
+        for title in ("Quiz", "Exam")
+    ]
+    db.add_all(assessment_types)
+    db.flush()
+    assessments = []
+    for index, subject in enumerate(subjects):
+        assessment = Assessment(
+            title=f"Assessment {subject.title}",
+            assessment_type_id=assessment_types[index % 2].id,
+            order=1,
+            max_points=10,
+            pass_points=5,
+            subject_id=subject.id,
+            description="Assessment description",
+        )
+        db.add(assessment)
+        db.flush()
+        assessments.append(assessment)
+        for question_order in range(2):
+            question = Question(
+                assessment_id=assessment.id,
+                order=question_order,
+                question=f"Question {question_order}?",
+            )
+            db.add(question)
+            db.flush()
+            db.add_all(
+                Options(
+                    question_id=question.id,
+                    text=f"Option {option}",
+                    is_correct=option == 0,
+                )
+                for option in range(3)
+            )
+    db.add(
+        StudentAssessmentSession(
+            student_id=learner.id, assessment_id=assessments[0].id, score=8.0
+        )
+    )
+
+    streak_types = [
+        StreakType(title=title, description=f"{title} streak")
+        for title in ("Daily login", "Daily lesson")
+    ]
+    db.add_all(streak_types)
+    db.flush()
+    achievements = [
+        Achievements(
+            title="First course",
+            icon="trophy",
+            description="Complete a course",
+            rule_type=AchievementRuleSet.COURSE,
+            threshold=1,
+        ),
+        Achievements(
+            title="Week streak",
+            icon="fire",
+            description="Keep a seven day streak",
+            rule_type=AchievementRuleSet.STREAK,
+            threshold=7,
+            streak_type_id=streak_types[0].id,
+        ),
+        Achievements(
+            title="Enrolled",
+            icon="star",
+            description="Enroll in a course",
+            rule_type=AchievementRuleSet.ENROLLMENT,
+            threshold=1,
+        ),
+    ]
+    db.add_all(achievements)
+    db.flush()
+    for student in students:
+        db.add(
+            UserStreak(
+                streak_by_id=student.id,
+                streak_type_id=streak_types[0].id,
+                current_streak=3,
+                longest_streak=5,
+                last_action=datetime.now(),
+            )
+        )
+    db.add(
+        UserAchievements(
+            achieved_by_id=learner.id,
+            achievement_type_id=achievements[2].id,
+            achieved_at=datetime.now(),
+        )
+    )
+    db.commit()
+
+    first_subject = first_course_subjects[0]
+    first_unit = next(unit for unit in units if unit.subject_id == first_subject.id)
+    next_content = next(
+        content
+        for content in contents
+        if content.unit_id
+        == next(
+            unit.id
+            for unit in units
+            if unit.subject_id == first_course_subjects[1].id and unit.order == 2
+        )
+    )
+    return {
+        "admin": admin.username,
+        "tutor": tutors[0].username,
+        "student": learner.username,
+        "student_id": learner.id,
+        "course_id": courses[0].id,
+        "subject_id": first_subject.id,
+        "unit_id": first_unit.id,
+        "content_id": next(
+            content.id for content in contents if content.unit_id == first_unit.id
+        ),
+        "next_content_id": next_content.id,
+        "next_unit_id": next_content.unit_id,
+        "assessment_type_id": assessment_types[0].id,
+        "assessment_id": assessments[0].id,
+        "question_id": 1,
+        "streak_type_id": streak_types[0].id,
+        "achievement_id": achievements[0].id,
+    }
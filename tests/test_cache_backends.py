@@ -0,0 +1,208 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+import redis
+
+from app.services.cache.backends import CacheBackend, LRUBackend, RedisBackend
+from app.services.cache.memory import TTLCache
+from app.services.cache.shared_memory import SharedMemoryBackend
+from tests.fake_redis import FakeRedis
+from tests.utils import auth_headers
+
+
+@pytest.fixture(params=["lru", "redis", "shared"])
+def cache(request, tmp_path):
+    if request.param == "lru":
+        backend = LRUBackend(max_entries=100)
+    elif request.param == "redis":
+        backend = RedisBackend(FakeRedis(), "test")
+    else:
+        backend = SharedMemoryBackend(str(tmp_path))
+    return TTLCache("test", ttl=60, backend=backend)
+
+
+def test_get_many_set_many_and_delete(cache):
+    cache.set_many({"a:1": 1, "a:2": None, "b:1": [1, 2]})
+    cache.delete("a:1")
+
+    assert cache.get_many(["a:1", "a:2", "b:1", "c:1"]) == {"a:2": None, "b:1": [1, 2]}
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_tag_invalidation(cache):
+    cache.set("course:1", "one", tags=("catalog",))
+    cache.set("course:2", "two")
+    cache.set("unit:1", "unit", tags=("catalog",))
+
+    assert cache.invalidate_tags("catalog") == 2
+    assert cache.get_many(["course:1", "course:2", "unit:1"]) == {"course:2": "two"}
+
+
+def test_invalidate_blocks_stale_sets(cache):
+    generation = cache.generation("course")
+    cache.invalidate("course")
+
+    cache.set("course:1", "stale", generation=generation)
+
+    assert cache.get("course:1") is None
+
+
+def test_entries_expire(cache):
+    cache.set("course:1", "one", ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("course:1") is None
+
+
+def test_get_or_set_computes_once_under_concurrency(cache):
+    calls = []
+    start = threading.Barrier(8)
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    def read():
+        start.wait()
+        assert cache.get_or_set("course:1", factory) == "value"
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    # Late threads find the entry; the rest join the one flight.
+    assert cache.stats()["coalesced"] + cache.stats()["hits"] == 7
+
+
+def test_incomplete_backend_cannot_be_created():
+    class NoCounters(CacheBackend):
+        def get_many(self, keys):
+            return {}
+
+    with pytest.raises(TypeError, match="counters"):
+        NoCounters()
+
+
+def test_lru_evicts_least_recently_used():
+    cache = TTLCache("test", ttl=60, backend=LRUBackend(max_entries=2))
+    cache.set("course:1", 1)
+    cache.set("course:2", 2)
+    cache.get("course:1")
+
+    cache.set("course:3", 3)
+
+    assert cache.get_many(["course:1", "course:2", "course:3"]) == {
+        "course:1": 1,
+        "course:3": 3,
+    }
+    assert cache.stats()["evictions"] == 1
+    # Counters are never evicted along with entries.
+    cache.bump("1")
+    cache.set_many({f"course:{index}": index for index in range(10)})
+    assert cache.version("1") == 1
+
+
+def test_redis_calls_are_pipelined():
+    client = FakeRedis()
+    cache = TTLCache("test", ttl=60, backend=RedisBackend(client, "test"))
+
+    cache.set_many({f"course:{index}": index for index in range(50)}, tags=("all",))
+    assert client.calls == 1
+
+    cache.get_many([f"course:{index}" for index in range(50)])
+    assert client.calls == 2
+
+
+class DownRedis(FakeRedis):
+    def _call(self, command, *args, **kwargs):
+        raise redis.ConnectionError("connection refused")
+
+    def pipeline(self, transaction=True):
+        raise redis.ConnectionError("connection refused")
+
+
+def test_unavailable_redis_reads_as_a_miss():
+    cache = TTLCache("test", ttl=60, backend=RedisBackend(DownRedis(), "test"))
+
+    cache.set("course:1", "one")
+
+    assert cache.get_or_set("course:1", lambda: "computed") == "computed"
+    assert cache.stats()["errors"] > 0
+
+
+def _bump_in_worker(directory: str, times: int):
+    cache = TTLCache("test", ttl=60, backend=SharedMemoryBackend(directory))
+    for _ in range(times):
+        cache.bump("1")
+    cache.set("course:1", "from worker")
+
+
+def test_shared_memory_is_shared_between_processes(tmp_path):
+    cache = TTLCache("test", ttl=60, backend=SharedMemoryBackend(str(tmp_path)))
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_bump_in_worker, args=(str(tmp_path), 25))
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert cache.version("1") == 100
+    assert cache.get("course:1") == "from worker"
+
+
+def test_shared_memory_swaps_entries_atomically(tmp_path):
+    backend = SharedMemoryBackend(str(tmp_path))
+    backend.set_many({"course:1": "old"}, ttl=60)
+    path = backend._entry("course:1")
+    with open(path, "rb") as reader:
+        backend.set_many({"course:1": "new"}, ttl=60)
+
+        # An open reader keeps the version it mapped; new readers see the swap.
+        assert b"old" in reader.read()
+    assert backend.get_many(["course:1"]) == {"course:1": "new"}
+    assert backend.add("course:1", "other", ttl=60) is False
+    assert len(list((tmp_path / "entries").iterdir())) == 1
+
+
+def test_shared_memory_prune_drops_orphaned_tag_members(tmp_path):
+    backend = SharedMemoryBackend(str(tmp_path))
+    backend.set_many({"course:1": "expired"}, ttl=0.01, tags=("catalog",))
+    backend.set_many({"course:2": "live"}, ttl=60, tags=("catalog", "detail"))
+    backend.set_many({"course:3": "expired"}, ttl=0.01, tags=("old",))
+    time.sleep(0.02)
+
+    backend.prune()
+
+    # Only the live entry's members are left; the emptied tag directory goes.
+    live = os.path.basename(backend._entry("course:2"))
+    assert {
+        os.path.basename(tag): os.listdir(tag)
+        for tag in map(str, (tmp_path / "tags").iterdir())
+    } == {
+        os.path.basename(backend._tag("catalog")): [live],
+        os.path.basename(backend._tag("detail")): [live],
+    }
+    assert backend.invalidate_tags("catalog") == 1
+    backend.set_many({"course:4": "new"}, ttl=60, tags=("old",))
+    assert backend.invalidate_tags("old") == 1
+
+
+def test_admin_cache_stats(client, database):
+    client.get("/courses/get/minimal/")
+    client.get("/courses/get/minimal/")
+
+    response = client.get("/admin/cache/", headers=auth_headers(database.ids["admin"]))
+
+    assert response.status_code == 200, response.text
+    reference = next(cache for cache in response.json() if cache["name"] == "reference")
+    assert reference["hits"] >= 1
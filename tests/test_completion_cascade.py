@@ -0,0 +1,209 @@
+from sqlmodel import Session, select
+
+from app.db.models.common import UserCourse, UserSubject, UserUnit
+from app.db.models.courses import Contents, Subject, Unit
+from app.db.models.users import User
+from tests.test_progress_rollups import rebuilt, rollups
+from tests.utils import auth_headers
+
+
+def subject_contents(database, subject_id):
+    with Session(database.engine) as session:
+        return session.exec(
+            select(Contents.id)
+            .join(Unit, Unit.id == Contents.unit_id)
+            .where(Unit.subject_id == subject_id)
+            .order_by(Unit.order, Contents.order)
+        ).all()
+
+
+def status(database, model, **keys):
+    with Session(database.engine) as session:
+        row = session.exec(
+            select(model.status).where(
+                *(getattr(model, key) == value for key, value in keys.items())
+            )
+        ).first()
+        return row.value if row else None
+
+
+def complete(client, database, content_id):
+    headers = auth_headers(database.ids["student"])
+    content = {"content_id": content_id}
+    client.post("/common/user-content/create/", headers=headers, json=content)
+    return client.patch(
+        "/common/user-content/status-update/",
+        headers=headers,
+        json=content | {"status": "COMPLETED"},
+    )
+
+
+def test_unit_completes_with_its_last_content(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    student = ids["student_id"]
+    first, *rest = [
+        content_id
+        for content_id in subject_contents(fresh_database, ids["subject_id"] + 1)
+        if content_id >= ids["next_content_id"]
+    ][:3]
+
+    assert complete(fresh_client, fresh_database, first).status_code == 200
+    assert (
+        status(fresh_database, UserUnit, user_id=student, unit_id=ids["next_unit_id"])
+        == "IN_PROGRESS"
+    )
+
+    for content_id in rest:
+        response = complete(fresh_client, fresh_database, content_id)
+        assert response.json() == {"status": "updated", "completed": False}
+
+    assert (
+        status(fresh_database, UserUnit, user_id=student, unit_id=ids["next_unit_id"])
+        == "COMPLETED"
+    )
+    # The subject's third unit is still open.
+    assert (
+        status(
+            fresh_database,
+            UserSubject,
+            user_id=student,
+            subject_id=ids["subject_id"] + 1,
+        )
+        == "IN_PROGRESS"
+    )
+    assert rollups(fresh_database) == rebuilt(fresh_database)
+
+
+def test_other_learners_completions_do_not_count(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    unit_contents = range(ids["next_content_id"], ids["next_content_id"] + 3)
+    with Session(fresh_database.engine) as session:
+        other = session.exec(
+            select(User.username)
+            .join(UserCourse, UserCourse.user_id == User.id)
+            .where(
+                UserCourse.course_id == ids["course_id"],
+                UserCourse.user_id != ids["student_id"],
+            )
+        ).first()
+    response = fresh_client.post(
+        "/common/user-content/sync/",
+        headers=auth_headers(other),
+        json={
+            "events": [
+                {
+                    "content_id": content_id,
+                    "action": "COMPLETE",
+                    "occurred_at": "2026-01-01T09:00:00",
+                }
+                for content_id in unit_contents
+            ]
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    assert complete(fresh_client, fresh_database, unit_contents[0]).status_code == 200
+
+    assert (
+        status(
+            fresh_database,
+            UserUnit,
+            user_id=ids["student_id"],
+            unit_id=ids["next_unit_id"],
+        )
+        == "IN_PROGRESS"
+    )
+    assert rollups(fresh_database) == rebuilt(fresh_database)
+
+
+def test_completing_a_content_twice_is_rejected(fresh_client, fresh_database):
+    response = complete(fresh_client, fresh_database, fresh_database.ids["content_id"])
+
+    assert response.status_code == 500
+    assert response.json()["detail"]["error_type"] == "HTTPException"
+
+
+def test_course_completes_with_its_last_published_subject(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    headers = auth_headers(ids["student"])
+    with Session(fresh_database.engine) as session:
+        open_subjects = session.exec(
+            select(Subject.id).where(
+                Subject.course_id == ids["course_id"],
+                Subject.status == "PUBLISHED",
+                Subject.id != ids["subject_id"],
+            )
+        ).all()
+        others = session.exec(
+            select(UserCourse.user_id).where(
+                UserCourse.course_id == ids["course_id"],
+                UserCourse.user_id != ids["student_id"],
+            )
+        ).all()
+    fresh_client.post(
+        "/common/user-subject/create/",
+        headers=headers,
+        json={"subject_id": open_subjects[-1]},
+    )
+    contents = [
+        content_id
+        for subject_id in open_subjects
+        for content_id in subject_contents(fresh_database, subject_id)
+    ]
+
+    responses = [
+        complete(fresh_client, fresh_database, content_id) for content_id in contents
+    ]
+
+    completed = [response.json().get("completed") for response in responses]
+    # Contents the seed already completed are rejected; only the last one
+    # finishes the course.
+    assert completed[-1] is True
+    assert completed.count(True) == 1
+    assert (
+        status(
+            fresh_database,
+            UserCourse,
+            user_id=ids["student_id"],
+            course_id=ids["course_id"],
+        )
+        == "COMPLETED"
+    )
+    assert others and all(
+        status(fresh_database, UserCourse, user_id=user_id, course_id=ids["course_id"])
+        == "IN_PROGRESS"
+        for user_id in others
+    )
+    assert rollups(fresh_database) == rebuilt(fresh_database)
+
+
+def test_draft_units_are_left_out_of_rollups(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    subject_id = ids["subject_id"] + 1
+    response = fresh_client.post(
+        "/courses/unit/create/",
+        json={
+            "title": "Draft unit",
+            "subject_id": subject_id,
+            "order": 9,
+            "completion_time": 10,
+            "status": "DRAFT",
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    for content_id in subject_contents(fresh_database, subject_id):
+        complete(fresh_client, fresh_database, content_id)
+
+    subjects, _ = rollups(fresh_database)
+    assert (subject_id, 3, 3) in subjects
+    assert (
+        status(
+            fresh_database,
+            UserSubject,
+            user_id=ids["student_id"],
+            subject_id=subject_id,
+        )
+        == "COMPLETED"
+    )
+    assert rollups(fresh_database) == rebuilt(fresh_database)
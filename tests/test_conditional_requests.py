@@ -0,0 +1,85 @@
+import pytest
+
+from tests.test_course_detail_cache import rename_instructor
+from tests.utils import measured_request
+
+
+DETAIL_PATHS = [
+    "/courses/get/{course_id}/",
+    "/courses/subject/get_by_id/{subject_id}/",
+    "/courses/unit/{unit_id}/",
+    "/courses/content/get/{content_id}/",
+]
+
+
+@pytest.mark.parametrize("path", DETAIL_PATHS)
+def test_matching_etag_is_answered_with_304(client, database, path):
+    path = path.format(**database.ids)
+    first = client.get(path)
+    assert first.status_code == 200, first.text
+    assert first.headers["ETag"].startswith('"')
+    assert "Last-Modified" in first.headers
+
+    response, queries, _ = measured_request(
+        client, "GET", path, headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == first.headers["ETag"]
+    assert queries <= 1
+
+
+@pytest.mark.parametrize("path", DETAIL_PATHS)
+def test_if_modified_since_is_honoured(client, database, path):
+    path = path.format(**database.ids)
+    first = client.get(path)
+
+    response = client.get(
+        path, headers={"If-Modified-Since": first.headers["Last-Modified"]}
+    )
+
+    assert response.status_code == 304
+
+
+def test_stale_etag_gets_the_body(client, database):
+    path = f"/courses/unit/{database.ids['unit_id']}/"
+
+    response = client.get(path, headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json()["id"] == database.ids["unit_id"]
+
+
+def test_update_changes_etag_and_last_modified(fresh_client, fresh_database):
+    path = f"/courses/content/get/{fresh_database.ids['content_id']}/"
+    first = fresh_client.get(path)
+
+    response = fresh_client.patch(
+        f"/courses/unit/{fresh_database.ids['unit_id']}/update/",
+        json={
+            "title": "Renamed unit",
+            "subject_id": fresh_database.ids["subject_id"],
+            "order": 1,
+            "completion_time": 40,
+            "status": "PUBLISHED",
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    second = fresh_client.get(path, headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    assert second.json()["unit"]["title"] == "Renamed unit"
+    assert second.headers["ETag"] != first.headers["ETag"]
+
+
+def test_instructor_update_changes_course_etag(fresh_client, fresh_database):
+    path = f"/courses/get/{fresh_database.ids['course_id']}/"
+    first = fresh_client.get(path)
+
+    rename_instructor(fresh_client, fresh_database, "Renamed tutor")
+
+    second = fresh_client.get(path, headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    assert second.json()["instructor"]["name"] == "Renamed tutor"
+    assert second.headers["ETag"] != first.headers["ETag"]
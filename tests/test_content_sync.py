@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+
+from sqlmodel import Session, select
+
+from app.db.models.common import UserContent, UserCourse, UserSubject, UserUnit
+from app.db.models.courses import Subject
+from tests.test_completion_cascade import status, subject_contents
+from tests.test_progress_rollups import rebuilt, rollups
+from tests.utils import auth_headers, measured_request
+
+
+SYNC = "/common/user-content/sync/"
+
+
+def event(content_id, action, minutes=0):
+    occurred_at = datetime(2026, 1, 1, 9) + timedelta(minutes=minutes)
+    return {
+        "content_id": content_id,
+        "action": action,
+        "occurred_at": occurred_at.isoformat(),
+    }
+
+
+def test_sync_reports_each_event(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    first, second, third = range(ids["next_content_id"], ids["next_content_id"] + 3)
+    events = [
+        event(first, "START"),
+        event(first, "COMPLETE", 5),
+        event(first, "COMPLETE", 6),
+        event(second, "COMPLETE", 7),
+        event(third, "START", 8),
+        event(ids["content_id"], "COMPLETE", 9),
+        event(10**6, "START", 10),
+    ]
+
+    response, queries, _ = measured_request(
+        fresh_client,
+        "POST",
+        SYNC,
+        headers=auth_headers(ids["student"]),
+        json={"events": events},
+    )
+
+    assert response.status_code == 200, response.text
+    assert [item["result"] for item in response.json()["results"]] == [
+        "STARTED",
+        "COMPLETED",
+        "DUPLICATE",
+        "COMPLETED",
+        "STARTED",
+        "ALREADY_COMPLETED",
+        "NOT_FOUND",
+    ]
+    assert response.json()["completed_courses"] == []
+    assert queries <= 8
+    with Session(fresh_database.engine) as session:
+        row = session.get(UserContent, (ids["student_id"], first))
+        assert row.started_at == datetime(2026, 1, 1, 9)
+        assert row.completed_at == datetime(2026, 1, 1, 9, 5)
+    assert (
+        status(
+            fresh_database,
+            UserUnit,
+            user_id=ids["student_id"],
+            unit_id=ids["next_unit_id"],
+        )
+        == "IN_PROGRESS"
+    )
+
+
+def test_sync_replay_is_idempotent(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    headers = auth_headers(ids["student"])
+    events = [event(ids["next_content_id"], "COMPLETE")]
+    fresh_client.post(SYNC, headers=headers, json={"events": events})
+
+    response = fresh_client.post(SYNC, headers=headers, json={"events": events})
+
+    assert response.json()["results"][0]["result"] == "ALREADY_COMPLETED"
+    assert rollups(fresh_database) == rebuilt(fresh_database)
+
+
+def test_sync_cascades_once_per_unit(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    headers = auth_headers(ids["student"])
+    with Session(fresh_database.engine) as session:
+        open_subjects = session.exec(
+            select(Subject.id).where(
+                Subject.course_id == ids["course_id"],
+                Subject.status == "PUBLISHED",
+                Subject.id != ids["subject_id"],
+            )
+        ).all()
+    fresh_client.post(
+        "/common/user-subject/create/",
+        headers=headers,
+        json={"subject_id": open_subjects[-1]},
+    )
+    events = [
+        event(content_id, "COMPLETE", minutes)
+        for minutes, content_id in enumerate(
+            content_id
+            for subject_id in open_subjects
+            for content_id in subject_contents(fresh_database, subject_id)
+        )
+    ]
+
+    response = fresh_client.post(SYNC, headers=headers, json={"events": events})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["completed_courses"] == [ids["course_id"]]
+    for subject_id in open_subjects:
+        assert (
+            status(
+                fresh_database,
+                UserSubject,
+                user_id=ids["student_id"],
+                subject_id=subject_id,
+            )
+            == "COMPLETED"
+        )
+    assert (
+        status(
+            fresh_database,
+            UserCourse,
+            user_id=ids["student_id"],
+            course_id=ids["course_id"],
+        )
+        == "COMPLETED"
+    )
+    assert rollups(fresh_database) == rebuilt(fresh_database)
+
+
+def test_sync_rejects_an_empty_batch(client, database):
+    response = client.post(
+        SYNC, headers=auth_headers(database.ids["student"]), json={"events": []}
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,60 @@
+from sqlmodel import Session
+
+from app.db.models.courses import Course
+from tests.utils import auth_headers, measured_request
+
+
+def instructor_id(database):
+    with Session(database.engine) as session:
+        return session.get(Course, database.ids["course_id"]).instructor_id
+
+
+def rename_instructor(client, database, name):
+    response = client.patch(
+        f"/users/{instructor_id(database)}/update/",
+        headers=auth_headers(database.ids["admin"]),
+        data={"user": f'{{"name": "{name}"}}'},
+    )
+    assert response.status_code == 200, response.text
+
+
+def test_course_detail_is_served_from_cache(client, database):
+    path = f"/courses/get/{database.ids['course_id']}/"
+    first, _, _ = measured_request(client, "GET", path)
+
+    second, queries, rows = measured_request(client, "GET", path)
+
+    assert second.status_code == 200, second.text
+    assert second.json() == first.json()
+    assert (queries, rows) == (0, 0)
+
+
+def test_subject_create_bumps_course_version(fresh_client, fresh_database):
+    course_id = fresh_database.ids["course_id"]
+    path = f"/courses/get/{course_id}/"
+    before = fresh_client.get(path).json()
+
+    response = fresh_client.post(
+        "/courses/subject/create/",
+        json={
+            "title": "New subject",
+            "completion_time": 60,
+            "course_id": course_id,
+            "order": 5,
+            "status": "PUBLISHED",
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    after, queries, _ = measured_request(fresh_client, "GET", path)
+    assert queries > 0
+    assert len(after.json()["subjects"]) == len(before["subjects"]) + 1
+
+
+def test_instructor_update_bumps_course_version(fresh_client, fresh_database):
+    path = f"/courses/get/{fresh_database.ids['course_id']}/"
+    fresh_client.get(path)
+
+    rename_instructor(fresh_client, fresh_database, "Renamed tutor")
+
+    assert fresh_client.get(path).json()["instructor"]["name"] == "Renamed tutor"
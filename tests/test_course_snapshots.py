@@ -0,0 +1,81 @@
+import json
+
+from sqlmodel import Session, delete, select
+
+from app.db.models.courses import CourseSnapshot
+from tests.utils import measured_request
+
+
+def stored_snapshot(database, course_id):
+    with Session(database.engine) as session:
+        return session.exec(
+            select(CourseSnapshot.document).where(CourseSnapshot.course_id == course_id)
+        ).first()
+
+
+def test_unit_create_refreshes_the_course_snapshot(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    response = fresh_client.post(
+        "/courses/unit/create/",
+        json={
+            "title": "Snapshot unit",
+            "subject_id": ids["subject_id"],
+            "order": 9,
+            "completion_time": 10,
+            "status": "PUBLISHED",
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    snapshot = stored_snapshot(fresh_database, ids["course_id"])
+    subject = next(
+        node for node in snapshot["subjects"] if node["id"] == ids["subject_id"]
+    )
+    assert subject["units"][-1]["title"] == "Snapshot unit"
+    detail = fresh_client.get(f"/courses/subject/get_by_id/{ids['subject_id']}/")
+    assert detail.json()["units"][-1]["title"] == "Snapshot unit"
+
+
+def test_content_create_refreshes_the_course_snapshot(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    content = {
+        "title": "Snapshot content",
+        "completion_time": 5,
+        "order": 9,
+        "description": None,
+        "content_type": "VIDEO",
+        "status": "PUBLISHED",
+        "unit_id": ids["unit_id"],
+        "video_time_stamps": [{"title": "Intro", "time_stamp": "01:30"}],
+    }
+
+    response = fresh_client.post(
+        "/courses/content/create/", data={"content": json.dumps(content)}
+    )
+    assert response.status_code == 200, response.text
+
+    snapshot = stored_snapshot(fresh_database, ids["course_id"])
+    unit = next(
+        unit
+        for subject in snapshot["subjects"]
+        for unit in subject["units"]
+        if unit["id"] == ids["unit_id"]
+    )
+    assert unit["contents"][-1]["title"] == "Snapshot content"
+    [stamp] = unit["contents"][-1]["video_time_stamps"]
+    assert (stamp["title"], stamp["time_stamp"]) == ("Intro", 90)
+
+
+def test_missing_snapshot_is_built_on_read(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    path = f"/courses/subject/get_by_id/{ids['subject_id']}/"
+    stored = fresh_client.get(path).json()
+    with Session(fresh_database.engine) as session:
+        session.exec(delete(CourseSnapshot))
+        session.commit()
+
+    response, queries, _ = measured_request(fresh_client, "GET", path)
+
+    assert response.json() == stored
+    assert queries > 3
+    assert stored_snapshot(fresh_database, ids["course_id"]) is None
@@ -0,0 +1,55 @@
+import json
+
+from sqlmodel import Session, select
+
+from app.db.models.enrollment import CourseEnrollment
+from tests.utils import auth_headers, measured_request
+
+
+PATH = "/courses/get/latest-courses/"
+
+
+def test_users_share_one_candidate_list(client, database):
+    admin = auth_headers(database.ids["admin"])
+    student = auth_headers(database.ids["student"])
+    client.get(PATH, headers=admin)
+
+    response, queries, _ = measured_request(client, "GET", PATH, headers=student)
+
+    assert response.status_code == 200, response.text
+    # Principal lookup and the student's enrolled courses; no catalog queries.
+    assert queries == 2
+    with Session(database.engine) as session:
+        enrolled = session.exec(
+            select(CourseEnrollment.course_id).where(
+                CourseEnrollment.user_id == database.ids["student_id"]
+            )
+        ).all()
+    assert enrolled
+    assert set(enrolled).isdisjoint(course["id"] for course in response.json())
+
+
+def test_publishing_a_course_refreshes_the_candidates(fresh_client, fresh_database):
+    headers = auth_headers(fresh_database.ids["admin"])
+    before = fresh_client.get(PATH, headers=headers).json()
+
+    response = fresh_client.patch(
+        "/courses/4/update/",
+        data={
+            "course": json.dumps(
+                {
+                    "title": "Course 3",
+                    "status": "PUBLISHED",
+                    "instructor_id": 2,
+                    "completion_time": 600,
+                    "price": 52.0,
+                }
+            )
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    after = fresh_client.get(PATH, headers=headers).json()
+    assert [course["id"] for course in after] == [4] + [
+        course["id"] for course in before
+    ]
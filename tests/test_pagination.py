@@ -0,0 +1,121 @@
+from math import ceil
+
+import pytest
+
+from tests.utils import auth_headers, measured_request
+
+
+def walk(client, path, headers=None, limit=5):
+    pages = []
+    response = client.get(path, params={"limit": limit, "cursor": ""}, headers=headers)
+    while True:
+        assert response.status_code == 200, response.text
+        page = response.json()
+        pages.append(page)
+        if page["next_cursor"] is None:
+            return pages
+        response = client.get(
+            path,
+            params={"limit": limit, "cursor": page["next_cursor"]},
+            headers=headers,
+        )
+
+
+@pytest.mark.parametrize(
+    ("path", "user"),
+    [
+        ("/courses/category/get/", None),
+        ("/courses/unit/get/all/", None),
+        ("/courses/content/fetch/all/", None),
+        ("/users/get/students/", "admin"),
+    ],
+)
+def test_cursor_pages_match_offset_order(client, database, path, user):
+    headers = auth_headers(database.ids[user]) if user else {}
+    offset_ids, offset = [], 0
+    while True:
+        page = client.get(
+            path, params={"limit": 100, "offset": offset}, headers=headers
+        ).json()
+        offset_ids += [item["id"] for item in page["data"]]
+        offset += 100
+        if page["current_page"] >= page["total_pages"]:
+            break
+
+    pages = walk(client, path, headers=headers, limit=2)
+
+    assert [item["id"] for page in pages for item in page["data"]] == offset_ids
+    assert pages[0]["prev_cursor"] is None
+    assert {page["total_pages"] for page in pages} == {ceil(len(offset_ids) / 2)}
+
+
+def test_prev_cursor_returns_previous_page(client):
+    pages = walk(client, "/courses/unit/get/all/", limit=5)
+    third = pages[2]
+
+    response = client.get(
+        "/courses/unit/get/all/",
+        params={"limit": 5, "cursor": third["prev_cursor"]},
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["data"] == pages[1]["data"]
+    assert response.json()["next_cursor"] is not None
+
+
+def test_count_is_optional(client):
+    page = client.get(
+        "/courses/unit/get/all/",
+        params={"limit": 5, "offset": 5, "count": "NONE"},
+    ).json()
+
+    assert page["total_pages"] is None
+    assert page["current_page"] == 2
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get(
+        "/courses/unit/get/all/", params={"limit": 5, "cursor": "not-a-cursor"}
+    )
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["loc"] == ["query", "cursor"]
+
+
+def test_exact_count_is_cached_until_a_write(fresh_client):
+    path = "/courses/unit/get/all/"
+    page = {"limit": 5, "offset": 0}
+    _, cold, _ = measured_request(fresh_client, "GET", path, params=page)
+
+    response, warm, _ = measured_request(fresh_client, "GET", path, params=page)
+    assert warm == cold - 1
+    total_pages = response.json()["total_pages"]
+
+    for order in range(4, 10):
+        created = fresh_client.post(
+            "/courses/unit/create/",
+            json={
+                "title": f"Unit {order}",
+                "subject_id": 1,
+                "order": order,
+                "completion_time": 10,
+                "status": "PUBLISHED",
+            },
+        )
+        assert created.status_code == 200, created.text
+
+    response, queries, _ = measured_request(fresh_client, "GET", path, params=page)
+    assert queries == cold
+    assert response.json()["total_pages"] == total_pages + 1
+
+
+def test_estimated_count_falls_back_to_exact_without_a_planner(client):
+    exact = client.get("/courses/unit/get/all/", params={"limit": 5, "offset": 0})
+
+    estimated = client.get(
+        "/courses/unit/get/all/",
+        params={"limit": 5, "offset": 0, "count": "ESTIMATED"},
+    )
+
+    assert estimated.json()["total_pages"] == exact.json()["total_pages"]
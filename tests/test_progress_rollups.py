@@ -0,0 +1,97 @@
+from sqlmodel import Session, select, update
+
+from app.db.crud.progress import rebuild_progress
+from app.db.models.common import UserCourseProgress, UserSubjectProgress
+from tests.utils import auth_headers, measured_request
+
+
+def rollups(database):
+    with Session(database.engine) as session:
+        return sorted(
+            (row.subject_id, row.completed_units, row.total_units)
+            for row in session.exec(select(UserSubjectProgress)).all()
+        ), sorted(
+            (row.course_id, row.completed_subjects, row.total_subjects)
+            for row in session.exec(select(UserCourseProgress)).all()
+        )
+
+
+def rebuilt(database):
+    with Session(database.engine) as session:
+        rebuild_progress(session)
+    return rollups(database)
+
+
+def complete_content(client, database, content_id):
+    headers = auth_headers(database.ids["student"])
+    content = {"content_id": content_id}
+    response = client.post(
+        "/common/user-content/create/", headers=headers, json=content
+    )
+    assert response.status_code == 200, response.text
+    response = client.patch(
+        "/common/user-content/status-update/",
+        headers=headers,
+        json=content | {"status": "COMPLETED"},
+    )
+    assert response.status_code == 200, response.text
+
+
+def test_content_completion_updates_rollups(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    headers = auth_headers(ids["student"])
+    path = f"/common/user-subject/{ids['subject_id'] + 1}/status/"
+    assert fresh_client.get(path, headers=headers).json()["completed_units"] == 1
+
+    for offset in range(3):
+        complete_content(fresh_client, fresh_database, ids["next_content_id"] + offset)
+
+    response, queries, _ = measured_request(fresh_client, "GET", path, headers=headers)
+    assert response.json()["completed_units"] == 2
+    assert queries <= 3
+    assert rollups(fresh_database) == rebuilt(fresh_database)
+
+
+def test_catalog_changes_update_rollup_totals(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    response = fresh_client.post(
+        "/courses/unit/create/",
+        json={
+            "title": "Rollup unit",
+            "subject_id": ids["subject_id"],
+            "order": 9,
+            "completion_time": 10,
+            "status": "PUBLISHED",
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    subjects, _ = rollups(fresh_database)
+    assert (ids["subject_id"], 3, 4) in subjects
+    assert rollups(fresh_database) == rebuilt(fresh_database)
+
+
+def test_rebuild_repairs_drift(fresh_client, fresh_database):
+    expected = rollups(fresh_database)
+    with Session(fresh_database.engine) as session:
+        session.exec(update(UserSubjectProgress).values(completed_units=0))
+        session.exec(update(UserCourseProgress).values(total_subjects=99))
+        session.commit()
+
+    assert rebuilt(fresh_database) == expected
+
+
+def test_progress_reads_fall_back_without_rollup_rows(client, database):
+    headers = auth_headers(database.ids["student"])
+
+    # A subject of the first course that the learner has not started.
+    response = client.get(
+        f"/common/user-subject/{database.ids['subject_id'] + 2}/status/",
+        headers=headers,
+    )
+
+    assert response.json() == {
+        "total_units": 3,
+        "completed_units": 0,
+        "completion_percent": 0.0,
+    }
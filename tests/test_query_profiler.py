@@ -0,0 +1,92 @@
+import os
+import re
+
+import pytest
+
+from sqlmodel import Session
+
+from app.db.crud.snapshots import get_course_snapshot
+from app.db.profiler import NPlusOneQueryError, normalize_statement, profile_queries
+from app.services.middleware.profiling import PROFILE_HEADER
+from config import settings
+
+
+SERVER_TIMING = re.compile(r'db;dur=\d+\.\d\d;desc="(\d+) queries", app;dur=\d+\.\d\d')
+
+
+def unit_path(database):
+    return f"/courses/unit/{database.ids['unit_id']}/"
+
+
+def test_profiled_request_reports_its_queries(client, database):
+    headers = {PROFILE_HEADER: os.environ["QUERY_PROFILER_TOKEN"]}
+
+    response = client.get(unit_path(database), headers=headers)
+
+    assert response.status_code == 200, response.text
+    query_count = int(response.headers["X-Query-Count"])
+    assert query_count > 0
+    timing = SERVER_TIMING.fullmatch(response.headers["Server-Timing"])
+    assert timing and int(timing.group(1)) == query_count
+    assert response.json() == client.get(unit_path(database)).json()
+
+
+@pytest.mark.parametrize(
+    "headers", [{}, {PROFILE_HEADER: "wrong-token"}, {PROFILE_HEADER: ""}]
+)
+def test_profile_is_refused_without_the_token(client, database, headers):
+    response = client.get(unit_path(database), headers=headers)
+
+    assert response.status_code == 200, response.text
+    assert "X-Query-Count" not in response.headers
+    assert "Server-Timing" not in response.headers
+
+
+def test_profiling_is_off_without_a_configured_token(client, database, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_PROFILER_TOKEN", "")
+
+    response = client.get(unit_path(database), headers={PROFILE_HEADER: ""})
+
+    assert "X-Query-Count" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (
+            "SELECT * FROM units WHERE id = 5 AND title = 'it''s'",
+            "SELECT *  FROM units\n WHERE id = 12 AND title = 'other'",
+        ),
+        (
+            "SELECT * FROM units WHERE id IN (?, ?, ?)",
+            "SELECT * FROM units WHERE id IN (?)",
+        ),
+        (
+            "SELECT * FROM units WHERE id IN (%(id_1)s, %(id_2)s) LIMIT %(limit)s",
+            "SELECT * FROM units WHERE id IN ($1) LIMIT $2",
+        ),
+    ],
+)
+def test_statements_differing_only_in_values_share_a_shape(first, second):
+    assert normalize_statement(first) == normalize_statement(second)
+
+
+def test_different_statements_keep_different_shapes():
+    assert normalize_statement(
+        "SELECT * FROM units WHERE id = 1"
+    ) != normalize_statement("SELECT * FROM subjects WHERE id = 1")
+
+
+def test_repeat_report_names_the_crud_function(database):
+    course_id = database.ids["course_id"]
+    with Session(database.engine) as session:
+        with profile_queries("loop", repeat_threshold=1) as profile:
+            for _ in range(2):
+                get_course_snapshot(course_id, session)
+
+    [repeated] = profile.repeated_statements
+    assert repeated["count"] == 2
+    assert os.path.join("app", "db", "crud", "snapshots.py:") in repeated["call_site"]
+    assert repeated["call_site"].endswith(" in get_course_snapshots")
+    with pytest.raises(NPlusOneQueryError, match="get_course_snapshots"):
+        profile.check_repeats()
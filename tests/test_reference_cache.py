@@ -0,0 +1,56 @@
+import pytest
+
+from tests.utils import measured_request
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/courses/category/get/",
+        "/courses/get/minimal/",
+        "/courses/subject/minimal/{course_id}",
+        "/courses/unit/minimal/",
+        "/assessments/type/all/",
+        "/gamification/streak-type/all/",
+        "/gamification/achievements/all",
+    ],
+)
+def test_reference_data_is_served_from_cache(client, database, path):
+    path = path.format(**database.ids)
+    first, _, _ = measured_request(client, "GET", path)
+
+    second, queries, rows = measured_request(client, "GET", path)
+
+    assert second.status_code == 200, second.text
+    assert second.json() == first.json()
+    assert (queries, rows) == (0, 0)
+
+
+def test_create_invalidates_cached_categories(fresh_client):
+    before = fresh_client.get("/courses/category/get/").json()
+
+    response = fresh_client.post("/courses/category/create/", json={"title": "Ops"})
+    assert response.status_code == 200, response.text
+
+    after, queries, _ = measured_request(fresh_client, "GET", "/courses/category/get/")
+    assert queries == 1
+    assert [category["title"] for category in after.json()] == [
+        category["title"] for category in before
+    ] + ["Ops"]
+
+
+def test_update_invalidates_cached_streak_types(fresh_client, fresh_database):
+    streak_type_id = fresh_database.ids["streak_type_id"]
+    fresh_client.get("/gamification/streak-type/all/")
+
+    response = fresh_client.patch(
+        f"/gamification/streak-type/{streak_type_id}/update/",
+        json={"title": "Renamed", "description": "Renamed streak", "is_active": True},
+    )
+    assert response.status_code == 200, response.text
+
+    titles = [
+        streak_type["title"]
+        for streak_type in fresh_client.get("/gamification/streak-type/all/").json()
+    ]
+    assert "Renamed" in titles
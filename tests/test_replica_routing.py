@@ -0,0 +1,86 @@
+import pytest
+
+from sqlalchemy import create_engine
+from sqlmodel import SQLModel, func, select, update
+
+from app.db.counts import exact_count
+from app.db.crud.courses import list_minimal_courses
+from app.db.models.assessments import AssessmentType
+from app.db.models.courses import Course
+from app.db.session.routing import ReplicaRouter, RoutingSession
+from app.services.cache.memory import count_cache, reference_cache
+
+
+@pytest.fixture
+def replica(tmp_path):
+    """An empty copy of the schema standing in for a replica that has no rows."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'replica.sqlite3'}")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def router(replica):
+    return ReplicaRouter([replica], max_lag=5, check_interval=0)
+
+
+def read_session(database, router):
+    return RoutingSession(database.engine, router, info={"read_only": True})
+
+
+def course_count(session):
+    return session.exec(select(func.count(Course.id))).one()
+
+
+def test_reads_go_to_the_replica(database, router, replica):
+    with read_session(database, router) as session:
+        assert course_count(session) == 0
+        assert session.get_bind() is replica
+
+    # Sessions not marked read-only never leave the primary.
+    with RoutingSession(database.engine, router) as session:
+        assert course_count(session) > 0
+
+
+def test_session_stays_on_the_primary_after_a_flush(fresh_database, router):
+    with read_session(fresh_database, router) as session:
+        assert course_count(session) == 0
+
+        session.add(AssessmentType(title="Flushed", icon="quiz", description=""))
+        session.flush()
+
+        assert course_count(session) > 0
+        assert "Flushed" in session.exec(select(AssessmentType.title)).all()
+
+
+def test_session_stays_on_the_primary_after_a_write(fresh_database, router):
+    with read_session(fresh_database, router) as session:
+        session.exec(update(Course).values(title="Renamed"))
+
+        assert course_count(session) > 0
+        assert set(session.exec(select(Course.title)).all()) == {"Renamed"}
+
+
+def test_lagging_replica_falls_back_to_the_primary(database, router, monkeypatch):
+    monkeypatch.setattr(router, "measure_lag", lambda replica: 10.0)
+
+    with read_session(database, router) as session:
+        assert course_count(session) > 0
+        assert session.get_bind() is database.engine
+    assert router.status()[0]["lag_seconds"] == 10.0
+
+    monkeypatch.setattr(router, "measure_lag", lambda replica: 1.0)
+    with read_session(database, router) as session:
+        assert course_count(session) == 0
+
+
+def test_cache_misses_are_filled_from_the_primary(database, router):
+    reference_cache.clear()
+    count_cache.clear()
+    with read_session(database, router) as session:
+        # A replica behind the last write must not refill what it invalidated.
+        assert list_minimal_courses(session)
+        assert exact_count(select(Course.id), session) > 0
+
+        assert course_count(session) == 0
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+
+from app.db.crud.courses import list_all_courses
+from app.services.cache.single_flight import SingleFlight, coalesced
+from tests.utils import auth_headers
+
+
+def test_threads_share_one_execution():
+    flight = SingleFlight("test")
+    release = threading.Event()
+    results = []
+
+    def compute():
+        release.wait(1)
+        return "value"
+
+    def call():
+        results.append(flight.do("key", compute))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    while not flight.stats()["in_flight"]:
+        time.sleep(0.001)
+    waiters = [threading.Thread(target=call) for _ in range(5)]
+    for waiter in waiters:
+        waiter.start()
+    while flight.coalesced < 5:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader, *waiters]:
+        thread.join()
+
+    assert results == ["value"] * 6
+    assert flight.stats() == {
+        "name": "test",
+        "executions": 1,
+        "coalesced": 5,
+        "in_flight": 0,
+    }
+
+
+def test_coroutines_wait_on_a_thread_computation():
+    flight = SingleFlight("test")
+    release = threading.Event()
+    leader = threading.Thread(
+        target=flight.do, args=("key", lambda: release.wait(1) and "value")
+    )
+    leader.start()
+    while not flight.stats()["in_flight"]:
+        time.sleep(0.001)
+
+    async def callers():
+        async def compute():
+            raise AssertionError("joined the running flight instead")
+
+        waiting = [
+            asyncio.create_task(flight.do_async("key", compute)) for _ in range(3)
+        ]
+        while flight.coalesced < 3:
+            await asyncio.sleep(0.001)
+        release.set()
+        return await asyncio.gather(*waiting)
+
+    assert asyncio.run(callers()) == ["value"] * 3
+    leader.join()
+    assert (flight.executions, flight.coalesced) == (1, 3)
+
+
+def test_waiters_get_the_leaders_exception():
+    flight = SingleFlight("test")
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def callers():
+        return await asyncio.gather(
+            *(flight.do_async("key", failing) for _ in range(4)),
+            return_exceptions=True,
+        )
+
+    errors = asyncio.run(callers())
+    assert [str(error) for error in errors] == ["boom"] * 4
+    assert flight.executions == 1
+    # A failed flight is not remembered.
+    assert asyncio.run(flight.do_async("key", lambda: asyncio.sleep(0, "ok"))) == "ok"
+
+
+def test_coalesced_keys_on_arguments():
+    calls = []
+
+    @coalesced("test")
+    def read(db, course_id):
+        calls.append(course_id)
+        time.sleep(0.2)
+        return course_id
+
+    barrier = threading.Barrier(6)
+    db = object()
+
+    def call(course_id):
+        barrier.wait()
+        assert read(db, course_id) == course_id
+
+    threads = [threading.Thread(target=call, args=(index % 2,)) for index in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(calls) == [0, 1]
+    assert read.flight.coalesced == 4
+
+
+def test_list_all_courses_runs_through_a_flight(client, database):
+    executions = list_all_courses.flight.executions
+
+    client.get("/courses/get/all/", params={"limit": 5, "offset": 0})
+
+    assert list_all_courses.flight.executions == executions + 1
+    stats = client.get(
+        "/admin/cache/single-flight/", headers=auth_headers(database.ids["admin"])
+    ).json()
+    assert "list_all_courses" in {flight["name"] for flight in stats}
@@ -0,0 +1,83 @@
+import pytest
+
+from app.db.slow_queries import slow_query_log
+from tests.utils import auth_headers
+
+
+SLOW_QUERIES = "/admin/db/slow-queries/"
+
+
+@pytest.fixture
+def slow_queries(monkeypatch):
+    """Record every statement as slow."""
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 0)
+    slow_query_log.clear()
+    yield slow_query_log
+    slow_query_log.clear()
+
+
+def logged(client, database, **params):
+    response = client.get(
+        SLOW_QUERIES, headers=auth_headers(database.ids["admin"]), params=params
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_slow_queries_are_listed_for_admins(client, database, slow_queries):
+    response = client.get(f"/courses/unit/{database.ids['unit_id']}/")
+    assert response.status_code == 200, response.text
+
+    log = logged(client, database)
+
+    assert log["threshold_ms"] == 0
+    assert log["total_recorded"] == len(log["entries"]) > 0
+    entry = next(
+        entry
+        for entry in log["entries"]
+        if entry["route"] == "GET /courses/unit/{unit_id}/"
+    )
+    assert "FROM units" in entry["statement"]
+    assert entry["plan"] is None
+    assert len(logged(client, database, limit=1)["entries"]) == 1
+
+    response = client.delete(SLOW_QUERIES, headers=auth_headers(database.ids["admin"]))
+    assert response.status_code == 204
+    assert not any(
+        entry["route"] == "GET /courses/unit/{unit_id}/"
+        for entry in logged(client, database)["entries"]
+    )
+
+
+def test_queries_under_the_threshold_are_not_recorded(
+    client, database, slow_queries, monkeypatch
+):
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 10**6)
+
+    client.get(f"/courses/unit/{database.ids['unit_id']}/")
+
+    assert slow_query_log.snapshot() == []
+
+
+def test_failed_explain_still_records_the_query(
+    client, database, slow_queries, monkeypatch, caplog
+):
+    # SQLite takes the savepoint but rejects EXPLAIN (ANALYZE ...).
+    monkeypatch.setattr(slow_query_log, "should_explain", lambda *args: True)
+
+    response = client.get(f"/courses/unit/{database.ids['unit_id']}/")
+
+    assert response.status_code == 200, response.text
+    entries = [
+        entry
+        for entry in slow_query_log.snapshot()
+        if entry["route"] == "GET /courses/unit/{unit_id}/"
+    ]
+    assert entries and all(entry["plan"] is None for entry in entries)
+    assert "EXPLAIN failed" in caplog.text
+
+
+def test_slow_queries_need_an_admin(client, database):
+    response = client.get(SLOW_QUERIES, headers=auth_headers(database.ids["student"]))
+
+    assert response.status_code == 403
@@ -0,0 +1,62 @@
+from sqlmodel import Session, select
+
+from app.db.crud.common import (
+    fetch_upcoming_subjects_by_user,
+    fetch_user_upcoming_subjects,
+)
+from app.db.models.common import UserSubject
+from app.db.models.enrollment import CourseEnrollment
+from app.services.enum.courses import CompletionStatusEnum
+from tests.utils import auth_headers
+
+
+def upcoming(client, database):
+    response = client.get(
+        "/common/user-course/upcoming-subjects/",
+        headers=auth_headers(database.ids["student"]),
+    )
+    assert response.status_code == 200, response.text
+    return {item["course_id"]: item["subject"]["id"] for item in response.json()}
+
+
+def complete_subject(database, subject_id):
+    with Session(database.engine) as session:
+        session.merge(
+            UserSubject(
+                user_id=database.ids["student_id"],
+                subject_id=subject_id,
+                status=CompletionStatusEnum.COMPLETED,
+            )
+        )
+        session.commit()
+
+
+def test_next_subject_of_paid_enrollments_only(client, database):
+    ids = database.ids
+
+    # The learner also has a PENDING enrollment, which is left out.
+    assert upcoming(client, database) == {ids["course_id"]: ids["subject_id"] + 1}
+
+
+def test_next_subject_skips_unpublished_subjects(fresh_client, fresh_database):
+    ids = fresh_database.ids
+    complete_subject(fresh_database, ids["subject_id"] + 1)
+    assert upcoming(fresh_client, fresh_database) == {
+        ids["course_id"]: ids["subject_id"] + 2
+    }
+
+    # The course's last subject is a draft, so nothing is left to take.
+    complete_subject(fresh_database, ids["subject_id"] + 2)
+    assert upcoming(fresh_client, fresh_database) == {}
+
+
+def test_batched_variant_matches_the_single_user_one(database):
+    with Session(database.engine) as session:
+        user_ids = session.exec(select(CourseEnrollment.user_id).distinct()).all()
+        batched = fetch_upcoming_subjects_by_user(user_ids, session, batch_size=2)
+
+        assert batched
+        for user_id in user_ids:
+            assert batched.get(user_id, []) == fetch_user_upcoming_subjects(
+                session, user_id
+            )
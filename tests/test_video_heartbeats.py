@@ -0,0 +1,145 @@
+from sqlmodel import Session
+
+from app.db import heartbeats
+from app.db.heartbeats import heartbeat_buffer
+from app.db.models.common import UserContent
+from app.db.models.courses import Contents
+from tests.conftest import build_client
+from tests.test_progress_rollups import rebuilt, rollups
+from tests.utils import auth_headers, measured_request
+
+
+HEARTBEAT = "/common/user-content/heartbeat/"
+
+
+def heartbeat(content_id, position, elapsed, duration=100):
+    return {
+        "content_id": content_id,
+        "position_seconds": position,
+        "duration_seconds": duration,
+        "elapsed_seconds": elapsed,
+    }
+
+
+def beat(client, database, content_id, position, elapsed, duration=100):
+    return client.post(
+        HEARTBEAT,
+        headers=auth_headers(database.ids["student"]),
+        json=heartbeat(content_id, position, elapsed, duration),
+    )
+
+
+def user_content(database, content_id):
+    with Session(database.engine) as session:
+        return session.get(UserContent, (database.ids["student_id"], content_id))
+
+
+def test_heartbeats_are_buffered_and_coalesced(fresh_client, fresh_database):
+    video = fresh_database.ids["next_content_id"]
+    headers = auth_headers(fresh_database.ids["student"])
+    response = fresh_client.post(
+        HEARTBEAT, headers=headers, json=heartbeat(video, 5, 5)
+    )
+    assert response.status_code == 202
+
+    response, queries, _ = measured_request(
+        fresh_client, "POST", HEARTBEAT, headers=headers, json=heartbeat(video, 10, 5)
+    )
+    assert response.status_code == 202
+    assert queries == 0
+    beat(fresh_client, fresh_database, video, 42, 900)
+    assert user_content(fresh_database, video) is None
+
+    assert heartbeat_buffer.flush() == 1
+
+    row = user_content(fresh_database, video)
+    assert (row.position_seconds, row.watched_seconds) == (42, 40)
+    assert row.status.value == "IN_PROGRESS"
+
+
+def test_watching_past_the_threshold_completes_the_content(
+    fresh_client, fresh_database
+):
+    ids = fresh_database.ids
+    video, *texts = range(ids["next_content_id"], ids["next_content_id"] + 3)
+    for text in texts:
+        fresh_client.post(
+            "/common/user-content/sync/",
+            headers=auth_headers(ids["student"]),
+            json={
+                "events": [
+                    {
+                        "content_id": text,
+                        "action": "COMPLETE",
+                        "occurred_at": "2026-01-01T09:00:00",
+                    }
+                ]
+            },
+        )
+    for position in range(30, 100, 30):
+        beat(fresh_client, fresh_database, video, position, 30)
+    heartbeat_buffer.flush()
+
+    assert user_content(fresh_database, video).status.value == "COMPLETED"
+    assert heartbeat_buffer.stats()["completed"] >= 1
+    assert rollups(fresh_database) == rebuilt(fresh_database)
+
+
+def test_later_durations_do_not_change_completion(fresh_client, fresh_database):
+    video = fresh_database.ids["next_content_id"]
+    beat(fresh_client, fresh_database, video, 10, 10)
+    beat(fresh_client, fresh_database, video, 20, 10, duration=1)
+    heartbeat_buffer.flush()
+    beat(fresh_client, fresh_database, video, 30, 10, duration=1)
+    heartbeat_buffer.flush()
+
+    row = user_content(fresh_database, video)
+    assert (row.watched_seconds, row.duration_seconds) == (30, 100)
+    assert row.status.value == "IN_PROGRESS"
+
+
+def test_stored_duration_overrides_the_reported_one(fresh_client, fresh_database):
+    video = fresh_database.ids["next_content_id"]
+    with Session(fresh_database.engine) as session:
+        session.get(Contents, video).duration_seconds = 1000
+        session.commit()
+
+    for position in range(30, 100, 30):
+        beat(fresh_client, fresh_database, video, position, 30)
+    heartbeat_buffer.flush()
+
+    assert user_content(fresh_database, video).status.value == "IN_PROGRESS"
+
+
+def test_heartbeats_for_other_content_types_are_skipped(fresh_client, fresh_database):
+    text = fresh_database.ids["next_content_id"] + 1
+    beat(fresh_client, fresh_database, text, 10, 10)
+
+    heartbeat_buffer.flush()
+
+    assert user_content(fresh_database, text) is None
+
+
+def test_failed_flush_keeps_the_progress(fresh_client, fresh_database, monkeypatch):
+    video = fresh_database.ids["next_content_id"]
+    beat(fresh_client, fresh_database, video, 10, 10)
+
+    def fail(*args):
+        raise RuntimeError("database is down")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(heartbeats, "user_content_playback_flush", fail)
+        assert heartbeat_buffer.flush() == 0
+    beat(fresh_client, fresh_database, video, 20, 10)
+    heartbeat_buffer.flush()
+
+    row = user_content(fresh_database, video)
+    assert (row.position_seconds, row.watched_seconds) == (20, 20)
+
+
+def test_shutdown_flushes_the_buffer(fresh_database, monkeypatch):
+    video = fresh_database.ids["next_content_id"]
+    with build_client(fresh_database, monkeypatch) as client:
+        beat(client, fresh_database, video, 15, 15)
+
+    assert user_content(fresh_database, video).position_seconds == 15
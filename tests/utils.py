@@ -0,0 +1,62 @@
+import os
+import sqlite3
+
+from threading import Lock
+
+from fastapi.testclient import TestClient
+
+from app.services.auth.core import create_tokens
+from app.services.middleware.profiling import PROFILE_HEADER
+
+
+class RowCounter:
+    def __init__(self):
+        self.rows = 0
+        self._lock = Lock()
+
+    def add(self, rows: int):
+        with self._lock:
+            self.rows += rows
+
+    def reset(self):
+        with self._lock:
+            self.rows = 0
+
+
+rows_fetched = RowCounter()
+
+
+class RowCountingCursor(sqlite3.Cursor):
+    def fetchone(self):
+        row = super().fetchone()
+        rows_fetched.add(row is not None)
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = super().fetchmany(*args, **kwargs)
+        rows_fetched.add(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = super().fetchall()
+        rows_fetched.add(len(rows))
+        return rows
+
+
+class RowCountingConnection(sqlite3.Connection):
+    def cursor(self, factory=RowCountingCursor):
+        return super().cursor(factory)
+
+
+def auth_headers(username: str) -> dict:
+    access_token, _ = create_tokens({"sub": username})
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+def measured_request(client: TestClient, method: str, url: str, **kwargs):
+    """Send a profiled request; return the response, statements and rows."""
+    headers = {PROFILE_HEADER: os.environ["QUERY_PROFILER_TOKEN"]}
+    headers |= kwargs.pop("headers", {})
+    rows_fetched.reset()
+    response = client.request(method, url, headers=headers, **kwargs)
+    return response, int(response.headers["X-Query-Count"]), rows_fetched.rows